@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+
+from app.domain.enums import AudioFormat
+
+MEDIA_TYPES = {
+    AudioFormat.WAV: "audio/wav",
+    AudioFormat.OPUS: "audio/ogg",
+    AudioFormat.MP3: "audio/mpeg",
+}
+_ACCEPTED_MEDIA_TYPES = {
+    "audio/wav": AudioFormat.WAV,
+    "audio/wave": AudioFormat.WAV,
+    "audio/x-wav": AudioFormat.WAV,
+    "audio/vnd.wave": AudioFormat.WAV,
+    "audio/ogg": AudioFormat.OPUS,
+    "audio/opus": AudioFormat.OPUS,
+    "application/ogg": AudioFormat.OPUS,
+    "audio/mpeg": AudioFormat.MP3,
+    "audio/mp3": AudioFormat.MP3,
+}
+# Smallest first, for clients that accept several formats equally.
+_SIZE_ORDER = (AudioFormat.OPUS, AudioFormat.MP3, AudioFormat.WAV)
+
+
+def negotiate_audio_format(accept: str | None, default: AudioFormat) -> AudioFormat | None:
+    """Pick the download format from an ``Accept`` header; ``None`` if none is acceptable.
+
+    Explicit media types outrank ``audio/*``, which outranks ``*/*``. Among
+    equally preferred formats ``default`` wins, then the smallest encoding.
+    """
+
+    if not accept or not accept.strip():
+        return default
+
+    explicit: dict[AudioFormat, float] = {}
+    wildcards: dict[str, float] = {}
+    for item in accept.split(","):
+        media_type, _, params = item.partition(";")
+        media_type = media_type.strip().lower()
+        quality = _quality(params)
+        if media_type in ("audio/*", "*/*"):
+            wildcards[media_type] = max(quality, wildcards.get(media_type, 0.0))
+        elif media_type in _ACCEPTED_MEDIA_TYPES:
+            audio_format = _ACCEPTED_MEDIA_TYPES[media_type]
+            explicit[audio_format] = max(quality, explicit.get(audio_format, 0.0))
+
+    def quality_of(audio_format: AudioFormat) -> float:
+        if audio_format in explicit:
+            return explicit[audio_format]
+        return wildcards.get("audio/*", wildcards.get("*/*", 0.0))
+
+    candidates = (default, *(option for option in _SIZE_ORDER if option != default))
+    best = max(candidates, key=quality_of)
+    return best if quality_of(best) > 0 else None
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str, last_modified: float) -> bool:
+    """Evaluate ``If-None-Match`` (preferred) or ``If-Modified-Since`` for a 304."""
+
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) <= since.timestamp()
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return min(1.0, max(0.0, float(value)))
+            except ValueError:
+                return 0.0
+    return 1.0
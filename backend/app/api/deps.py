@@ -4,7 +4,7 @@ from typing import cast
 
 from fastapi import Request
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings
 from app.core.container import ServiceContainer
 
 
@@ -15,5 +15,5 @@ def get_container(request: Request) -> ServiceContainer:
     return cast(ServiceContainer, container)
 
 
-def get_settings_dependency() -> Settings:
-    return get_settings()
+def get_settings_dependency(request: Request) -> Settings:
+    return get_container(request).settings
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.api.routes.health import router as health_router
+from app.api.routes.jobs import router as jobs_router
+from app.api.routes.metrics import router as metrics_router
+from app.core.container import ServiceContainer
+
+logger = logging.getLogger(__name__)
+
+JOB_PRUNE_INTERVAL_SECONDS = 3600
+
+
+async def run_periodically(
+    action: Callable[[], object], interval: float, *, delay_first: bool = False
+) -> None:
+    """Run a blocking ``action`` off the event loop every ``interval`` seconds.
+
+    A failing iteration is logged and the loop carries on, so one transient
+    error cannot silently stop the background task for the process lifetime.
+    """
+
+    if delay_first:
+        await asyncio.sleep(interval)
+    while True:
+        try:
+            await asyncio.to_thread(action)
+        except Exception:
+            logger.exception("Periodic task %s failed", getattr(action, "__name__", action))
+        await asyncio.sleep(interval)
+
+
+def create_app(container: ServiceContainer) -> FastAPI:
+    """Build the API application around an already assembled service container."""
+
+    settings = container.settings
+
+    retention = timedelta(hours=settings.job_retention_hours)
+
+    def renew_job_lease() -> None:
+        # Renew this process's lease often enough that live jobs are never
+        # reclaimed, and take over jobs of processes that stopped renewing.
+        container.jobs.heartbeat()
+        container.requeue_unfinished_jobs()
+
+    def prune_finished_jobs() -> None:
+        container.orchestrator.prune_finished(retention)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        container.start()
+        warm_up = None
+        if settings.preload_models:
+            warm_up = asyncio.create_task(asyncio.to_thread(container.readiness.warm_up))
+        background = (
+            asyncio.create_task(run_periodically(prune_finished_jobs, JOB_PRUNE_INTERVAL_SECONDS)),
+            asyncio.create_task(
+                run_periodically(renew_job_lease, settings.job_lease_seconds / 4, delay_first=True)
+            ),
+        )
+        try:
+            yield
+        finally:
+            for task in background:
+                task.cancel()
+            for task in background:
+                with suppress(asyncio.CancelledError):
+                    await task
+            container.shutdown()
+            if warm_up is not None and not warm_up.done():
+                warm_up.cancel()
+
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    app.state.container = container
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=list(settings.cors_origins),
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(health_router)
+    app.include_router(metrics_router)
+    app.include_router(jobs_router, prefix=settings.api_prefix)
+    return app
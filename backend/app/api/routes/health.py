@@ -1,10 +1,29 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.api.deps import get_container
+from app.core.container import ServiceContainer
+from app.domain.enums import ReadinessStatus
 
 router = APIRouter(tags=["health"])
+CONTAINER_DEPENDENCY = Depends(get_container)
 
 
 @router.get("/health")
+@router.get("/health/live")
 def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def readiness(container: ServiceContainer = CONTAINER_DEPENDENCY) -> JSONResponse:
+    status = container.readiness.status
+    payload: dict[str, str | None] = {"status": status.value}
+    if status == ReadinessStatus.FAILED:
+        payload["error"] = container.readiness.error
+    return JSONResponse(
+        status_code=200 if status == ReadinessStatus.READY else 503,
+        content=payload,
+    )
@@ -1,21 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import os
+import wave
+from collections.abc import AsyncIterator
+from email.utils import formatdate
+from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
+from app.api.audio_formats import MEDIA_TYPES, is_not_modified, negotiate_audio_format
 from app.api.deps import get_container, get_settings_dependency
 from app.api.schemas.jobs import (
     CreateJobForm,
     GenreListResponse,
     JobCreateResponse,
+    JobListItemResponse,
+    JobListResponse,
     JobStatusResponse,
+    ResynthesizeRequest,
+    TranscriptProgressResponse,
 )
+from app.api.sse import SSE_HEADERS, format_event
+from app.application.chunked_synthesis import chunk_path
 from app.core.config import Settings
 from app.core.container import ServiceContainer
-from app.domain.enums import Genre, JobStatus
-from app.domain.models import JobPreferences
+from app.domain.enums import AudioFormat, Genre, JobStatus
+from app.domain.models import JobCursor, JobPreferences, JobRecord
+from app.infrastructure.audio.processing import (
+    encode_audio,
+    silence_bytes,
+    streaming_wav_header,
+)
+from app.infrastructure.jobs.manager import JobManager, JobNotFoundError, JobStateError
+from app.infrastructure.jobs.notifications import JobSubscription
+from app.infrastructure.jobs.scheduler import JobQueueFullError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 TARGET_MINUTES_FORM = Form(...)
@@ -23,6 +48,18 @@ GENRE_FORM = Form(...)
 AUDIO_FILE_FORM = File(...)
 CONTAINER_DEPENDENCY = Depends(get_container)
 SETTINGS_DEPENDENCY = Depends(get_settings_dependency)
+OFFSET_QUERY = Query(default=0, ge=0)
+LIMIT_QUERY = Query(default=50, ge=1, le=500)
+WAIT_QUERY = Query(default=0, ge=0, le=60)
+SINCE_VERSION_QUERY = Query(default=None, ge=-1)
+FORMAT_QUERY = Query(default=None, alias="format")
+EVENT_KEEPALIVE_SECONDS = 15.0
+# Notifications are process-local; waiters also poll the store this often so a
+# job advanced by another process sharing the store is noticed promptly.
+JOB_STORE_POLL_SECONDS = 1.0
+AUDIO_STREAM_RESYNC_SECONDS = 2.0
+FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+AUDIO_STREAM_BLOCK_FRAMES = 64 * 1024
 
 
 @router.get("/genres", response_model=GenreListResponse)
@@ -36,7 +73,12 @@ def validate_form(
     settings: Settings = SETTINGS_DEPENDENCY,
 ) -> CreateJobForm:
     form = CreateJobForm(target_minutes=target_minutes, genre=genre)
-    if not settings.min_target_minutes <= form.target_minutes <= settings.max_target_minutes:
+    _validate_target_minutes(form.target_minutes, settings)
+    return form
+
+
+def _validate_target_minutes(target_minutes: int, settings: Settings) -> None:
+    if not settings.min_target_minutes <= target_minutes <= settings.max_target_minutes:
         raise HTTPException(
             status_code=422,
             detail=(
@@ -44,7 +86,6 @@ def validate_form(
                 f"{settings.max_target_minutes}"
             ),
         )
-    return form
 
 
 FORM_DEPENDENCY = Depends(validate_form)
@@ -52,13 +93,15 @@ FORM_DEPENDENCY = Depends(validate_form)
 
 @router.post("", response_model=JobCreateResponse, status_code=202)
 async def create_job(
-    background_tasks: BackgroundTasks,
     form: CreateJobForm = FORM_DEPENDENCY,
     audio_file: UploadFile = AUDIO_FILE_FORM,
     container: ServiceContainer = CONTAINER_DEPENDENCY,
 ) -> JobCreateResponse:
+    if container.scheduler.is_full:
+        raise HTTPException(status_code=429, detail="Job queue is full, retry later")
+
     try:
-        audio_input_path = await container.storage.save_uploaded_audio(audio_file)
+        upload = await container.storage.save_uploaded_audio(audio_file)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -67,36 +110,276 @@ async def create_job(
         genre=form.genre,
     )
     job = container.jobs.create_job(
-        audio_input_path=audio_input_path,
+        audio_input_path=upload.path,
         preferences=preferences,
+        audio_sha256=upload.sha256,
     )
 
-    background_tasks.add_task(container.orchestrator.process_job, job.id)
+    _submit(container, job)
+    return JobCreateResponse(job_id=job.id, status=job.status)
 
+
+@router.post("/{job_id}/retry", response_model=JobCreateResponse, status_code=202)
+def retry_job(
+    job_id: UUID,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> JobCreateResponse:
+    """Run a failed job again, reusing the outputs of the stages that had completed."""
+
+    if container.scheduler.is_full:
+        raise HTTPException(status_code=429, detail="Job queue is full, retry later")
+    try:
+        job = container.orchestrator.retry(job_id)
+    except JobNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Job not found") from exc
+    except JobStateError as exc:
+        raise HTTPException(
+            status_code=409, detail=f"Only failed jobs can be retried: {exc}"
+        ) from exc
+
+    _submit(container, job)
+    return JobCreateResponse(job_id=job.id, status=job.status)
+
+
+@router.post("/{job_id}/resynthesize", response_model=JobCreateResponse, status_code=202)
+def resynthesize_job(
+    job_id: UUID,
+    request: ResynthesizeRequest,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+    settings: Settings = SETTINGS_DEPENDENCY,
+) -> JobCreateResponse:
+    """Render a finished job's summary again, rewriting it only if the preferences changed."""
+
+    current = container.jobs.get_job(job_id)
+    if current is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    preferences = current.preferences.model_copy(update=request.model_dump(exclude_none=True))
+    _validate_target_minutes(preferences.target_minutes, settings)
+    if container.scheduler.is_full:
+        raise HTTPException(status_code=429, detail="Job queue is full, retry later")
+    try:
+        job = container.orchestrator.resynthesize(job_id, preferences)
+    except JobNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Job not found") from exc
+    except JobStateError as exc:
+        raise HTTPException(
+            status_code=409, detail=f"Only finished jobs can be resynthesized: {exc}"
+        ) from exc
+
+    _submit(container, job)
     return JobCreateResponse(job_id=job.id, status=job.status)
 
 
+def _submit(container: ServiceContainer, job: JobRecord) -> None:
+    try:
+        container.scheduler.submit(job.id)
+    except JobQueueFullError as exc:
+        container.jobs.mark_failed(job.id, str(exc))
+        raise HTTPException(status_code=429, detail="Job queue is full, retry later") from exc
+
+
+@router.get("", response_model=JobListResponse)
+def list_jobs(
+    status: JobStatus | None = None,
+    genre: Genre | None = None,
+    limit: int = LIMIT_QUERY,
+    cursor: str | None = None,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> JobListResponse:
+    try:
+        after = None if cursor is None else JobCursor.decode(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    page, next_cursor = container.jobs.list_job_summaries(
+        limit=limit, status=status, genre=genre, after=after
+    )
+    return JobListResponse(
+        items=[JobListItemResponse.from_summary(job) for job in page],
+        next_cursor=None if next_cursor is None else next_cursor.encode(),
+    )
+
+
 @router.get("/{job_id}", response_model=JobStatusResponse)
-def get_job_status(
+async def get_job_status(
     job_id: UUID,
+    wait: float = WAIT_QUERY,
+    since_version: int | None = SINCE_VERSION_QUERY,
     container: ServiceContainer = CONTAINER_DEPENDENCY,
 ) -> JobStatusResponse:
-    job = container.jobs.get_job(job_id)
+    """Current job status; with ``wait`` and ``since_version`` this is a long poll.
+
+    The request returns as soon as the job moves past ``since_version`` or after
+    ``wait`` seconds, whichever comes first. Job store and scheduler reads take
+    locks (and may hit SQLite), so they run in worker threads.
+    """
+
+    job = await asyncio.to_thread(container.jobs.get_job, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    if wait > 0 and since_version is not None and job.version <= since_version:
+        job = await _wait_for_version(container.jobs, job, since_version, wait)
+    return await asyncio.to_thread(_status_response, container, job)
+
+
+@router.get("/{job_id}/events")
+def stream_job_status(
+    job_id: UUID,
+    since_version: int = -1,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> StreamingResponse:
+    if container.jobs.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _status_events(container, job_id, since_version),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+async def _wait_for_version(
+    jobs: JobManager, job: JobRecord, since_version: int, wait: float
+) -> JobRecord:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    with jobs.subscribe(job.id) as subscription:
+        # Re-read after subscribing so a change made in between is not missed.
+        latest = await asyncio.to_thread(jobs.get_job, job.id)
+        while latest is not None and latest.version <= since_version:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await _wait_for_change(jobs, subscription, latest, remaining)
+            latest = await asyncio.to_thread(jobs.get_job, job.id)
+    return job if latest is None else latest
+
+
+async def _wait_for_change(
+    jobs: JobManager, subscription: JobSubscription, job: JobRecord, seconds: float
+) -> bool:
+    """Wait up to ``seconds`` for ``job`` to move past its version.
+
+    Wakes on this process's notifications, and polls the stored version between
+    them so changes written by other processes are not missed.
+    """
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    while (remaining := deadline - loop.time()) > 0:
+        if await subscription.wait(min(remaining, JOB_STORE_POLL_SECONDS)):
+            return True
+        version = await asyncio.to_thread(jobs.get_version, job.id)
+        if version is None or version > job.version:
+            return True
+    return False
+
+
+async def _status_events(
+    container: ServiceContainer, job_id: UUID, since_version: int
+) -> AsyncIterator[str]:
+    with container.jobs.subscribe(job_id) as subscription:
+        sent_version = since_version
+        while True:
+            job = await asyncio.to_thread(container.jobs.get_job, job_id)
+            if job is None:
+                return
+            if job.version > sent_version:
+                sent_version = job.version
+                response = await asyncio.to_thread(_status_response, container, job)
+                yield format_event("status", response.model_dump(mode="json"))
+            if job.status in FINISHED_STATUSES:
+                return
+            if not await _wait_for_change(
+                container.jobs, subscription, job, EVENT_KEEPALIVE_SECONDS
+            ):
+                yield ": keepalive\n\n"
 
+
+def _status_response(container: ServiceContainer, job: JobRecord) -> JobStatusResponse:
     audio_url: str | None = None
     if job.status == JobStatus.COMPLETED and job.output_audio_path is not None:
         audio_url = f"{container.settings.api_prefix}/jobs/{job.id}/audio"
 
-    return JobStatusResponse.from_job(job=job, audio_url=audio_url)
+    audio_stream_url: str | None = None
+    if job.status == JobStatus.RUNNING and job.synthesis_chunks_ready > 0:
+        audio_stream_url = f"{container.settings.api_prefix}/jobs/{job.id}/audio/stream"
+
+    queue_position = None
+    if job.status == JobStatus.PENDING:
+        queue_position = container.scheduler.position(job.id)
+
+    return JobStatusResponse.from_job(
+        job=job,
+        audio_url=audio_url,
+        audio_stream_url=audio_stream_url,
+        queue_position=queue_position,
+    )
+
+
+@router.get("/{job_id}/transcript", response_model=TranscriptProgressResponse)
+def get_transcript_progress(
+    job_id: UUID,
+    offset: int = OFFSET_QUERY,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> TranscriptProgressResponse:
+    job = container.jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return TranscriptProgressResponse.from_job(job=job, offset=offset)
+
+
+@router.get("/{job_id}/transcript/events")
+def stream_transcript(
+    job_id: UUID,
+    offset: int = OFFSET_QUERY,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> StreamingResponse:
+    if container.jobs.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _transcript_events(container.jobs, job_id, offset),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+async def _transcript_events(jobs: JobManager, job_id: UUID, offset: int) -> AsyncIterator[str]:
+    with jobs.subscribe(job_id) as subscription:
+        sent = offset
+        while True:
+            job = await asyncio.to_thread(jobs.get_job, job_id)
+            if job is None:
+                return
+
+            for index, segment in enumerate(job.transcript_segments[sent:], start=sent):
+                payload = {"index": index, "progress": job.transcription_progress}
+                yield format_event("segment", payload | segment.model_dump())
+            sent = max(sent, len(job.transcript_segments))
+
+            if job.transcription_progress == 100 or job.status in FINISHED_STATUSES:
+                yield format_event(
+                    "done", {"status": job.status, "progress": job.transcription_progress}
+                )
+                return
+            if not await _wait_for_change(jobs, subscription, job, EVENT_KEEPALIVE_SECONDS):
+                yield ": keepalive\n\n"
 
 
 @router.get("/{job_id}/audio")
 def download_audio(
     job_id: UUID,
+    request: Request,
+    audio_format: AudioFormat | None = FORMAT_QUERY,
     container: ServiceContainer = CONTAINER_DEPENDENCY,
-) -> FileResponse:
+) -> Response:
+    """Summary audio as WAV, Opus or MP3, chosen by ``?format=`` or the ``Accept`` header.
+
+    Compressed formats are encoded on first request and cached next to the WAV.
+    Responses carry ETag/Last-Modified for conditional requests and honour
+    ``Range`` so players can seek. Validators come from the source WAV, so a
+    revalidation is answered before any encode runs.
+    """
+
     job = container.jobs.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -105,8 +388,150 @@ def download_audio(
     if not job.output_audio_path.exists():
         raise HTTPException(status_code=404, detail="Audio file not found")
 
+    settings = container.settings
+    requested = audio_format or negotiate_audio_format(
+        request.headers.get("accept"), settings.audio_download_default_format
+    )
+    if requested is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Available formats: {', '.join(MEDIA_TYPES.values())}",
+        )
+
+    source = os.stat(job.output_audio_path)
+    headers = _audio_validators(requested, source)
+    if is_not_modified(request.headers, headers["ETag"], source.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    served, path = AudioFormat.WAV, job.output_audio_path
+    if requested != AudioFormat.WAV:
+        try:
+            path = _encoded_audio(container, job.id, job.output_audio_path, requested)
+            served = requested
+        except RuntimeError as exc:
+            if audio_format is not None:
+                raise HTTPException(status_code=503, detail=str(exc)) from exc
+            logger.warning("Serving WAV for job %s: %s", job.id, exc)
+            headers = _audio_validators(served, source)
+
+    stat_result = os.stat(path)
     return FileResponse(
-        path=job.output_audio_path,
-        media_type="audio/wav",
-        filename=f"summary-{job.id}.wav",
+        path=path,
+        media_type=MEDIA_TYPES[served],
+        filename=f"summary-{job.id}.{served}",
+        headers=headers,
+        stat_result=stat_result,
     )
+
+
+def _audio_validators(audio_format: AudioFormat, source: os.stat_result) -> dict[str, str]:
+    """Cache headers for ``audio_format`` derived from the source WAV it is encoded from."""
+
+    etag_base = f"{audio_format}-{source.st_mtime_ns}-{source.st_size}"
+    return {
+        "ETag": f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"',
+        "Last-Modified": formatdate(source.st_mtime, usegmt=True),
+        # Re-rendering replaces the audio behind the same URL, so always revalidate.
+        "Cache-Control": "no-cache",
+        "Vary": "Accept",
+    }
+
+
+def _encoded_audio(
+    container: ServiceContainer, job_id: UUID, wav_path: Path, audio_format: AudioFormat
+) -> Path:
+    settings = container.settings
+    bitrate_kbps = (
+        settings.audio_opus_bitrate_kbps
+        if audio_format == AudioFormat.OPUS
+        else settings.audio_mp3_bitrate_kbps
+    )
+    return encode_audio(
+        source_path=wav_path,
+        destination_path=container.storage.build_encoded_audio_path(job_id, audio_format),
+        codec=audio_format,
+        bitrate_kbps=bitrate_kbps,
+    )
+
+
+@router.get("/{job_id}/audio/stream")
+def stream_audio(
+    job_id: UUID,
+    container: ServiceContainer = CONTAINER_DEPENDENCY,
+) -> StreamingResponse:
+    job = container.jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=409, detail="Job failed")
+
+    return StreamingResponse(_audio_chunks(container, job_id), media_type="audio/wav")
+
+
+async def _audio_chunks(container: ServiceContainer, job_id: UUID) -> AsyncIterator[bytes]:
+    """Stream synthesized chunks as they land, then the rest of the final WAV.
+
+    The final WAV is the chunks joined with the same gaps, so once the job completes
+    the stream continues from the matching byte offset of that file. Job reads and
+    file I/O run in worker threads so slow disks never stall the event loop.
+    """
+
+    chunk_dir = container.storage.build_audio_chunks_dir(job_id)
+    output_path = container.storage.build_output_audio_path(job_id)
+    gap_ms = container.settings.tts_chunk_gap_ms
+    header_sent = False
+    sent_bytes = 0
+    next_chunk = 0
+
+    with container.jobs.subscribe(job_id) as subscription:
+        while True:
+            job = await asyncio.to_thread(container.jobs.get_job, job_id)
+            if job is None or job.status == JobStatus.FAILED:
+                return
+
+            if job.status == JobStatus.COMPLETED and await asyncio.to_thread(output_path.exists):
+                reader = await asyncio.to_thread(_open_wav, output_path)
+                try:
+                    params = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+                    if not header_sent:
+                        yield streaming_wav_header(*params)
+                    reader.setpos(min(sent_bytes // (params[0] * params[1]), reader.getnframes()))
+                    while frames := await asyncio.to_thread(
+                        reader.readframes, AUDIO_STREAM_BLOCK_FRAMES
+                    ):
+                        yield frames
+                finally:
+                    reader.close()
+                return
+
+            chunk = None
+            if next_chunk < job.synthesis_chunks_ready:
+                chunk = await asyncio.to_thread(_read_chunk, chunk_path(chunk_dir, next_chunk))
+            if chunk is not None:
+                params, frames = chunk
+                if not header_sent:
+                    yield streaming_wav_header(*params)
+                    header_sent = True
+                if next_chunk > 0:
+                    gap = silence_bytes(*params, gap_ms=gap_ms)
+                    sent_bytes += len(gap)
+                    yield gap
+                sent_bytes += len(frames)
+                yield frames
+                next_chunk += 1
+                continue
+
+            await subscription.wait(AUDIO_STREAM_RESYNC_SECONDS)
+
+
+def _open_wav(path: Path) -> wave.Wave_read:
+    return wave.open(str(path), "rb")
+
+
+def _read_chunk(path: Path) -> tuple[tuple[int, int, int], bytes] | None:
+    try:
+        with wave.open(str(path), "rb") as reader:
+            params = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+            return params, reader.readframes(reader.getnframes())
+    except FileNotFoundError:
+        return None
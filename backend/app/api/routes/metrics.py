@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from app.api.deps import get_container
+from app.core.container import ServiceContainer
+from app.infrastructure.metrics.prometheus import PENDING_JOBS
+
+router = APIRouter(tags=["metrics"])
+CONTAINER_DEPENDENCY = Depends(get_container)
+
+
+@router.get("/metrics")
+def metrics(container: ServiceContainer = CONTAINER_DEPENDENCY) -> Response:
+    PENDING_JOBS.set(container.scheduler.pending_count)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -6,7 +6,13 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from app.domain.enums import Genre, JobStatus
-from app.domain.models import JobRecord
+from app.domain.models import (
+    JobRecord,
+    JobSummary,
+    QueuePosition,
+    StageTiming,
+    TranscriptSegment,
+)
 
 
 class JobCreateResponse(BaseModel):
@@ -14,8 +20,27 @@ class JobCreateResponse(BaseModel):
     status: JobStatus
 
 
+class JobTimingsResponse(BaseModel):
+    queue_wait_seconds: float | None = None
+    processing_seconds: float | None = None
+    audio_duration_seconds: float | None = None
+    real_time_factor: float | None = None
+    stages: list[StageTiming] = Field(default_factory=list)
+
+    @classmethod
+    def from_job(cls, job: JobRecord) -> JobTimingsResponse:
+        return cls(
+            queue_wait_seconds=job.queue_wait_seconds,
+            processing_seconds=job.processing_seconds,
+            audio_duration_seconds=job.audio_duration_seconds,
+            real_time_factor=job.real_time_factor,
+            stages=list(job.stage_timings),
+        )
+
+
 class JobStatusResponse(BaseModel):
     job_id: UUID
+    version: int
     status: JobStatus
     created_at: datetime
     updated_at: datetime
@@ -24,11 +49,25 @@ class JobStatusResponse(BaseModel):
     summary_text: str | None = None
     error_message: str | None = None
     audio_url: str | None = None
+    transcription_progress: float | None = None
+    synthesis_chunks_ready: int = 0
+    synthesis_chunks_total: int | None = None
+    audio_stream_url: str | None = None
+    queue_position: int | None = None
+    estimated_start_seconds: float | None = None
+    timings: JobTimingsResponse
 
     @classmethod
-    def from_job(cls, job: JobRecord, audio_url: str | None = None) -> JobStatusResponse:
+    def from_job(
+        cls,
+        job: JobRecord,
+        audio_url: str | None = None,
+        audio_stream_url: str | None = None,
+        queue_position: QueuePosition | None = None,
+    ) -> JobStatusResponse:
         return cls(
             job_id=job.id,
+            version=job.version,
             status=job.status,
             created_at=job.created_at,
             updated_at=job.updated_at,
@@ -37,6 +76,68 @@ class JobStatusResponse(BaseModel):
             summary_text=job.summary_text,
             error_message=job.error_message,
             audio_url=audio_url,
+            transcription_progress=job.transcription_progress,
+            synthesis_chunks_ready=job.synthesis_chunks_ready,
+            synthesis_chunks_total=job.synthesis_chunks_total,
+            audio_stream_url=audio_stream_url,
+            queue_position=None if queue_position is None else queue_position.position,
+            estimated_start_seconds=(
+                None if queue_position is None else queue_position.estimated_start_seconds
+            ),
+            timings=JobTimingsResponse.from_job(job),
+        )
+
+
+class JobListItemResponse(BaseModel):
+    job_id: UUID
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    genre: Genre
+    target_minutes: int
+    error_message: str | None = None
+    transcription_progress: float | None = None
+    synthesis_chunks_ready: int = 0
+    synthesis_chunks_total: int | None = None
+
+    @classmethod
+    def from_summary(cls, job: JobSummary) -> JobListItemResponse:
+        return cls(
+            job_id=job.id,
+            status=job.status,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            genre=job.preferences.genre,
+            target_minutes=job.preferences.target_minutes,
+            error_message=job.error_message,
+            transcription_progress=job.transcription_progress,
+            synthesis_chunks_ready=job.synthesis_chunks_ready,
+            synthesis_chunks_total=job.synthesis_chunks_total,
+        )
+
+
+class JobListResponse(BaseModel):
+    items: list[JobListItemResponse]
+    next_cursor: str | None = None
+
+
+class TranscriptProgressResponse(BaseModel):
+    job_id: UUID
+    status: JobStatus
+    progress: float | None = None
+    partial_text: str
+    segments: list[TranscriptSegment]
+    next_offset: int
+
+    @classmethod
+    def from_job(cls, job: JobRecord, offset: int = 0) -> TranscriptProgressResponse:
+        return cls(
+            job_id=job.id,
+            status=job.status,
+            progress=job.transcription_progress,
+            partial_text=" ".join(segment.text for segment in job.transcript_segments),
+            segments=list(job.transcript_segments[offset:]),
+            next_offset=len(job.transcript_segments),
         )
 
 
@@ -44,6 +145,13 @@ class GenreListResponse(BaseModel):
     genres: list[Genre]
 
 
+class ResynthesizeRequest(BaseModel):
+    """New preferences for a re-render; omitted fields keep the job's current values."""
+
+    target_minutes: int | None = Field(default=None, ge=1, le=120)
+    genre: Genre | None = None
+
+
 class CreateJobForm(BaseModel):
     target_minutes: int = Field(ge=1, le=120)
     genre: Genre
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import json
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_event(event: str, data: object) -> str:
+    """Render one Server-Sent Events frame with a JSON payload."""
+
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
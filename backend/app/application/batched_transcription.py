@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import wave
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Condition
+
+from app.application.ports import BatchTranscriptionService, SegmentCallback
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import is_normalized_pcm
+
+
+@dataclass(slots=True)
+class _BatchRequest:
+    audio_path: Path
+    language: str
+    future: Future[list[TranscriptSegment]] = field(default_factory=Future)
+
+
+class MicroBatchingTranscriber:
+    """Group short transcription requests from concurrent jobs into batched passes.
+
+    The first request to arrive waits up to ``window_seconds`` for others (or
+    until ``max_files`` are queued) and then runs the whole group through the
+    backend's batched pipeline; that wait is the latency cost per job. Files
+    longer than ``max_seconds`` or not in normalized PCM form are transcribed on
+    their own, keeping live per-segment progress.
+    """
+
+    def __init__(
+        self,
+        backend: BatchTranscriptionService,
+        window_seconds: float,
+        max_files: int,
+        max_seconds: float,
+    ) -> None:
+        self._backend = backend
+        self._window_seconds = window_seconds
+        self._max_files = max(1, max_files)
+        self._max_seconds = max_seconds
+        self._open_batch: list[_BatchRequest] | None = None
+        self._condition = Condition()
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: SegmentCallback | None = None,
+    ) -> str:
+        duration = _duration_seconds(audio_path)
+        if duration is None or duration > self._max_seconds:
+            return self._backend.transcribe(audio_path, language, on_segment)
+
+        request = _BatchRequest(audio_path=audio_path, language=language)
+        with self._condition:
+            batch = self._open_batch
+            leader = batch is None or len(batch) >= self._max_files
+            if batch is None or leader:
+                batch = []
+                self._open_batch = batch
+            batch.append(request)
+            if len(batch) >= self._max_files:
+                self._condition.notify_all()
+        if leader:
+            self._lead(batch)
+
+        segments = request.future.result()
+        if on_segment is not None:
+            for segment in segments:
+                on_segment(segment, min(100.0, segment.end / duration * 100) if duration else 0.0)
+        return " ".join(segment.text for segment in segments)
+
+    def _lead(self, batch: list[_BatchRequest]) -> None:
+        """Collect followers into ``batch`` for one window, then transcribe it.
+
+        Every request in the batch is resolved before this returns, even if the
+        leader fails part way, so followers never wait forever.
+        """
+
+        try:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(batch) >= self._max_files, timeout=self._window_seconds
+                )
+                if self._open_batch is batch:
+                    self._open_batch = None
+
+            by_language: dict[str, list[_BatchRequest]] = defaultdict(list)
+            for request in batch:
+                by_language[request.language].append(request)
+            for language, requests in by_language.items():
+                try:
+                    results = self._backend.transcribe_many(
+                        [request.audio_path for request in requests], language
+                    )
+                except Exception as exc:
+                    for request in requests:
+                        request.future.set_exception(exc)
+                    continue
+                for request, segments in zip(requests, results, strict=True):
+                    request.future.set_result(segments)
+        finally:
+            with self._condition:
+                if self._open_batch is batch:
+                    self._open_batch = None
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(
+                        RuntimeError("Batched transcription ended without a result")
+                    )
+
+    def warm_up(self) -> None:
+        self._backend.warm_up()
+
+
+def _duration_seconds(audio_path: Path) -> float | None:
+    if not is_normalized_pcm(audio_path):
+        return None
+    with wave.open(str(audio_path), "rb") as reader:
+        return reader.getnframes() / reader.getframerate()
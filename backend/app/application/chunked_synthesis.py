@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import re
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.application.ports import VoiceCloningService
+from app.infrastructure.audio.processing import concatenate_wavs
+
+ChunkCallback = Callable[[int, int, Path], None]
+"""Receives ``(index, total, path)`` for each chunk, in order, once it is rendered."""
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;:])\s+")
+_CLAUSE_BOUNDARY = re.compile(r"(?<=[,])\s+|\s+")
+
+
+def chunk_path(chunk_dir: Path, index: int) -> Path:
+    return chunk_dir / f"{index:04d}.wav"
+
+
+def split_sentences(text: str, max_chars: int) -> list[str]:
+    """Split text on sentence boundaries and pack sentences into chunks of max_chars."""
+
+    if max_chars < 1:
+        raise ValueError("max_chars must be >= 1")
+
+    pieces: list[str] = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        if len(sentence) <= max_chars:
+            if sentence:
+                pieces.append(sentence)
+            continue
+        pieces.extend(_pack(_CLAUSE_BOUNDARY.split(sentence), max_chars))
+    return _pack(pieces, max_chars)
+
+
+def _pack(parts: list[str], max_chars: int) -> list[str]:
+    chunks: list[str] = []
+    current = ""
+    for part in parts:
+        if not part:
+            continue
+        candidate = f"{current} {part}" if current else part
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+        while len(part) > max_chars:
+            chunks.append(part[:max_chars])
+            part = part[max_chars:]
+        current = part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ChunkedVoiceSynthesizer:
+    """Render text sentence-chunk by sentence-chunk and join the chunks into one WAV.
+
+    Chunks are dispatched to the backend concurrently (useful when the backend is a
+    pool of worker processes) and reported in order as soon as each is on disk, so
+    playback can begin long before the full summary has been rendered.
+    """
+
+    def __init__(
+        self,
+        backend: VoiceCloningService,
+        max_chars: int,
+        parallelism: int,
+        gap_ms: int,
+    ) -> None:
+        self._backend = backend
+        self._max_chars = max_chars
+        self._parallelism = max(1, parallelism)
+        self._gap_ms = gap_ms
+
+    @property
+    def gap_ms(self) -> int:
+        return self._gap_ms
+
+    def synthesize(
+        self,
+        text: str,
+        speaker_wav: Path,
+        language: str,
+        output_path: Path,
+        chunk_dir: Path,
+        on_chunk: ChunkCallback | None = None,
+    ) -> Path:
+        chunks = split_sentences(text, self._max_chars)
+        if not chunks:
+            raise ValueError("Summary text cannot be empty")
+
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        chunk_paths = [chunk_path(chunk_dir, index) for index in range(len(chunks))]
+        with ThreadPoolExecutor(
+            max_workers=self._parallelism, thread_name_prefix="tts-chunk"
+        ) as executor:
+            futures = [
+                executor.submit(self._backend.synthesize, chunk, speaker_wav, language, path)
+                for chunk, path in zip(chunks, chunk_paths, strict=True)
+            ]
+            try:
+                for index, future in enumerate(futures):
+                    rendered = future.result()
+                    if on_chunk is not None:
+                        on_chunk(index, len(chunks), rendered)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        concatenate_wavs(chunk_paths, output_path, gap_ms=self._gap_ms)
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        return output_path
+
+    def warm_up(self) -> None:
+        self._backend.warm_up()
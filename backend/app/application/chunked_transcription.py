@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import pairwise
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.application.ports import SegmentCallback, TranscriptionService
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import (
+    PCM_SAMPLE_RATE,
+    is_normalized_pcm,
+    open_pcm,
+    silence_cut_points,
+    write_pcm_wav,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionChunk:
+    """Span of audio to decode, in seconds, and the part of it whose segments are kept.
+
+    ``start``/``end`` include the overlap with the neighbouring chunks; a segment
+    belongs to this chunk when its midpoint falls in ``[keep_from, keep_until)``.
+    """
+
+    start: float
+    end: float
+    keep_from: float
+    keep_until: float
+
+    def owns(self, segment: TranscriptSegment) -> bool:
+        return self.keep_from <= (segment.start + segment.end) / 2 < self.keep_until
+
+
+def plan_chunks(
+    duration: float, cuts: list[float], overlap_seconds: float
+) -> list[TranscriptionChunk]:
+    bounds = [0.0, *cuts, duration]
+    chunks = [
+        TranscriptionChunk(
+            start=max(0.0, keep_from - overlap_seconds),
+            end=min(duration, keep_until + overlap_seconds),
+            keep_from=keep_from,
+            keep_until=keep_until,
+        )
+        for keep_from, keep_until in pairwise(bounds)
+    ]
+    last = chunks[-1]
+    chunks[-1] = TranscriptionChunk(last.start, last.end, last.keep_from, math.inf)
+    return chunks
+
+
+class ChunkedTranscriber:
+    """Transcribe long recordings as concurrently decoded chunks split at pauses.
+
+    Chunks overlap slightly so words at a cut are heard in full by both sides;
+    each segment is kept only by the chunk that owns its midpoint, and segments
+    are reported in timeline order as chunks finish. Recordings shorter than
+    1.5 chunks, or not in normalized PCM form, go to the backend in one call.
+    """
+
+    def __init__(
+        self,
+        backend: TranscriptionService,
+        chunk_seconds: float,
+        overlap_seconds: float,
+        parallelism: int,
+    ) -> None:
+        self._backend = backend
+        self._chunk_seconds = chunk_seconds
+        self._overlap_seconds = overlap_seconds
+        self._parallelism = max(1, parallelism)
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: SegmentCallback | None = None,
+    ) -> str:
+        if not is_normalized_pcm(audio_path):
+            return self._backend.transcribe(audio_path, language, on_segment)
+        samples = open_pcm(audio_path)
+        duration = len(samples) / PCM_SAMPLE_RATE
+        if duration < 1.5 * self._chunk_seconds:
+            return self._backend.transcribe(audio_path, language, on_segment)
+
+        cuts = silence_cut_points(samples, PCM_SAMPLE_RATE, self._chunk_seconds)
+        chunks = plan_chunks(
+            duration, [cut / PCM_SAMPLE_RATE for cut in cuts], self._overlap_seconds
+        )
+
+        kept: list[TranscriptSegment] = []
+        with TemporaryDirectory(prefix=f".{audio_path.stem}_", dir=audio_path.parent) as tmp:
+            chunk_paths = [
+                write_pcm_wav(
+                    Path(tmp) / f"{index:04d}.wav",
+                    samples[int(chunk.start * PCM_SAMPLE_RATE) : int(chunk.end * PCM_SAMPLE_RATE)],
+                )
+                for index, chunk in enumerate(chunks)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=self._parallelism, thread_name_prefix="stt-chunk"
+            ) as executor:
+                futures = [
+                    executor.submit(self._transcribe_chunk, chunk, path, language)
+                    for chunk, path in zip(chunks, chunk_paths, strict=True)
+                ]
+                try:
+                    for future in futures:
+                        for segment in future.result():
+                            kept.append(segment)
+                            if on_segment is not None:
+                                on_segment(segment, min(100.0, segment.end / duration * 100))
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return " ".join(segment.text for segment in kept)
+
+    def _transcribe_chunk(
+        self, chunk: TranscriptionChunk, path: Path, language: str
+    ) -> list[TranscriptSegment]:
+        segments: list[TranscriptSegment] = []
+
+        def collect(segment: TranscriptSegment, _: float) -> None:
+            shifted = TranscriptSegment(
+                start=segment.start + chunk.start,
+                end=segment.end + chunk.start,
+                text=segment.text,
+            )
+            if chunk.owns(shifted):
+                segments.append(shifted)
+
+        self._backend.transcribe(path, language, on_segment=collect)
+        return segments
+
+    def warm_up(self) -> None:
+        self._backend.warm_up()
@@ -1,33 +1,86 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from uuid import UUID
 
 from app.application.pipeline.graph import SummarizationPipeline
-from app.infrastructure.jobs.manager import JobManager
+from app.domain.enums import JobStatus
+from app.domain.models import JobPreferences, JobRecord
+from app.infrastructure.jobs.manager import JobManager, JobNotFoundError
+from app.infrastructure.metrics.prometheus import observe_finished_job
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
 from app.infrastructure.storage.file_store import FileStorageService
 
 
 class JobOrchestrator:
-    """Run full summarization jobs and update lifecycle state."""
+    """Run full summarization jobs and update lifecycle state.
+
+    With checkpoints, a job that was interrupted resumes after its last
+    completed stage, keeping the transcript it had already decoded.
+    """
 
     def __init__(
         self,
         pipeline: SummarizationPipeline,
         storage: FileStorageService,
         job_manager: JobManager,
+        checkpoints: StageCheckpointStore | None = None,
     ) -> None:
         self._pipeline = pipeline
         self._storage = storage
         self._job_manager = job_manager
+        self._checkpoints = checkpoints
+
+    def retry(self, job_id: UUID) -> JobRecord:
+        """Queue a failed job again; it resumes after its last completed stage."""
+
+        return self._job_manager.requeue(job_id, allowed_statuses={JobStatus.FAILED})
+
+    def resynthesize(self, job_id: UUID, preferences: JobPreferences) -> JobRecord:
+        """Queue a finished job to render its summary audio again.
+
+        The transcript and reference clip are reused; the summary is reused too
+        unless ``preferences`` differ from the ones it was written for.
+        """
+
+        previous = self._job_manager.get_job(job_id)
+        if previous is None:
+            raise JobNotFoundError(str(job_id))
+        job = self._job_manager.requeue(
+            job_id,
+            allowed_statuses={JobStatus.COMPLETED, JobStatus.FAILED},
+            preferences=preferences,
+        )
+        if self._checkpoints is not None:
+            stale = ["synthesize"]
+            if previous.preferences != preferences:
+                stale.append("summarize")
+            self._checkpoints.discard(job_id, stale)
+        return job
+
+    def prune_finished(self, older_than: timedelta) -> int:
+        """Delete finished jobs past the retention window along with all their files."""
+
+        pruned = self._job_manager.prune_finished(older_than)
+        for job in pruned:
+            self._storage.delete_job_files(job)
+            if self._checkpoints is not None:
+                self._checkpoints.discard(job.id)
+        return len(pruned)
 
     def process_job(self, job_id: UUID) -> None:
-        job = self._job_manager.mark_running(job_id)
+        resumed = (
+            self._checkpoints is not None
+            and "transcribe" in self._checkpoints.completed_stages(job_id)
+        )
+        job = self._job_manager.mark_running(job_id, keep_transcript=resumed)
 
         try:
             final_state = self._pipeline.run(
                 {
                     "job_id": job.id,
                     "audio_input_path": job.audio_input_path,
+                    "audio_sha256": job.audio_sha256,
                     "preferences": job.preferences,
                 }
             )
@@ -37,7 +90,7 @@ class JobOrchestrator:
             reference_clip_path = final_state["reference_clip_path"]
 
             self._storage.save_transcript(job.id, transcript_text)
-            self._job_manager.mark_completed(
+            finished = self._job_manager.mark_completed(
                 job_id=job.id,
                 transcript_text=transcript_text,
                 summary_text=summary_text,
@@ -45,4 +98,9 @@ class JobOrchestrator:
                 reference_clip_path=reference_clip_path,
             )
         except Exception as exc:
-            self._job_manager.mark_failed(job.id, str(exc))
+            finished = self._job_manager.mark_failed(job.id, str(exc))
+        else:
+            # Failed jobs keep the decode for a retry. A resynthesis replays the
+            # transcript and reference-clip checkpoints, so it never needs it.
+            self._storage.build_pcm_audio_path(job.audio_input_path).unlink(missing_ok=True)
+        observe_finished_job(finished)
@@ -1,30 +1,137 @@
 from __future__ import annotations
 
-from typing import Any, cast
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Protocol, cast
 
 from langgraph.graph import END, START, StateGraph
 
 from app.application.pipeline.nodes import PipelineNodes
 from app.application.pipeline.state import PipelineState
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
 
 
-class SummarizationPipeline:
-    """Compiles and runs the LangGraph pipeline."""
+class StageAction(Protocol):
+    def __call__(self, state: PipelineState) -> dict[str, object]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStage:
+    """One graph node and the stages whose outputs it reads."""
+
+    name: str
+    action: StageAction
+    depends_on: tuple[str, ...] = ()
+
+
+def pipeline_stages(nodes: PipelineNodes) -> tuple[PipelineStage, ...]:
+    """Stage dependencies of the summarization pipeline.
+
+    The upload is decoded once by ``ingest_audio``. Reference-clip extraction only
+    needs that decoded audio, so it runs alongside transcription and summarization
+    and joins them before synthesis.
+    """
+
+    return (
+        PipelineStage("ingest_audio", nodes.ingest_audio),
+        PipelineStage("transcribe", nodes.transcribe, depends_on=("ingest_audio",)),
+        PipelineStage("summarize", nodes.summarize, depends_on=("transcribe",)),
+        PipelineStage(
+            "prepare_reference_clip",
+            nodes.prepare_reference_clip,
+            depends_on=("ingest_audio",),
+        ),
+        PipelineStage(
+            "synthesize",
+            nodes.synthesize,
+            depends_on=("summarize", "prepare_reference_clip"),
+        ),
+    )
+
+
+def checkpointed(
+    stage: PipelineStage,
+    checkpoints: StageCheckpointStore,
+    dependents: Sequence[str] = (),
+) -> PipelineStage:
+    """Wrap a stage so its outputs are saved, and replayed instead of rerun on resume.
+
+    A stage is skipped altogether when every stage in ``dependents`` (those that
+    read its outputs) will replay a checkpoint, e.g. the deleted PCM decode is
+    not rebuilt just to resynthesize a finished job.
+    """
 
-    def __init__(self, nodes: PipelineNodes) -> None:
-        graph = StateGraph(PipelineState)
-        graph.add_node("transcribe", nodes.transcribe)
-        graph.add_node("summarize", nodes.summarize)
-        graph.add_node("prepare_reference_clip", nodes.prepare_reference_clip)
-        graph.add_node("synthesize", nodes.synthesize)
+    action = stage.action
 
-        graph.add_edge(START, "transcribe")
-        graph.add_edge("transcribe", "summarize")
-        graph.add_edge("summarize", "prepare_reference_clip")
-        graph.add_edge("prepare_reference_clip", "synthesize")
-        graph.add_edge("synthesize", END)
+    def run(state: PipelineState) -> dict[str, object]:
+        job_id = state["job_id"]
+        saved = checkpoints.get(job_id, stage.name)
+        if saved is not None:
+            return saved
+        if dependents and all(checkpoints.get(job_id, name) is not None for name in dependents):
+            return {}
+        outputs = action(state)
+        checkpoints.save(job_id, stage.name, outputs)
+        return outputs
+
+    return replace(stage, action=run)
+
+
+def build_graph(stages: Sequence[PipelineStage]) -> Any:
+    """Compile stages into a LangGraph, fanning out independent stages from START.
+
+    Stages without dependencies start in parallel, a stage with several
+    dependencies waits for all of them, and stages nothing depends on lead to END.
+    """
+
+    names = {stage.name for stage in stages}
+    if len(names) != len(stages):
+        raise ValueError("Pipeline stage names must be unique")
+    for stage in stages:
+        unknown = set(stage.depends_on) - names
+        if unknown:
+            raise ValueError(f"Stage {stage.name!r} depends on unknown stages {sorted(unknown)}")
+    try:
+        tuple(TopologicalSorter({stage.name: stage.depends_on for stage in stages}).static_order())
+    except CycleError as exc:
+        raise ValueError(f"Pipeline stages form a cycle: {exc.args[1]}") from exc
+
+    graph = StateGraph(PipelineState)
+    for stage in stages:
+        graph.add_node(stage.name, stage.action)
+
+    upstream = {dependency for stage in stages for dependency in stage.depends_on}
+    for stage in stages:
+        if not stage.depends_on:
+            graph.add_edge(START, stage.name)
+        elif len(stage.depends_on) == 1:
+            graph.add_edge(stage.depends_on[0], stage.name)
+        else:
+            graph.add_edge(list(stage.depends_on), stage.name)
+        if stage.name not in upstream:
+            graph.add_edge(stage.name, END)
+
+    return graph.compile()
+
+
+class SummarizationPipeline:
+    """Compiles and runs the LangGraph pipeline."""
 
-        self._compiled = graph.compile()
+    def __init__(
+        self, nodes: PipelineNodes, checkpoints: StageCheckpointStore | None = None
+    ) -> None:
+        stages = pipeline_stages(nodes)
+        if checkpoints is not None:
+            stages = tuple(
+                checkpointed(
+                    stage,
+                    checkpoints,
+                    [other.name for other in stages if stage.name in other.depends_on],
+                )
+                for stage in stages
+            )
+        self._compiled = build_graph(stages)
 
     def run(self, state: PipelineState) -> PipelineState:
         payload: Any = state
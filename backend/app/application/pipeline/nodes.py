@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import wave
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter, thread_time
+from uuid import UUID
+
+from app.application.chunked_synthesis import ChunkedVoiceSynthesizer
 from app.application.pipeline.state import PipelineState
+from app.application.ports import TranscriptionService
 from app.core.config import Settings
-from app.infrastructure.audio.processing import extract_reference_clip
+from app.domain.models import StageTiming, TranscriptSegment
+from app.infrastructure.audio.processing import decode_to_pcm, extract_reference_clip
+from app.infrastructure.cache.summary_cache import SummaryCache
+from app.infrastructure.cache.transcript_cache import TranscriptCache
+from app.infrastructure.jobs.manager import JobManager
 from app.infrastructure.llm.llama_summarizer import LlamaSummarizationService
-from app.infrastructure.speech.coqui_voice_cloner import CoquiVoiceCloningService
-from app.infrastructure.speech.faster_whisper_transcriber import WhisperTranscriptionService
+from app.infrastructure.metrics.prometheus import observe_stage
 from app.infrastructure.storage.file_store import FileStorageService
 
 
+@dataclass(slots=True)
+class _StageMeasurement:
+    cached: bool = False
+
+
 class PipelineNodes:
     """LangGraph nodes for transcription, summarization, and voice synthesis."""
 
@@ -16,47 +34,139 @@ class PipelineNodes:
         self,
         settings: Settings,
         storage: FileStorageService,
-        transcriber: WhisperTranscriptionService,
+        jobs: JobManager,
+        transcriber: TranscriptionService,
         summarizer: LlamaSummarizationService,
-        voice_cloner: CoquiVoiceCloningService,
+        voice_cloner: ChunkedVoiceSynthesizer,
+        transcript_cache: TranscriptCache | None = None,
+        summary_cache: SummaryCache | None = None,
     ) -> None:
         self._settings = settings
         self._storage = storage
+        self._jobs = jobs
         self._transcriber = transcriber
         self._summarizer = summarizer
         self._voice_cloner = voice_cloner
+        self._transcript_cache = transcript_cache
+        self._summary_cache = summary_cache
+
+    def ingest_audio(self, state: PipelineState) -> dict[str, object]:
+        job_id = state["job_id"]
+        audio_input_path = state["audio_input_path"]
+        with self._measure(job_id, "ingest_audio"):
+            pcm_audio_path = decode_to_pcm(
+                source_path=audio_input_path,
+                destination_path=self._storage.build_pcm_audio_path(audio_input_path),
+            )
+            with wave.open(str(pcm_audio_path), "rb") as reader:
+                duration = reader.getnframes() / reader.getframerate()
+        self._jobs.record_audio_duration(job_id, duration)
+        return {"pcm_audio_path": pcm_audio_path}
 
     def transcribe(self, state: PipelineState) -> dict[str, object]:
-        transcript_text = self._transcriber.transcribe(
-            audio_path=state["audio_input_path"],
-            language=self._settings.transcript_language,
-        )
-        return {"transcript_text": transcript_text}
+        job_id = state["job_id"]
+        language = self._settings.transcript_language
+        audio_sha256 = state.get("audio_sha256")
+        cache = self._transcript_cache
+
+        with self._measure(job_id, "transcribe", cacheable=cache is not None) as measurement:
+            if cache is not None and audio_sha256:
+                cached = cache.get(audio_sha256, language)
+                if cached is not None:
+                    measurement.cached = True
+                    self._jobs.mark_transcribed(job_id, segments=cached.segments)
+                    return {"transcript_text": cached.text}
+
+            segments: list[TranscriptSegment] = []
+
+            def publish(segment: TranscriptSegment, progress: float) -> None:
+                segments.append(segment)
+                self._jobs.append_transcript_segment(job_id, segment, progress)
+
+            transcript_text = self._transcriber.transcribe(
+                audio_path=state["pcm_audio_path"],
+                language=language,
+                on_segment=publish,
+            )
+            if not transcript_text.strip():
+                raise ValueError("Transcription result is empty")
+            self._jobs.mark_transcribed(job_id)
+            if cache is not None and audio_sha256:
+                cache.put(audio_sha256, language, transcript_text, segments)
+            return {"transcript_text": transcript_text}
 
     def summarize(self, state: PipelineState) -> dict[str, object]:
         transcript_text = state["transcript_text"]
-        summary_text = self._summarizer.summarize(
-            transcript=transcript_text,
-            preferences=state["preferences"],
-        )
-        return {"summary_text": summary_text}
+        preferences = state["preferences"]
+        cache = self._summary_cache
+
+        with self._measure(
+            state["job_id"], "summarize", cacheable=cache is not None
+        ) as measurement:
+            cache_key: str | None = None
+            if cache is not None:
+                cache_key = self._summarizer.cache_key(transcript_text, preferences)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    measurement.cached = True
+                    return {"summary_text": cached}
+
+            summary_text = self._summarizer.summarize(
+                transcript=transcript_text,
+                preferences=preferences,
+            )
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, summary_text)
+            return {"summary_text": summary_text}
 
     def prepare_reference_clip(self, state: PipelineState) -> dict[str, object]:
         job_id = state["job_id"]
         reference_clip_path = self._storage.build_reference_clip_path(job_id)
-        clip_path = extract_reference_clip(
-            source_path=state["audio_input_path"],
-            destination_path=reference_clip_path,
-            seconds=self._settings.sample_clip_seconds,
-        )
+        with self._measure(job_id, "prepare_reference_clip"):
+            clip_path = extract_reference_clip(
+                source_path=state["pcm_audio_path"],
+                destination_path=reference_clip_path,
+                seconds=self._settings.sample_clip_seconds,
+                select_speech=self._settings.sample_clip_select_speech,
+            )
         return {"reference_clip_path": clip_path}
 
     def synthesize(self, state: PipelineState) -> dict[str, object]:
-        output_path = self._storage.build_output_audio_path(state["job_id"])
-        rendered_path = self._voice_cloner.synthesize(
-            text=state["summary_text"],
-            speaker_wav=state["reference_clip_path"],
-            language=self._settings.transcript_language,
-            output_path=output_path,
-        )
+        job_id = state["job_id"]
+
+        def publish(index: int, total: int, _: Path) -> None:
+            self._jobs.record_synthesis_progress(job_id, ready=index + 1, total=total)
+
+        with self._measure(job_id, "synthesize"):
+            rendered_path = self._voice_cloner.synthesize(
+                text=state["summary_text"],
+                speaker_wav=state["reference_clip_path"],
+                language=self._settings.transcript_language,
+                output_path=self._storage.build_output_audio_path(job_id),
+                chunk_dir=self._storage.build_audio_chunks_dir(job_id),
+                on_chunk=publish,
+            )
         return {"output_audio_path": rendered_path}
+
+    @contextmanager
+    def _measure(
+        self, job_id: UUID, stage: str, cacheable: bool = False
+    ) -> Iterator[_StageMeasurement]:
+        """Record wall time and CPU time of the calling thread for a successful stage.
+
+        CPU time covers only the stage's own thread; work handed to worker
+        processes or native thread pools shows up in wall time alone.
+        """
+
+        measurement = _StageMeasurement()
+        wall_started = perf_counter()
+        cpu_started = thread_time()
+        yield measurement
+        timing = StageTiming(
+            stage=stage,
+            wall_seconds=perf_counter() - wall_started,
+            cpu_seconds=thread_time() - cpu_started,
+            cached=measurement.cached,
+        )
+        self._jobs.record_stage_timing(job_id, timing)
+        observe_stage(timing, cacheable)
@@ -11,7 +11,9 @@ class PipelineState(TypedDict):
     job_id: UUID
     audio_input_path: Path
     preferences: JobPreferences
+    audio_sha256: NotRequired[str | None]
 
+    pcm_audio_path: NotRequired[Path]
     transcript_text: NotRequired[str]
     summary_text: NotRequired[str]
     reference_clip_path: NotRequired[Path]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+from app.domain.models import TranscriptSegment
+
+SegmentCallback = Callable[[TranscriptSegment, float], None]
+"""Receives each transcript segment as it is decoded plus overall percent progress."""
+
+
+class Warmable(Protocol):
+    """Service that can load and exercise its model ahead of the first job."""
+
+    def warm_up(self) -> None: ...
+
+
+class TranscriptionService(Protocol):
+    """Speech-to-text backend used by the transcribe stage."""
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: SegmentCallback | None = None,
+    ) -> str: ...
+
+    def warm_up(self) -> None: ...
+
+
+class BatchTranscriptionService(TranscriptionService, Protocol):
+    """Speech-to-text backend that can also decode several short files in one pass."""
+
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]: ...
+
+
+class VoiceCloningService(Protocol):
+    """Text-to-speech backend used by the synthesize stage."""
+
+    def synthesize(
+        self, text: str, speaker_wav: Path, language: str, output_path: Path
+    ) -> Path: ...
+
+    def warm_up(self) -> None: ...
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from threading import Lock
+from time import monotonic
+
+from app.application.ports import Warmable
+from app.domain.enums import ReadinessStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ModelReadiness:
+    """Track startup model warm-up so traffic is only routed to warm instances."""
+
+    def __init__(self, services: Sequence[Warmable], preload: bool) -> None:
+        self._services = tuple(services)
+        self._status = ReadinessStatus.WARMING if preload else ReadinessStatus.READY
+        self._error: str | None = None
+        self._lock = Lock()
+
+    @property
+    def status(self) -> ReadinessStatus:
+        return self._status
+
+    @property
+    def error(self) -> str | None:
+        return self._error
+
+    def warm_up(self) -> None:
+        """Load and warm every model once; later calls are no-ops."""
+
+        with self._lock:
+            if self._status != ReadinessStatus.WARMING:
+                return
+
+            started = monotonic()
+            try:
+                for service in self._services:
+                    service.warm_up()
+            except Exception as exc:
+                logger.exception("Model warm-up failed")
+                self._error = str(exc) or type(exc).__name__
+                self._status = ReadinessStatus.FAILED
+                return
+
+            logger.info("Models warmed up in %.1fs", monotonic() - started)
+            self._status = ReadinessStatus.READY
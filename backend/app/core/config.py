@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
+from app.domain.enums import AudioFormat
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -23,13 +25,49 @@ class Settings(BaseSettings):
 
     uploads_dir: Path = Field(default=Path("data/uploads"), alias="UPLOADS_DIR")
     outputs_dir: Path = Field(default=Path("data/outputs"), alias="OUTPUTS_DIR")
+    cache_dir: Path = Field(default=Path("data/cache"), alias="CACHE_DIR")
 
     ollama_base_url: str = Field(default="http://localhost:11434", alias="OLLAMA_BASE_URL")
     ollama_model: str = Field(default="llama3", alias="OLLAMA_MODEL")
+    summary_map_reduce: bool = Field(default=True, alias="SUMMARY_MAP_REDUCE")
+    summary_chunk_tokens: int = Field(default=3000, alias="SUMMARY_CHUNK_TOKENS", ge=256)
+    summary_chunk_overlap_tokens: int = Field(
+        default=100, alias="SUMMARY_CHUNK_OVERLAP_TOKENS", ge=0
+    )
+    summary_max_concurrency: int = Field(default=4, alias="SUMMARY_MAX_CONCURRENCY", ge=1, le=32)
+    summary_cache_enabled: bool = Field(default=True, alias="SUMMARY_CACHE_ENABLED")
+    summary_cache_max_mb: int = Field(default=64, alias="SUMMARY_CACHE_MAX_MB", ge=1)
+    summary_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, alias="SUMMARY_CACHE_TTL_SECONDS", ge=60
+    )
 
     whisper_model_size: str = Field(default="small", alias="WHISPER_MODEL_SIZE")
     whisper_compute_type: str = Field(default="int8", alias="WHISPER_COMPUTE_TYPE")
+    whisper_num_workers: int = Field(default=1, alias="WHISPER_NUM_WORKERS", ge=1, le=16)
+    whisper_cpu_threads: int = Field(default=0, alias="WHISPER_CPU_THREADS", ge=0)
+    whisper_batch_size: int = Field(default=8, alias="WHISPER_BATCH_SIZE", ge=1, le=64)
+    transcribe_batch_window_ms: int = Field(
+        default=0, alias="TRANSCRIBE_BATCH_WINDOW_MS", ge=0, le=5000
+    )
+    transcribe_batch_max_files: int = Field(
+        default=8, alias="TRANSCRIBE_BATCH_MAX_FILES", ge=1, le=64
+    )
+    transcribe_batch_max_seconds: int = Field(
+        default=120, alias="TRANSCRIBE_BATCH_MAX_SECONDS", ge=1
+    )
+    transcribe_chunk_minutes: int = Field(default=10, alias="TRANSCRIBE_CHUNK_MINUTES", ge=0)
+    transcribe_chunk_overlap_seconds: float = Field(
+        default=2.0, alias="TRANSCRIBE_CHUNK_OVERLAP_SECONDS", ge=0, le=30
+    )
+    whisper_vad_filter: bool = Field(default=True, alias="WHISPER_VAD_FILTER")
+    whisper_vad_threshold: float = Field(default=0.5, alias="WHISPER_VAD_THRESHOLD", gt=0, lt=1)
+    whisper_vad_min_silence_ms: int = Field(
+        default=1000, alias="WHISPER_VAD_MIN_SILENCE_MS", ge=100
+    )
+    whisper_vad_speech_pad_ms: int = Field(default=400, alias="WHISPER_VAD_SPEECH_PAD_MS", ge=0)
     transcript_language: str = Field(default="en", alias="TRANSCRIPT_LANGUAGE")
+    transcript_cache_enabled: bool = Field(default=True, alias="TRANSCRIPT_CACHE_ENABLED")
+    transcript_cache_max_mb: int = Field(default=256, alias="TRANSCRIPT_CACHE_MAX_MB", ge=1)
 
     tts_model_name: str = Field(
         default="tts_models/multilingual/multi-dataset/xtts_v2",
@@ -37,10 +75,44 @@ class Settings(BaseSettings):
     )
     tts_use_gpu: bool = Field(default=False, alias="TTS_USE_GPU")
     coqui_tos_agreed: bool = Field(default=False, alias="COQUI_TOS_AGREED")
+    tts_chunk_max_chars: int = Field(default=240, alias="TTS_CHUNK_MAX_CHARS", ge=50, le=1000)
+    tts_chunk_gap_ms: int = Field(default=150, alias="TTS_CHUNK_GAP_MS", ge=0, le=2000)
+    speaker_cache_entries: int = Field(default=8, alias="SPEAKER_CACHE_ENTRIES", ge=0)
+    speaker_cache_max_mb: int = Field(default=64, alias="SPEAKER_CACHE_MAX_MB", ge=1)
 
     min_target_minutes: int = Field(default=1, alias="MIN_TARGET_MINUTES", ge=1)
     max_target_minutes: int = Field(default=20, alias="MAX_TARGET_MINUTES", le=120)
     sample_clip_seconds: int = Field(default=25, alias="SAMPLE_CLIP_SECONDS", ge=3, le=120)
+    sample_clip_select_speech: bool = Field(default=True, alias="SAMPLE_CLIP_SELECT_SPEECH")
+
+    job_store_backend: Literal["memory", "sqlite"] = Field(
+        default="memory", alias="JOB_STORE_BACKEND"
+    )
+    job_store_path: Path = Field(default=Path("data/jobs.sqlite3"), alias="JOB_STORE_PATH")
+    job_retention_hours: int = Field(default=7 * 24, alias="JOB_RETENTION_HOURS", ge=1)
+    job_workers: int = Field(default=1, alias="JOB_WORKERS", ge=1, le=64)
+    job_queue_max_size: int = Field(default=32, alias="JOB_QUEUE_MAX_SIZE", ge=1)
+    job_lease_seconds: int = Field(default=60, alias="JOB_LEASE_SECONDS", ge=5)
+    job_checkpoints_enabled: bool = Field(default=True, alias="JOB_CHECKPOINTS_ENABLED")
+
+    audio_download_default_format: AudioFormat = Field(
+        default=AudioFormat.MP3, alias="AUDIO_DOWNLOAD_DEFAULT_FORMAT"
+    )
+    audio_opus_bitrate_kbps: int = Field(default=32, alias="AUDIO_OPUS_BITRATE_KBPS", ge=6, le=256)
+    audio_mp3_bitrate_kbps: int = Field(default=64, alias="AUDIO_MP3_BITRATE_KBPS", ge=8, le=320)
+
+    preload_models: bool = Field(default=False, alias="PRELOAD_MODELS")
+    model_execution_mode: Literal["inline", "process"] = Field(
+        default="inline",
+        alias="MODEL_EXECUTION_MODE",
+    )
+    transcribe_worker_processes: int = Field(
+        default=1, alias="TRANSCRIBE_WORKER_PROCESSES", ge=1, le=16
+    )
+    synthesize_worker_processes: int = Field(
+        default=1, alias="SYNTHESIZE_WORKER_PROCESSES", ge=1, le=16
+    )
+    model_call_timeout_seconds: int = Field(default=3600, alias="MODEL_CALL_TIMEOUT_SECONDS", ge=1)
 
     cors_origins: Annotated[tuple[str, ...], NoDecode] = Field(
         default=("http://localhost:8080",),
@@ -64,6 +136,7 @@ def ensure_directories(settings: Settings) -> None:
 
     settings.uploads_dir.mkdir(parents=True, exist_ok=True)
     settings.outputs_dir.mkdir(parents=True, exist_ok=True)
+    settings.cache_dir.mkdir(parents=True, exist_ok=True)
 
 
 @lru_cache(maxsize=1)
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
+from datetime import timedelta
 
+from app.application.batched_transcription import MicroBatchingTranscriber
+from app.application.chunked_synthesis import ChunkedVoiceSynthesizer
+from app.application.chunked_transcription import ChunkedTranscriber
 from app.application.orchestrator import JobOrchestrator
 from app.application.pipeline.graph import SummarizationPipeline
 from app.application.pipeline.nodes import PipelineNodes
+from app.application.ports import (
+    BatchTranscriptionService,
+    TranscriptionService,
+    VoiceCloningService,
+)
+from app.application.readiness import ModelReadiness
 from app.core.config import Settings
+from app.infrastructure.cache.summary_cache import SummaryCache
+from app.infrastructure.cache.transcript_cache import TranscriptCache
 from app.infrastructure.jobs.manager import JobManager
+from app.infrastructure.jobs.repository import SqliteJobRepository
+from app.infrastructure.jobs.scheduler import JobQueueFullError, JobScheduler
 from app.infrastructure.llm.llama_summarizer import LlamaSummarizationService
 from app.infrastructure.speech.coqui_voice_cloner import CoquiVoiceCloningService
 from app.infrastructure.speech.faster_whisper_transcriber import WhisperTranscriptionService
+from app.infrastructure.speech.process_isolated import (
+    ProcessTranscriptionService,
+    ProcessVoiceCloningService,
+)
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
 from app.infrastructure.storage.file_store import FileStorageService
+from app.infrastructure.workers.model_pool import ModelWorkerPool
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,29 +42,132 @@ class ServiceContainer:
     storage: FileStorageService
     jobs: JobManager
     orchestrator: JobOrchestrator
+    scheduler: JobScheduler
+    readiness: ModelReadiness
+    model_pools: tuple[ModelWorkerPool, ...] = ()
+
+    def start(self) -> None:
+        for pool in self.model_pools:
+            pool.start()
+        self.scheduler.start()
+        self.requeue_unfinished_jobs()
+
+    def requeue_unfinished_jobs(self) -> int:
+        """Claim and queue jobs left pending or running by a process that is gone.
+
+        Only the SQLite store has any: a job is reclaimed once its owner has not
+        heartbeated for ``JOB_LEASE_SECONDS``, so jobs of live processes sharing
+        the database are left alone. Reclaimed jobs resume from their last
+        checkpointed stage.
+        """
+
+        unfinished = self.jobs.claim_orphaned_jobs(
+            timedelta(seconds=self.settings.job_lease_seconds)
+        )
+        for job in unfinished:
+            try:
+                self.scheduler.submit(job.id)
+            except JobQueueFullError:
+                self.jobs.mark_failed(job.id, "Job queue was full when resuming after restart")
+        if unfinished:
+            logger.info("Re-queued %d jobs from stopped processes", len(unfinished))
+        return len(unfinished)
+
+    def shutdown(self) -> None:
+        self.scheduler.shutdown(wait=False)
+        for pool in self.model_pools:
+            pool.shutdown()
+
 
+def build_container(
+    settings: Settings,
+    stt_backend: BatchTranscriptionService | None = None,
+    tts_backend: VoiceCloningService | None = None,
+) -> ServiceContainer:
+    """Wire services from settings.
+
+    ``stt_backend``/``tts_backend`` replace the Whisper and XTTS services (and
+    the process workers that would host them), e.g. for offline benchmarks.
+    """
 
-def build_container(settings: Settings) -> ServiceContainer:
     storage = FileStorageService(settings)
-    jobs = JobManager()
+    jobs = JobManager(
+        SqliteJobRepository(settings.job_store_path)
+        if settings.job_store_backend == "sqlite"
+        else None
+    )
 
-    transcriber = WhisperTranscriptionService(settings)
     summarizer = LlamaSummarizationService(settings)
-    voice_cloner = CoquiVoiceCloningService(settings)
+    transcriber: TranscriptionService
+    model_pools: tuple[ModelWorkerPool, ...] = ()
+    tts_parallelism = 1
+    stt_parallelism = settings.whisper_num_workers
+    if settings.model_execution_mode == "process":
+        tts_parallelism = settings.synthesize_worker_processes
+        stt_parallelism = settings.transcribe_worker_processes
+        if stt_backend is None:
+            process_transcriber = ProcessTranscriptionService(settings)
+            stt_backend = process_transcriber
+            model_pools += (process_transcriber.pool,)
+        if tts_backend is None:
+            process_voice_cloner = ProcessVoiceCloningService(settings)
+            tts_backend = process_voice_cloner
+            model_pools += (process_voice_cloner.pool,)
+    if stt_backend is None:
+        stt_backend = WhisperTranscriptionService(settings)
+    if tts_backend is None:
+        tts_backend = CoquiVoiceCloningService(settings)
+    transcriber = stt_backend
+    if settings.transcribe_batch_window_ms > 0:
+        transcriber = MicroBatchingTranscriber(
+            backend=stt_backend,
+            window_seconds=settings.transcribe_batch_window_ms / 1000,
+            max_files=settings.transcribe_batch_max_files,
+            max_seconds=settings.transcribe_batch_max_seconds,
+        )
+    if settings.transcribe_chunk_minutes > 0 and stt_parallelism > 1:
+        transcriber = ChunkedTranscriber(
+            backend=transcriber,
+            chunk_seconds=settings.transcribe_chunk_minutes * 60,
+            overlap_seconds=settings.transcribe_chunk_overlap_seconds,
+            parallelism=stt_parallelism,
+        )
+    voice_cloner = ChunkedVoiceSynthesizer(
+        backend=tts_backend,
+        max_chars=settings.tts_chunk_max_chars,
+        parallelism=tts_parallelism,
+        gap_ms=settings.tts_chunk_gap_ms,
+    )
 
     nodes = PipelineNodes(
         settings=settings,
         storage=storage,
+        jobs=jobs,
         transcriber=transcriber,
         summarizer=summarizer,
         voice_cloner=voice_cloner,
+        transcript_cache=TranscriptCache(settings) if settings.transcript_cache_enabled else None,
+        summary_cache=SummaryCache(settings) if settings.summary_cache_enabled else None,
     )
-    pipeline = SummarizationPipeline(nodes)
+    checkpoints = (
+        StageCheckpointStore(settings.outputs_dir) if settings.job_checkpoints_enabled else None
+    )
+    pipeline = SummarizationPipeline(nodes, checkpoints=checkpoints)
 
     orchestrator = JobOrchestrator(
         pipeline=pipeline,
         storage=storage,
         job_manager=jobs,
+        checkpoints=checkpoints,
+    )
+    scheduler = JobScheduler(
+        handler=orchestrator.process_job,
+        workers=settings.job_workers,
+        max_pending=settings.job_queue_max_size,
+    )
+    readiness = ModelReadiness(
+        services=(transcriber, voice_cloner),
+        preload=settings.preload_models,
     )
 
     return ServiceContainer(
@@ -49,4 +175,7 @@ def build_container(settings: Settings) -> ServiceContainer:
         storage=storage,
         jobs=jobs,
         orchestrator=orchestrator,
+        scheduler=scheduler,
+        readiness=readiness,
+        model_pools=model_pools,
     )
@@ -14,3 +14,15 @@ class JobStatus(StrEnum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+class ReadinessStatus(StrEnum):
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class AudioFormat(StrEnum):
+    WAV = "wav"
+    OPUS = "opus"
+    MP3 = "mp3"
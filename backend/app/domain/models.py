@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import base64
+import binascii
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import UUID, uuid4
@@ -18,21 +21,143 @@ class JobPreferences(BaseModel):
     genre: Genre
 
 
+class TranscriptSegment(BaseModel):
+    """Timestamped piece of transcript text, in seconds from the start of the audio."""
+
+    model_config = ConfigDict(frozen=True)
+
+    start: float = Field(ge=0)
+    end: float = Field(ge=0)
+    text: str
+
+
+class StageTiming(BaseModel):
+    """Resources one pipeline stage used: wall time and CPU time of its thread."""
+
+    model_config = ConfigDict(frozen=True)
+
+    stage: str
+    wall_seconds: float = Field(ge=0)
+    cpu_seconds: float = Field(ge=0)
+    cached: bool = False
+
+
 class JobRecord(BaseModel):
-    """Internal job state."""
+    """Immutable snapshot of internal job state.
+
+    Updates produce a new record with a bumped ``version``; unchanged fields such
+    as the transcript are shared between snapshots rather than copied.
+    """
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     id: UUID = Field(default_factory=uuid4)
+    version: int = 0
     status: JobStatus = JobStatus.PENDING
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     audio_input_path: Path
+    audio_sha256: str | None = None
     reference_clip_path: Path | None = None
     output_audio_path: Path | None = None
 
     preferences: JobPreferences
     transcript_text: str | None = None
+    transcript_segments: tuple[TranscriptSegment, ...] = ()
+    transcription_progress: float | None = Field(default=None, ge=0, le=100)
     summary_text: str | None = None
+    synthesis_chunks_ready: int = 0
+    synthesis_chunks_total: int | None = None
+    error_message: str | None = None
+
+    queued_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    audio_duration_seconds: float | None = None
+    stage_timings: tuple[StageTiming, ...] = ()
+
+    @property
+    def queue_wait_seconds(self) -> float | None:
+        if self.started_at is None:
+            return None
+        return (self.started_at - (self.queued_at or self.created_at)).total_seconds()
+
+    @property
+    def processing_seconds(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+    @property
+    def real_time_factor(self) -> float | None:
+        """Processing time per second of input audio; below 1 is faster than real time."""
+
+        processing = self.processing_seconds
+        if processing is None or not self.audio_duration_seconds:
+            return None
+        return processing / self.audio_duration_seconds
+
+
+class JobSummary(BaseModel):
+    """Listing projection of a job that leaves out transcript and summary bodies."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    version: int = 0
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    preferences: JobPreferences
+    transcription_progress: float | None = None
+    synthesis_chunks_ready: int = 0
+    synthesis_chunks_total: int | None = None
     error_message: str | None = None
+
+    @classmethod
+    def from_record(cls, job: JobRecord) -> JobSummary:
+        return cls.model_construct(**{name: getattr(job, name) for name in cls.model_fields})
+
+
+@dataclass(frozen=True, slots=True)
+class QueuePosition:
+    """Place of a pending job in the queue, 1-based, with a start-time estimate."""
+
+    position: int
+    estimated_start_seconds: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class JobCursor:
+    """Keyset position in the newest-first job listing: the last job already returned."""
+
+    created_at: datetime
+    job_id: UUID
+
+    @classmethod
+    def of(cls, job: JobSummary) -> JobCursor:
+        return cls(created_at=job.created_at, job_id=job.id)
+
+    @classmethod
+    def decode(cls, token: str) -> JobCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii") + b"==").decode("ascii")
+            created_at, job_id = raw.split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), job_id=UUID(job_id))
+        except (UnicodeError, binascii.Error, ValueError) as exc:
+            raise ValueError("Invalid job cursor") from exc
+
+    def encode(self) -> str:
+        raw = f"{sortable_timestamp(self.created_at)}|{self.job_id}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @property
+    def key(self) -> tuple[str, UUID]:
+        return sortable_timestamp(self.created_at), self.job_id
+
+
+def sortable_timestamp(value: datetime) -> str:
+    """Fixed-width UTC timestamp so that text order matches time order."""
+
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -1,6 +1,29 @@
 from __future__ import annotations
 
+import os
+import shutil
+import struct
+import subprocess
+import wave
+from collections.abc import Sequence
 from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import numpy.typing as npt
+
+PCM_SAMPLE_RATE = 16_000
+_PCM_FORMAT = (1, 2, PCM_SAMPLE_RATE)
+_VAD_FRAME_SECONDS = 0.03
+_VAD_BLOCK_FRAMES = 8192
+_VAD_MARGIN_DB = 12.0
+_VAD_FLOOR_DBFS = -55.0
+_CUT_SMOOTHING_FRAMES = 10
+# Opus in an Ogg container is what browsers play; libopus's VoIP mode suits speech.
+_ENCODER_ARGS = {
+    "opus": ("-c:a", "libopus", "-application", "voip", "-f", "ogg"),
+    "mp3": ("-c:a", "libmp3lame", "-f", "mp3"),
+}
 
 
 def minutes_to_target_words(minutes: int, words_per_minute: int = 145) -> int:
@@ -13,16 +36,346 @@ def minutes_to_target_words(minutes: int, words_per_minute: int = 145) -> int:
     return minutes * words_per_minute
 
 
-def extract_reference_clip(source_path: Path, destination_path: Path, seconds: int) -> Path:
-    """Extract the first N seconds from source audio as a WAV speaker reference."""
+def is_normalized_pcm(path: Path) -> bool:
+    """Whether ``path`` is already a 16 kHz mono 16-bit PCM WAV."""
+
+    try:
+        with wave.open(str(path), "rb") as reader:
+            params = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+            return params == _PCM_FORMAT and reader.getcomptype() == "NONE"
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def decode_to_pcm(source_path: Path, destination_path: Path) -> Path:
+    """Decode an upload once into the 16 kHz mono 16-bit PCM WAV all stages read.
+
+    Uploads that are already in that format are used as-is, and an existing
+    decode (from an earlier attempt) is reused.
+    """
+
+    if is_normalized_pcm(source_path):
+        return source_path
+    if is_normalized_pcm(destination_path):
+        return destination_path
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to decode uploaded audio")
+
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = destination_path.with_name(f".{destination_path.name}.part")
+    command = [
+        ffmpeg,
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-i",
+        str(source_path),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(PCM_SAMPLE_RATE),
+        "-c:a",
+        "pcm_s16le",
+        "-map_metadata",
+        "-1",
+        "-f",
+        "wav",
+        str(staging_path),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        staging_path.unlink(missing_ok=True)
+        detail = result.stderr.strip() or f"ffmpeg exited with code {result.returncode}"
+        raise ValueError(f"Could not decode {source_path.name}: {detail}")
+    os.replace(staging_path, destination_path)
+    return destination_path
+
+
+def encode_audio(source_path: Path, destination_path: Path, codec: str, bitrate_kbps: int) -> Path:
+    """Encode a WAV to ``codec`` ("opus" or "mp3") once, reusing an up-to-date encode.
+
+    An existing destination counts as current while it is not older than the
+    source, so a re-rendered WAV is encoded again. Concurrent encodes each write
+    their own staging file and the last rename wins.
+    """
+
+    if codec not in _ENCODER_ARGS:
+        raise ValueError(f"Unsupported codec: {codec}")
+    try:
+        if destination_path.stat().st_mtime >= source_path.stat().st_mtime:
+            return destination_path
+    except FileNotFoundError:
+        pass
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to encode compressed audio")
+
+    staging_path = destination_path.with_name(f".{destination_path.name}.{uuid4().hex}.part")
+    command = [
+        ffmpeg,
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-i",
+        str(source_path),
+        "-vn",
+        *_ENCODER_ARGS[codec],
+        "-b:a",
+        f"{bitrate_kbps}k",
+        "-map_metadata",
+        "-1",
+        str(staging_path),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        staging_path.unlink(missing_ok=True)
+        detail = result.stderr.strip() or f"ffmpeg exited with code {result.returncode}"
+        raise RuntimeError(f"Could not encode {source_path.name} as {codec}: {detail}")
+    os.replace(staging_path, destination_path)
+    return destination_path
+
+
+def open_pcm(path: Path) -> npt.NDArray[np.int16]:
+    """Memory-map the samples of a 16-bit PCM WAV without reading them into memory."""
+
+    offset, size = _wav_data_chunk(path)
+    if size == 0:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(path, dtype="<i2", mode="r", offset=offset, shape=(size // 2,))
+
+
+def pcm_to_float32(samples: npt.NDArray[np.int16]) -> npt.NDArray[np.float32]:
+    """Scale 16-bit samples to the [-1, 1) float range speech models expect."""
+
+    return samples.astype(np.float32) / 32768.0
+
+
+def frame_energies_db(
+    samples: npt.NDArray[np.int16], frame_rate: int, frame_seconds: float = _VAD_FRAME_SECONDS
+) -> npt.NDArray[np.float32]:
+    """Mean energy of consecutive frames in dBFS, computed block-wise to bound memory."""
+
+    frame_length = max(1, int(frame_rate * frame_seconds))
+    frame_count = len(samples) // frame_length
+    energies = np.empty(frame_count, dtype=np.float32)
+    for first in range(0, frame_count, _VAD_BLOCK_FRAMES):
+        last = min(frame_count, first + _VAD_BLOCK_FRAMES)
+        block = samples[first * frame_length : last * frame_length].astype(np.float32)
+        block /= 32768.0
+        power = np.square(block, out=block).reshape(last - first, frame_length).mean(axis=1)
+        energies[first:last] = 10.0 * np.log10(power + 1e-10)
+    return energies
+
+
+def select_speech_window(samples: npt.NDArray[np.int16], frame_rate: int, seconds: int) -> int:
+    """Start sample of the ``seconds``-long window holding the most speech.
+
+    Frames count as speech when they are well above the recording's noise floor
+    (its quiet 10th percentile) and above an absolute silence threshold; the
+    window with the most speech frames wins, earliest first on ties.
+    """
+
+    window = seconds * frame_rate
+    energies = frame_energies_db(samples, frame_rate)
+    frame_length = max(1, int(frame_rate * _VAD_FRAME_SECONDS))
+    window_frames = window // frame_length
+    if len(samples) <= window or len(energies) <= window_frames:
+        return 0
+
+    noise_floor = float(np.percentile(energies, 10))
+    threshold = max(noise_floor + _VAD_MARGIN_DB, _VAD_FLOOR_DBFS)
+    speech = np.concatenate(([0], np.cumsum(energies > threshold, dtype=np.int64)))
+    counts = speech[window_frames:] - speech[:-window_frames]
+    if counts.max() == 0:
+        return 0
+    return int(np.argmax(counts)) * frame_length
+
+
+def silence_cut_points(
+    samples: npt.NDArray[np.int16],
+    frame_rate: int,
+    every_seconds: float,
+    search_seconds: float = 30.0,
+) -> list[int]:
+    """Sample offsets that split audio roughly every ``every_seconds`` at quiet moments.
+
+    Around each nominal boundary the quietest ~300 ms stretch within
+    ``search_seconds`` is chosen, so cuts land in pauses rather than mid-word.
+    """
+
+    frame_length = max(1, int(frame_rate * _VAD_FRAME_SECONDS))
+    energies = frame_energies_db(samples, frame_rate)
+    if len(energies) >= _CUT_SMOOTHING_FRAMES:
+        kernel = np.ones(_CUT_SMOOTHING_FRAMES, dtype=np.float32) / _CUT_SMOOTHING_FRAMES
+        energies = np.convolve(energies, kernel, mode="same").astype(np.float32)
+
+    every_frames = max(1, int(every_seconds / _VAD_FRAME_SECONDS))
+    search_frames = int(search_seconds / _VAD_FRAME_SECONDS)
+    cuts: list[int] = []
+    previous = 0
+    for nominal in range(every_frames, len(energies) - every_frames // 2, every_frames):
+        low = max(previous + 1, nominal - search_frames)
+        high = min(len(energies), nominal + search_frames + 1)
+        if low >= high:
+            continue
+        previous = low + int(np.argmin(energies[low:high]))
+        cuts.append(previous * frame_length)
+    return cuts
+
+
+def write_pcm_wav(path: Path, samples: npt.NDArray[np.int16]) -> Path:
+    """Write 16 kHz mono 16-bit samples as a WAV file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(PCM_SAMPLE_RATE)
+        writer.writeframes(samples.tobytes())
+    return path
+
+
+def _wav_data_chunk(path: Path) -> tuple[int, int]:
+    """Byte offset and length of the ``data`` chunk of a RIFF/WAVE file."""
+
+    file_size = path.stat().st_size
+    with path.open("rb") as handle:
+        header = handle.read(12)
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise ValueError(f"{path.name} is not a WAV file")
+        while True:
+            chunk_header = handle.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"{path.name} has no data chunk")
+            (chunk_size,) = struct.unpack("<I", chunk_header[4:])
+            if chunk_header[:4] == b"data":
+                start = handle.tell()
+                # Streaming writers leave the size open-ended; trust the file length.
+                return start, min(chunk_size, file_size - start) & ~1
+            handle.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def extract_reference_clip(
+    source_path: Path,
+    destination_path: Path,
+    seconds: int,
+    select_speech: bool = False,
+) -> Path:
+    """Extract N seconds from source audio as a WAV speaker reference.
+
+    Normalized PCM is sliced from the memory-mapped samples; with
+    ``select_speech`` the densest speech window is taken instead of the opening
+    seconds, which skip silence and intros. Other PCM WAVs are read frame-bounded
+    and compressed formats are decoded by ffmpeg (via pydub) with a duration
+    limit, both from the start of the file.
+    """
 
     if seconds < 1:
         raise ValueError("seconds must be >= 1")
 
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    if is_normalized_pcm(source_path):
+        samples = open_pcm(source_path)
+        start = select_speech_window(samples, PCM_SAMPLE_RATE, seconds) if select_speech else 0
+        return write_pcm_wav(destination_path, samples[start : start + seconds * PCM_SAMPLE_RATE])
+    if _copy_wav_prefix(source_path, destination_path, seconds):
+        return destination_path
+
     from pydub import AudioSegment
 
-    audio = AudioSegment.from_file(source_path)
-    clipped = audio[: seconds * 1000]
-    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    clipped = AudioSegment.from_file(source_path, duration=seconds)
     clipped.export(destination_path, format="wav")
     return destination_path
+
+
+def _copy_wav_prefix(source_path: Path, destination_path: Path, seconds: int) -> bool:
+    """Copy the first ``seconds`` of an uncompressed WAV; ``False`` if it is not one."""
+
+    try:
+        reader = wave.open(str(source_path), "rb")
+    except (wave.Error, EOFError, OSError):
+        return False
+    with reader:
+        if reader.getcomptype() != "NONE":
+            return False
+        frames = reader.readframes(min(reader.getnframes(), seconds * reader.getframerate()))
+        with wave.open(str(destination_path), "wb") as writer:
+            writer.setnchannels(reader.getnchannels())
+            writer.setsampwidth(reader.getsampwidth())
+            writer.setframerate(reader.getframerate())
+            writer.writeframes(frames)
+    return True
+
+
+def concatenate_wavs(sources: Sequence[Path], destination_path: Path, gap_ms: int = 0) -> Path:
+    """Join PCM WAV files with identical formats, inserting silence between them.
+
+    The result is written to a temporary file and renamed into place, so readers
+    never observe a partially written output.
+    """
+
+    if not sources:
+        raise ValueError("At least one source WAV is required")
+
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = destination_path.with_name(f".{destination_path.name}.part")
+    with wave.open(str(staging_path), "wb") as writer:
+        params: tuple[int, int, int] | None = None
+        for index, source in enumerate(sources):
+            with wave.open(str(source), "rb") as reader:
+                source_params = (
+                    reader.getnchannels(),
+                    reader.getsampwidth(),
+                    reader.getframerate(),
+                )
+                if params is None:
+                    params = source_params
+                    writer.setnchannels(params[0])
+                    writer.setsampwidth(params[1])
+                    writer.setframerate(params[2])
+                elif source_params != params:
+                    raise ValueError(f"WAV format mismatch in {source.name}")
+                if index > 0:
+                    writer.writeframes(silence_bytes(*params, gap_ms=gap_ms))
+                writer.writeframes(reader.readframes(reader.getnframes()))
+    os.replace(staging_path, destination_path)
+    return destination_path
+
+
+def silence_bytes(channels: int, sample_width: int, frame_rate: int, gap_ms: int) -> bytes:
+    """Raw PCM silence of the given duration."""
+
+    frames = frame_rate * gap_ms // 1000
+    return b"\x00" * (frames * channels * sample_width)
+
+
+def streaming_wav_header(channels: int, sample_width: int, frame_rate: int) -> bytes:
+    """WAV header with open-ended RIFF/data sizes, for audio of unknown final length."""
+
+    unknown_size = 0xFFFFFFFF
+    block_align = channels * sample_width
+    return (
+        b"RIFF"
+        + struct.pack("<I", unknown_size)
+        + b"WAVEfmt "
+        + struct.pack(
+            "<IHHIIHH",
+            16,
+            1,
+            channels,
+            frame_rate,
+            frame_rate * block_align,
+            block_align,
+            sample_width * 8,
+        )
+        + b"data"
+        + struct.pack("<I", unknown_size)
+    )
@@ -0,0 +1 @@
+"""On-disk caches for expensive pipeline results."""
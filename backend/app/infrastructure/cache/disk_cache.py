@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from threading import Lock
+from uuid import uuid4
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{16,128}$")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskCache:
+    """Size-bounded on-disk byte cache with LRU eviction and optional TTL.
+
+    Every entry is one file named after its hex key. The file mtime records when the
+    entry was written (for TTL) and its atime is bumped on each hit (for LRU order),
+    so the cache needs no index and can be shared by several processes.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int,
+        ttl_seconds: float | None = None,
+        suffix: str = ".bin",
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._suffix = suffix
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            written_at = path.stat().st_mtime
+            if self._is_expired(written_at):
+                path.unlink(missing_ok=True)
+                raise FileNotFoundError(path)
+            data = path.read_bytes()
+            os.utime(path, times=(time.time(), written_at))
+        except FileNotFoundError:
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        staging.write_bytes(data)
+        os.replace(staging, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self._directory.glob(f"*{self._suffix}"):
+            try:
+                info = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._is_expired(info.st_mtime):
+                path.unlink(missing_ok=True)
+                self._count(evictions=1)
+                continue
+            entries.append((info.st_atime, info.st_size, path))
+            total += info.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._count(evictions=1)
+
+    def _is_expired(self, written_at: float) -> bool:
+        return self._ttl_seconds is not None and time.time() - written_at > self._ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        if not _KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self._directory / f"{key}{self._suffix}"
+
+    def _count(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        with self._lock:
+            self._stats = replace(
+                self._stats,
+                hits=self._stats.hits + hits,
+                misses=self._stats.misses + misses,
+                evictions=self._stats.evictions + evictions,
+            )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from app.core.config import Settings
+from app.infrastructure.cache.disk_cache import CacheStats, DiskCache
+
+SpeakerLatents = tuple[Any, Any]
+"""XTTS ``(gpt_cond_latent, speaker_embedding)`` tensors for one reference clip."""
+
+
+class SpeakerLatentCache:
+    """Two-level cache of XTTS speaker conditioning latents.
+
+    A small in-process LRU avoids touching disk for the speakers being synthesized
+    right now; the on-disk layer is keyed by the reference clip hash so latents
+    survive restarts and are shared between worker processes.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._model_name = settings.tts_model_name
+        self._max_entries = settings.speaker_cache_entries
+        self._memory: OrderedDict[str, SpeakerLatents] = OrderedDict()
+        self._lock = Lock()
+        self._disk = DiskCache(
+            directory=settings.cache_dir / "speakers",
+            max_bytes=settings.speaker_cache_max_mb * 1024 * 1024,
+            suffix=".pt",
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._disk.stats
+
+    def key(self, speaker_wav: Path) -> str:
+        digest = hashlib.sha256(f"{self._model_name}\n".encode())
+        with speaker_wav.open("rb") as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str, device: object = "cpu") -> SpeakerLatents | None:
+        with self._lock:
+            latents = self._memory.get(key)
+            if latents is not None:
+                self._memory.move_to_end(key)
+                return latents
+
+        payload = self._disk.get(key)
+        if payload is None:
+            return None
+
+        import torch
+
+        stored = torch.load(io.BytesIO(payload), map_location=device, weights_only=True)
+        latents = (stored["gpt_cond_latent"], stored["speaker_embedding"])
+        self._remember(key, latents)
+        return latents
+
+    def put(self, key: str, latents: SpeakerLatents) -> None:
+        import torch
+
+        buffer = io.BytesIO()
+        gpt_cond_latent, speaker_embedding = latents
+        torch.save(
+            {
+                "gpt_cond_latent": gpt_cond_latent.detach().cpu(),
+                "speaker_embedding": speaker_embedding.detach().cpu(),
+            },
+            buffer,
+        )
+        self._disk.put(key, buffer.getvalue())
+        self._remember(key, latents)
+
+    def _remember(self, key: str, latents: SpeakerLatents) -> None:
+        if self._max_entries < 1:
+            return
+        with self._lock:
+            self._memory[key] = latents
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
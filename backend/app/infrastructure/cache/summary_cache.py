@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from app.core.config import Settings
+from app.infrastructure.cache.disk_cache import CacheStats, DiskCache
+
+
+class SummaryCache:
+    """Persistent summaries keyed by a hash of the rendered prompt and model."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._cache = DiskCache(
+            directory=settings.cache_dir / "summaries",
+            max_bytes=settings.summary_cache_max_mb * 1024 * 1024,
+            ttl_seconds=settings.summary_cache_ttl_seconds,
+            suffix=".txt",
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, key: str) -> str | None:
+        payload = self._cache.get(key)
+        return None if payload is None else payload.decode("utf-8")
+
+    def put(self, key: str, summary: str) -> None:
+        self._cache.put(key, summary.encode("utf-8"))
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import Settings
+from app.domain.models import TranscriptSegment
+from app.infrastructure.cache.disk_cache import CacheStats, DiskCache
+
+
+class CachedTranscript(BaseModel):
+    text: str
+    segments: list[TranscriptSegment]
+
+
+class TranscriptCache:
+    """Persistent transcripts keyed by audio content hash and Whisper settings."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._model_size = settings.whisper_model_size
+        self._compute_type = settings.whisper_compute_type
+        self._vad = (
+            f"vad:{settings.whisper_vad_threshold}:{settings.whisper_vad_min_silence_ms}:"
+            f"{settings.whisper_vad_speech_pad_ms}"
+            if settings.whisper_vad_filter
+            else "novad"
+        )
+        # Micro-batched passes decode fixed clips without the VAD pre-pass, so
+        # their transcripts must not be served to (or from) VAD-filtered runs.
+        # Which path a file takes depends only on its length and these settings.
+        self._batching = (
+            f"batched:{settings.transcribe_batch_max_seconds}"
+            if settings.transcribe_batch_window_ms > 0
+            else "unbatched"
+        )
+        self._cache = DiskCache(
+            directory=settings.cache_dir / "transcripts",
+            max_bytes=settings.transcript_cache_max_mb * 1024 * 1024,
+            suffix=".json",
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, audio_sha256: str, language: str) -> CachedTranscript | None:
+        payload = self._cache.get(self._key(audio_sha256, language))
+        if payload is None:
+            return None
+        try:
+            return CachedTranscript.model_validate_json(payload)
+        except ValidationError:
+            return None
+
+    def put(
+        self,
+        audio_sha256: str,
+        language: str,
+        text: str,
+        segments: list[TranscriptSegment],
+    ) -> None:
+        entry = CachedTranscript(text=text, segments=segments)
+        self._cache.put(self._key(audio_sha256, language), entry.model_dump_json().encode())
+
+    def _key(self, audio_sha256: str, language: str) -> str:
+        material = "|".join(
+            (
+                audio_sha256,
+                self._model_size,
+                self._compute_type,
+                self._vad,
+                self._batching,
+                language,
+            )
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
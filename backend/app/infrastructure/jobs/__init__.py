@@ -1 +1 @@
-"""In-memory job manager."""
+"""Job registry, persistence backends and bounded job scheduler."""
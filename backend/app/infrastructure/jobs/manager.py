@@ -1,42 +1,218 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import Collection
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from threading import Lock
 from uuid import UUID
 
-from app.domain.enums import JobStatus
-from app.domain.models import JobPreferences, JobRecord
+from app.domain.enums import Genre, JobStatus
+from app.domain.models import (
+    JobCursor,
+    JobPreferences,
+    JobRecord,
+    JobSummary,
+    StageTiming,
+    TranscriptSegment,
+)
+from app.infrastructure.jobs.notifications import JobChangeNotifier, JobSubscription
+from app.infrastructure.jobs.repository import InMemoryJobRepository, JobRepository
 
 
 class JobNotFoundError(KeyError):
     """Raised when a job id does not exist."""
 
 
+class JobStateError(RuntimeError):
+    """Raised when a job's status does not allow the requested transition."""
+
+
 class JobManager:
-    """Thread-safe in-memory job registry."""
+    """Thread-safe job registry on top of a pluggable repository (in-memory by default).
 
-    def __init__(self) -> None:
-        self._jobs: dict[UUID, JobRecord] = {}
+    Records are frozen snapshots, so reads hand out the stored instance without
+    copying and every update swaps in a new version under the lock. Each new
+    version is announced to subscribers, which lets the API wait for changes
+    instead of polling.
+    """
+
+    def __init__(self, repository: JobRepository | None = None) -> None:
+        self._jobs = InMemoryJobRepository() if repository is None else repository
+        self._notifier = JobChangeNotifier()
         self._lock = Lock()
 
-    def create_job(self, audio_input_path: Path, preferences: JobPreferences) -> JobRecord:
-        job = JobRecord(audio_input_path=audio_input_path, preferences=preferences)
+    def create_job(
+        self,
+        audio_input_path: Path,
+        preferences: JobPreferences,
+        audio_sha256: str | None = None,
+    ) -> JobRecord:
+        job = JobRecord(
+            audio_input_path=audio_input_path,
+            audio_sha256=audio_sha256,
+            preferences=preferences,
+        )
+        with self._lock:
+            self._jobs.add(job)
+        return job
+
+    def list_jobs(
+        self,
+        status: JobStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[JobRecord]:
+        """Jobs newest first, optionally filtered by status and paginated."""
+
+        with self._lock:
+            return self._jobs.list_records(status=status, limit=limit, offset=offset)
+
+    def list_job_summaries(
+        self,
+        limit: int,
+        status: JobStatus | None = None,
+        genre: Genre | None = None,
+        after: JobCursor | None = None,
+    ) -> tuple[list[JobSummary], JobCursor | None]:
+        """One newest-first page of job projections plus the cursor of the next page."""
+
         with self._lock:
-            self._jobs[job.id] = job
-        return job.model_copy(deep=True)
+            page = self._jobs.list_summaries(
+                limit=limit + 1, status=status, genre=genre, after=after
+            )
+        if len(page) <= limit:
+            return page, None
+        return page[:limit], JobCursor.of(page[limit - 1])
+
+    def prune_finished(self, older_than: timedelta) -> list[JobRecord]:
+        """Delete completed and failed jobs last updated before the retention window.
+
+        Returns the deleted records so their files can be cleaned up.
+        """
 
-    def list_jobs(self) -> list[JobRecord]:
         with self._lock:
-            return [job.model_copy(deep=True) for job in self._jobs.values()]
+            return self._jobs.delete_finished_before(datetime.now(UTC) - older_than)
+
+    def heartbeat(self) -> None:
+        """Renew this process's lease on the jobs it owns (persistent stores only)."""
+
+        with self._lock:
+            self._jobs.heartbeat()
+
+    def claim_orphaned_jobs(self, lease: timedelta) -> list[JobRecord]:
+        """Unfinished jobs whose owning process has not heartbeated within ``lease``.
+
+        The jobs now belong to this process; running ones come first, then the
+        oldest.
+        """
+
+        with self._lock:
+            return self._jobs.claim_orphaned(
+                (JobStatus.RUNNING, JobStatus.PENDING), datetime.now(UTC) - lease
+            )
+
+    def subscribe(self, job_id: UUID) -> JobSubscription:
+        """Subscribe the running event loop to new versions of ``job_id``."""
+
+        return self._notifier.subscribe(job_id)
 
     def get_job(self, job_id: UUID) -> JobRecord | None:
         with self._lock:
-            job = self._jobs.get(job_id)
-            return None if job is None else job.model_copy(deep=True)
+            return self._jobs.get(job_id)
+
+    def get_version(self, job_id: UUID) -> int | None:
+        """Current version of ``job_id``, read straight from the store.
+
+        Change notifications only reach subscribers in this process; polling the
+        version lets them notice updates written by other processes sharing the
+        store.
+        """
+
+        with self._lock:
+            return self._jobs.version(job_id)
+
+    def requeue(
+        self,
+        job_id: UUID,
+        allowed_statuses: Collection[JobStatus],
+        preferences: JobPreferences | None = None,
+    ) -> JobRecord:
+        """Put a finished job back to PENDING for another run, optionally with new preferences.
+
+        The transcript is kept; results of the previous run are cleared.
+        """
+
+        with self._lock:
+            job = self._get_or_raise(job_id)
+            if job.status not in allowed_statuses:
+                raise JobStateError(f"Job is {job.status.value}")
+            return self._save(
+                job,
+                status=JobStatus.PENDING,
+                preferences=job.preferences if preferences is None else preferences,
+                queued_at=datetime.now(UTC),
+                started_at=None,
+                finished_at=None,
+                error_message=None,
+                summary_text=None,
+                output_audio_path=None,
+                synthesis_chunks_ready=0,
+                synthesis_chunks_total=None,
+            )
+
+    def mark_running(self, job_id: UUID, keep_transcript: bool = False) -> JobRecord:
+        """Start (or restart) a job; ``keep_transcript`` keeps segments already decoded."""
+
+        transcript: dict[str, object] = (
+            {} if keep_transcript else {"transcript_segments": (), "transcription_progress": None}
+        )
+        return self._update_job(
+            job_id,
+            status=JobStatus.RUNNING,
+            started_at=datetime.now(UTC),
+            finished_at=None,
+            stage_timings=(),
+            error_message=None,
+            synthesis_chunks_ready=0,
+            synthesis_chunks_total=None,
+            **transcript,
+        )
 
-    def mark_running(self, job_id: UUID) -> JobRecord:
-        return self._update_job(job_id, status=JobStatus.RUNNING, error_message=None)
+    def append_transcript_segment(
+        self, job_id: UUID, segment: TranscriptSegment, progress: float
+    ) -> None:
+        """Record a partial transcription result as it is decoded."""
+
+        with self._lock:
+            job = self._get_or_raise(job_id)
+            self._store(
+                job,
+                {
+                    "transcript_segments": (*job.transcript_segments, segment),
+                    "transcription_progress": progress,
+                },
+                appended_segments=1,
+            )
+
+    def mark_transcribed(
+        self, job_id: UUID, segments: list[TranscriptSegment] | None = None
+    ) -> JobRecord:
+        if segments is None:
+            return self._update_job(job_id, transcription_progress=100.0)
+        return self._update_job(
+            job_id, transcript_segments=tuple(segments), transcription_progress=100.0
+        )
+
+    def record_stage_timing(self, job_id: UUID, timing: StageTiming) -> JobRecord:
+        with self._lock:
+            job = self._get_or_raise(job_id)
+            return self._save(job, stage_timings=(*job.stage_timings, timing))
+
+    def record_audio_duration(self, job_id: UUID, seconds: float) -> JobRecord:
+        return self._update_job(job_id, audio_duration_seconds=seconds)
+
+    def record_synthesis_progress(self, job_id: UUID, ready: int, total: int) -> JobRecord:
+        return self._update_job(job_id, synthesis_chunks_ready=ready, synthesis_chunks_total=total)
 
     def mark_completed(
         self,
@@ -54,20 +230,39 @@ class JobManager:
             output_audio_path=output_audio_path,
             reference_clip_path=reference_clip_path,
             error_message=None,
+            finished_at=datetime.now(UTC),
         )
 
     def mark_failed(self, job_id: UUID, error_message: str) -> JobRecord:
-        return self._update_job(job_id, status=JobStatus.FAILED, error_message=error_message)
+        return self._update_job(
+            job_id,
+            status=JobStatus.FAILED,
+            error_message=error_message,
+            finished_at=datetime.now(UTC),
+        )
 
     def _update_job(self, job_id: UUID, **updates: object) -> JobRecord:
         with self._lock:
-            job = self._jobs.get(job_id)
-            if job is None:
-                raise JobNotFoundError(str(job_id))
-
-            merged = job.model_dump()
-            merged.update(updates)
-            merged["updated_at"] = datetime.now(UTC)
-            updated = JobRecord.model_validate(merged)
-            self._jobs[job_id] = updated
-            return updated.model_copy(deep=True)
+            return self._save(self._get_or_raise(job_id), **updates)
+
+    def _get_or_raise(self, job_id: UUID) -> JobRecord:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(str(job_id))
+        return job
+
+    def _save(self, job: JobRecord, **updates: object) -> JobRecord:
+        """Store the next version of ``job``; updates come from this class and skip validation."""
+
+        appended = None if "transcript_segments" in updates else 0
+        return self._store(job, updates, appended_segments=appended)
+
+    def _store(
+        self, job: JobRecord, updates: dict[str, object], appended_segments: int | None
+    ) -> JobRecord:
+        updated = job.model_copy(
+            update=updates | {"version": job.version + 1, "updated_at": datetime.now(UTC)}
+        )
+        self._jobs.save(updated, appended_segments)
+        self._notifier.publish(job.id)
+        return updated
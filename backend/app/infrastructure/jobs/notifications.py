@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+from types import TracebackType
+from uuid import UUID
+
+
+class JobSubscription:
+    """Wakes an asyncio task whenever one job changes.
+
+    Changes that happen while nobody is waiting are coalesced into a single
+    wake-up, so the subscriber always re-reads the latest snapshot.
+    """
+
+    def __init__(self, notifier: JobChangeNotifier, job_id: UUID) -> None:
+        self.job_id = job_id
+        self._notifier = notifier
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+
+    async def wait(self, seconds: float) -> bool:
+        """Wait up to ``seconds`` for a change; ``False`` if none arrived."""
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), seconds)
+        except TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+    def close(self) -> None:
+        self._notifier.unsubscribe(self)
+
+    def __enter__(self) -> JobSubscription:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def notify(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._changed.set)
+        except RuntimeError:
+            # The subscriber's event loop has already shut down.
+            pass
+
+
+class JobChangeNotifier:
+    """Process-local fan-out of job changes from worker threads to async subscribers."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[UUID, set[JobSubscription]] = {}
+        self._lock = Lock()
+
+    def subscribe(self, job_id: UUID) -> JobSubscription:
+        """Register the running event loop for changes to ``job_id``."""
+
+        subscription = JobSubscription(self, job_id)
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: JobSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.job_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.job_id]
+
+    def publish(self, job_id: UUID) -> None:
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(job_id, ()))
+        for subscription in subscribers:
+            subscription.notify()
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sqlite3
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Protocol
+from uuid import UUID, uuid4
+
+from app.domain.enums import Genre, JobStatus
+from app.domain.models import (
+    JobCursor,
+    JobRecord,
+    JobSummary,
+    TranscriptSegment,
+    sortable_timestamp,
+)
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class JobRepository(Protocol):
+    """Storage backend for job records; callers serialize writes per job."""
+
+    def add(self, job: JobRecord) -> None: ...
+
+    def get(self, job_id: UUID) -> JobRecord | None: ...
+
+    def version(self, job_id: UUID) -> int | None:
+        """Stored version of ``job_id`` without loading the record; a cheap poll."""
+        ...
+
+    def save(self, job: JobRecord, appended_segments: int | None = None) -> None:
+        """Store a new version of ``job``.
+
+        ``appended_segments`` counts the transcript segments added at the end since
+        the stored version (0 when unchanged); None means they may all differ.
+        """
+        ...
+
+    def list_records(
+        self,
+        status: JobStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[JobRecord]: ...
+
+    def list_summaries(
+        self,
+        limit: int,
+        status: JobStatus | None = None,
+        genre: Genre | None = None,
+        after: JobCursor | None = None,
+    ) -> list[JobSummary]: ...
+
+    def delete_finished_before(self, cutoff: datetime) -> list[JobRecord]:
+        """Delete finished jobs last updated before ``cutoff`` and return them.
+
+        The returned records may omit their transcript segments.
+        """
+        ...
+
+    def heartbeat(self) -> None:
+        """Record that the process owning this repository's jobs is alive."""
+
+    def claim_orphaned(
+        self, statuses: tuple[JobStatus, ...], stale_before: datetime
+    ) -> list[JobRecord]:
+        """Take over jobs in ``statuses`` whose owner stopped heartbeating before
+        ``stale_before``; running jobs first, then oldest first."""
+        ...
+
+
+class InMemoryJobRepository:
+    """Process-local job storage; fast, but lost on restart.
+
+    Keeps a sorted ``(created_at, id)`` index so listings walk newest first
+    without re-sorting every job on each request.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[UUID, JobRecord] = {}
+        self._order: list[tuple[str, UUID]] = []
+
+    def add(self, job: JobRecord) -> None:
+        self._jobs[job.id] = job
+        insort(self._order, (sortable_timestamp(job.created_at), job.id))
+
+    def get(self, job_id: UUID) -> JobRecord | None:
+        return self._jobs.get(job_id)
+
+    def version(self, job_id: UUID) -> int | None:
+        job = self._jobs.get(job_id)
+        return None if job is None else job.version
+
+    def save(self, job: JobRecord, appended_segments: int | None = None) -> None:
+        self._jobs[job.id] = job
+
+    def list_records(
+        self,
+        status: JobStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[JobRecord]:
+        jobs = [self._jobs[job_id] for _, job_id in reversed(self._order)]
+        if status is not None:
+            jobs = [job for job in jobs if job.status == status]
+        end = None if limit is None else offset + limit
+        return jobs[offset:end]
+
+    def list_summaries(
+        self,
+        limit: int,
+        status: JobStatus | None = None,
+        genre: Genre | None = None,
+        after: JobCursor | None = None,
+    ) -> list[JobSummary]:
+        end = len(self._order) if after is None else bisect_left(self._order, after.key)
+        summaries: list[JobSummary] = []
+        for index in range(end - 1, -1, -1):
+            if len(summaries) == limit:
+                break
+            job = self._jobs[self._order[index][1]]
+            if status is not None and job.status != status:
+                continue
+            if genre is not None and job.preferences.genre != genre:
+                continue
+            summaries.append(JobSummary.from_record(job))
+        return summaries
+
+    def delete_finished_before(self, cutoff: datetime) -> list[JobRecord]:
+        expired = [
+            job
+            for job in self._jobs.values()
+            if job.status in FINISHED_STATUSES and job.updated_at < cutoff
+        ]
+        for job in expired:
+            del self._jobs[job.id]
+        expired_ids = {job.id for job in expired}
+        self._order = [entry for entry in self._order if entry[1] not in expired_ids]
+        return expired
+
+    def heartbeat(self) -> None:
+        pass
+
+    def claim_orphaned(
+        self, statuses: tuple[JobStatus, ...], stale_before: datetime
+    ) -> list[JobRecord]:
+        # Every job here belongs to this process and dies with it.
+        return []
+
+
+class SqliteJobRepository:
+    """Job storage in a SQLite database in WAL mode, shared by all API processes.
+
+    Status, genre and timestamps live in indexed columns for filtering, keyset
+    pagination and pruning; the record is stored as JSON, except transcript
+    segments, which get one row each in ``job_segments`` so live transcription
+    appends a row instead of rewriting the whole transcript. Each repository
+    instance is one owner: jobs it adds are tagged with its id, it heartbeats in
+    ``job_owners``, and it only claims unfinished jobs whose owner has gone quiet.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            genre TEXT,
+            owner TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status ON jobs (status, updated_at)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_listing ON jobs (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_listing ON jobs (status, created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_genre_listing ON jobs (genre, created_at, id)",
+        """
+        CREATE TABLE IF NOT EXISTS job_segments (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (job_id, position)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS job_owners (
+            owner TEXT PRIMARY KEY,
+            heartbeat_at TEXT NOT NULL
+        )
+        """,
+    )
+    _SUMMARY_PAYLOAD = (
+        "json_remove(payload, '$.transcript_text', '$.transcript_segments', '$.summary_text')"
+    )
+
+    def __init__(self, path: Path, owner: str | None = None) -> None:
+        self._owner = owner or uuid4().hex
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA busy_timeout=5000")
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+        self.heartbeat()
+
+    def add(self, job: JobRecord) -> None:
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "INSERT INTO jobs (id, status, created_at, updated_at, payload, genre, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(job.id),
+                    job.status.value,
+                    sortable_timestamp(job.created_at),
+                    sortable_timestamp(job.updated_at),
+                    _record_payload(job),
+                    job.preferences.genre.value,
+                    self._owner,
+                ),
+            )
+            self._insert_segments(job, 0)
+
+    def get(self, job_id: UUID) -> JobRecord | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, payload FROM jobs WHERE id = ?", (str(job_id),)
+            ).fetchone()
+            return None if row is None else self._with_segments([row])[0]
+
+    def version(self, job_id: UUID) -> int | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT json_extract(payload, '$.version') FROM jobs WHERE id = ?",
+                (str(job_id),),
+            ).fetchone()
+            return None if row is None else int(row[0])
+
+    def save(self, job: JobRecord, appended_segments: int | None = None) -> None:
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, genre = ?, updated_at = ?, payload = ? WHERE id = ?",
+                (
+                    job.status.value,
+                    job.preferences.genre.value,
+                    sortable_timestamp(job.updated_at),
+                    _record_payload(job),
+                    str(job.id),
+                ),
+            )
+            if appended_segments is None:
+                self._connection.execute(
+                    "DELETE FROM job_segments WHERE job_id = ?", (str(job.id),)
+                )
+                self._insert_segments(job, 0)
+            elif appended_segments > 0:
+                self._insert_segments(job, len(job.transcript_segments) - appended_segments)
+
+    def list_records(
+        self,
+        status: JobStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[JobRecord]:
+        query = "SELECT id, payload FROM jobs"
+        parameters: list[object] = []
+        if status is not None:
+            query += " WHERE status = ?"
+            parameters.append(status.value)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+        parameters.extend((-1 if limit is None else limit, offset))
+
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+            return self._with_segments(rows)
+
+    def list_summaries(
+        self,
+        limit: int,
+        status: JobStatus | None = None,
+        genre: Genre | None = None,
+        after: JobCursor | None = None,
+    ) -> list[JobSummary]:
+        conditions: list[str] = []
+        parameters: list[object] = []
+        if status is not None:
+            conditions.append("status = ?")
+            parameters.append(status.value)
+        if genre is not None:
+            conditions.append("genre = ?")
+            parameters.append(genre.value)
+        if after is not None:
+            created_at, job_id = after.key
+            conditions.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            parameters.extend((created_at, created_at, str(job_id)))
+
+        query = f"SELECT {self._SUMMARY_PAYLOAD} FROM jobs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        parameters.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [JobSummary.model_validate_json(row[0]) for row in rows]
+
+    def delete_finished_before(self, cutoff: datetime) -> list[JobRecord]:
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._lock, self._transaction():
+            rows = self._connection.execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders}) AND updated_at < ? "
+                "RETURNING payload",
+                (*(status.value for status in FINISHED_STATUSES), sortable_timestamp(cutoff)),
+            ).fetchall()
+            records = [JobRecord.model_validate_json(row[0]) for row in rows]
+            self._connection.executemany(
+                "DELETE FROM job_segments WHERE job_id = ?",
+                [(str(record.id),) for record in records],
+            )
+        return records
+
+    def heartbeat(self) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO job_owners (owner, heartbeat_at) VALUES (?, ?) "
+                "ON CONFLICT (owner) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+                (self._owner, sortable_timestamp(datetime.now(UTC))),
+            )
+
+    def claim_orphaned(
+        self, statuses: tuple[JobStatus, ...], stale_before: datetime
+    ) -> list[JobRecord]:
+        placeholders = ", ".join("?" for _ in statuses)
+        running_first = "CASE status WHEN ? THEN 0 ELSE 1 END"
+        # The transaction takes the write lock up front, so two processes starting
+        # together cannot both claim the same job.
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "DELETE FROM job_owners WHERE heartbeat_at < ? AND owner != ?",
+                (sortable_timestamp(stale_before), self._owner),
+            )
+            rows = self._connection.execute(
+                f"SELECT id, payload FROM jobs WHERE status IN ({placeholders}) "
+                "AND (owner IS NULL OR owner NOT IN (SELECT owner FROM job_owners)) "
+                "AND owner IS NOT ? "
+                f"ORDER BY {running_first}, created_at, id",
+                (*(status.value for status in statuses), self._owner, JobStatus.RUNNING.value),
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE jobs SET owner = ? WHERE id = ?",
+                [(self._owner, row[0]) for row in rows],
+            )
+            return self._with_segments(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _insert_segments(self, job: JobRecord, start: int) -> None:
+        self._connection.executemany(
+            "INSERT INTO job_segments (job_id, position, payload) VALUES (?, ?, ?)",
+            [
+                (str(job.id), position, segment.model_dump_json())
+                for position, segment in enumerate(job.transcript_segments[start:], start=start)
+            ],
+        )
+
+    def _with_segments(self, rows: Sequence[tuple[str, str]]) -> list[JobRecord]:
+        """Build records from ``(id, payload)`` rows, attaching their segment rows."""
+
+        segments: dict[str, list[TranscriptSegment]] = defaultdict(list)
+        for start in range(0, len(rows), 500):
+            batch = [row[0] for row in rows[start : start + 500]]
+            placeholders = ", ".join("?" for _ in batch)
+            for job_id, payload in self._connection.execute(
+                f"SELECT job_id, payload FROM job_segments WHERE job_id IN ({placeholders}) "
+                "ORDER BY job_id, position",
+                batch,
+            ):
+                segments[job_id].append(TranscriptSegment.model_validate_json(payload))
+        return [
+            JobRecord.model_validate_json(payload).model_copy(
+                update={"transcript_segments": tuple(segments[job_id])}
+            )
+            for job_id, payload in rows
+        ]
+
+
+def _record_payload(job: JobRecord) -> str:
+    return job.model_dump_json(exclude={"transcript_segments"})
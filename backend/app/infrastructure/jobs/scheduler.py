@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from collections.abc import Callable
+from threading import Condition, Thread
+from time import monotonic
+from uuid import UUID
+
+from app.domain.models import QueuePosition
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the pending job queue has reached its capacity."""
+
+
+class JobScheduler:
+    """Bounded worker pool that runs queued jobs with backpressure."""
+
+    _DURATION_SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        handler: Callable[[UUID], None],
+        workers: int,
+        max_pending: int,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+
+        self._handler = handler
+        self._workers = workers
+        self._max_pending = max_pending
+        self._pending: deque[UUID] = deque()
+        self._running = 0
+        self._average_duration: float | None = None
+        self._threads: list[Thread] = []
+        self._stopping = False
+        self._condition = Condition()
+
+    @property
+    def is_full(self) -> bool:
+        with self._condition:
+            return len(self._pending) >= self._max_pending
+
+    @property
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def start(self) -> None:
+        with self._condition:
+            if self._threads or self._stopping:
+                return
+            for index in range(self._workers):
+                thread = Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def submit(self, job_id: UUID) -> int:
+        """Queue a job and return its 1-based position among pending jobs."""
+
+        self.start()
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("Job scheduler is shut down")
+            if len(self._pending) >= self._max_pending:
+                raise JobQueueFullError(f"Job queue is full ({self._max_pending} pending)")
+            self._pending.append(job_id)
+            self._condition.notify()
+            return len(self._pending)
+
+    def position(self, job_id: UUID) -> QueuePosition | None:
+        """Return the queue position of a pending job, or None once it has started."""
+
+        with self._condition:
+            try:
+                index = self._pending.index(job_id)
+            except ValueError:
+                return None
+
+            estimate: float | None = None
+            if self._average_duration is not None:
+                rounds = math.floor((index + self._running) / self._workers)
+                estimate = rounds * self._average_duration
+            return QueuePosition(position=index + 1, estimated_start_seconds=estimate)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs; running jobs finish, pending ones stay queued."""
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                job_id = self._pending.popleft()
+                self._running += 1
+
+            started = monotonic()
+            try:
+                self._handler(job_id)
+            except Exception:
+                logger.exception("Job %s crashed its worker handler", job_id)
+            finally:
+                self._record_finished(monotonic() - started)
+
+    def _record_finished(self, duration: float) -> None:
+        with self._condition:
+            self._running -= 1
+            if self._average_duration is None:
+                self._average_duration = duration
+            else:
+                self._average_duration += self._DURATION_SMOOTHING * (
+                    duration - self._average_duration
+                )
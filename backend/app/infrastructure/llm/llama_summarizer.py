@@ -1,22 +1,72 @@
 from __future__ import annotations
 
+import hashlib
+
+from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_ollama import ChatOllama
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.core.config import Settings
 from app.domain.models import JobPreferences
 from app.infrastructure.audio.processing import minutes_to_target_words
 
+CHARS_PER_TOKEN = 4
+MAX_COLLAPSE_ROUNDS = 3
+# Room for the prompt instructions around the transcript text.
+PROMPT_HEADROOM_TOKENS = 256
+# Generous tokens-per-word bound for the summary the model writes back.
+OUTPUT_TOKENS_PER_WORD = 2
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for English text, good enough for chunk budgeting."""
+
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def context_window_tokens(settings: Settings) -> int:
+    """Ollama ``num_ctx`` that fits one chunk-sized prompt plus the longest summary.
+
+    Ollama's default context is a few thousand tokens and silently drops the start
+    of longer prompts, so the window is sized from the chunk budget instead,
+    rounded up to a multiple of 1024.
+    """
+
+    output_tokens = OUTPUT_TOKENS_PER_WORD * minutes_to_target_words(settings.max_target_minutes)
+    needed = settings.summary_chunk_tokens + PROMPT_HEADROOM_TOKENS + output_tokens
+    return -(-needed // 1024) * 1024
+
 
 class LlamaSummarizationService:
-    """Summarize transcript text with local Llama model via Ollama."""
+    """Summarize transcript text with local Llama model via Ollama.
+
+    Transcripts larger than the chunk budget are summarized map-reduce style:
+    chunks are summarized concurrently, partial summaries are collapsed until
+    they fit one prompt, and a final pass writes the target-length summary.
+    """
 
     def __init__(self, settings: Settings) -> None:
-        self._llm = ChatOllama(
+        self._llm: BaseChatModel = ChatOllama(
             model=settings.ollama_model,
             base_url=settings.ollama_base_url,
             temperature=0.2,
+            num_ctx=context_window_tokens(settings),
+        )
+        self._model_name = settings.ollama_model
+        self._map_reduce = settings.summary_map_reduce
+        self._chunk_tokens = settings.summary_chunk_tokens
+        self._chunk_overlap_tokens = settings.summary_chunk_overlap_tokens
+        self._max_concurrency = settings.summary_max_concurrency
+        self._splitter = RecursiveCharacterTextSplitter(
+            chunk_size=settings.summary_chunk_tokens,
+            chunk_overlap=min(
+                settings.summary_chunk_overlap_tokens, settings.summary_chunk_tokens // 4
+            ),
+            length_function=estimate_tokens,
+            separators=["\n\n", "\n", ". ", "? ", "! ", " ", ""],
+            keep_separator="end",
         )
         self._prompt = ChatPromptTemplate.from_template(
             """
@@ -33,21 +83,114 @@ Transcript:
 {transcript}
 """.strip()
         )
+        self._map_prompt = ChatPromptTemplate.from_template(
+            """
+You are summarizing part {part} of {parts} of a long transcript.
+Write a dense summary of this part only.
+
+Constraints:
+- Genre focus: {genre}
+- Length: at most {chunk_words} words
+- Keep names, numbers, decisions and the order of events
+- Output only the summary text
+
+Transcript part:
+{transcript}
+""".strip()
+        )
+        self._reduce_prompt = ChatPromptTemplate.from_template(
+            """
+You are a specialist summarizer.
+The notes below are consecutive partial summaries of one long transcript.
+Merge them into a single concise spoken summary in plain language.
+
+Constraints:
+- Genre focus: {genre}
+- Target length: around {target_words} words
+- Keep factual accuracy and continuity
+- Output only the summary text
+
+Partial summaries:
+{summaries}
+""".strip()
+        )
+
+    def cache_key(self, transcript: str, preferences: JobPreferences) -> str:
+        """Hash of everything that determines the summary: prompt, model and chunking."""
+
+        rendered = self._prompt.format(**self._prompt_inputs(transcript, preferences))
+        digest = hashlib.sha256()
+        digest.update(
+            f"{self._model_name}|{self._map_reduce}|{self._chunk_tokens}|"
+            f"{self._chunk_overlap_tokens}\n".encode()
+        )
+        digest.update(rendered.encode("utf-8"))
+        return digest.hexdigest()
 
     def summarize(self, transcript: str, preferences: JobPreferences) -> str:
         if not transcript.strip():
             raise ValueError("Transcript is empty")
 
         target_words = minutes_to_target_words(preferences.target_minutes)
-        chain = self._prompt | self._llm | StrOutputParser()
-        summary = chain.invoke(
+        if self._map_reduce and estimate_tokens(transcript) > self._chunk_tokens:
+            summary = self._summarize_map_reduce(transcript, preferences, target_words)
+        else:
+            chain = self._prompt | self._llm | StrOutputParser()
+            summary = chain.invoke(self._prompt_inputs(transcript, preferences))
+        cleaned = summary.strip()
+        if not cleaned:
+            raise ValueError("LLM generated an empty summary")
+        return cleaned
+
+    @staticmethod
+    def _prompt_inputs(transcript: str, preferences: JobPreferences) -> dict[str, object]:
+        return {
+            "genre": preferences.genre.value,
+            "target_words": minutes_to_target_words(preferences.target_minutes),
+            "transcript": transcript,
+        }
+
+    def _summarize_map_reduce(
+        self, transcript: str, preferences: JobPreferences, target_words: int
+    ) -> str:
+        summaries = self._summarize_chunks(transcript, preferences, target_words)
+        # Collapse rounds stop once they no longer shrink the notes: per-chunk word
+        # floors or an LLM ignoring the limit would otherwise loop without end.
+        for _ in range(MAX_COLLAPSE_ROUNDS):
+            joined = "\n\n".join(summaries)
+            if len(summaries) <= 1 or estimate_tokens(joined) <= self._chunk_tokens:
+                break
+            collapsed = self._summarize_chunks(joined, preferences, target_words)
+            if estimate_tokens("\n\n".join(collapsed)) >= estimate_tokens(joined):
+                break
+            summaries = collapsed
+
+        chain = self._reduce_prompt | self._llm | StrOutputParser()
+        return chain.invoke(
             {
                 "genre": preferences.genre.value,
                 "target_words": target_words,
-                "transcript": transcript,
+                "summaries": "\n\n".join(summaries),
             }
         )
-        cleaned = summary.strip()
-        if not cleaned:
-            raise ValueError("LLM generated an empty summary")
-        return cleaned
+
+    def _summarize_chunks(
+        self, text: str, preferences: JobPreferences, target_words: int
+    ) -> list[str]:
+        chunks = self._splitter.split_text(text)
+        chunk_words = max(100, min(self._chunk_tokens // 4, 2 * target_words // len(chunks)))
+        chain = self._map_prompt | self._llm | StrOutputParser()
+        summaries = chain.batch(
+            [
+                {
+                    "genre": preferences.genre.value,
+                    "chunk_words": chunk_words,
+                    "part": index,
+                    "parts": len(chunks),
+                    "transcript": chunk,
+                }
+                for index, chunk in enumerate(chunks, start=1)
+            ],
+            config={"max_concurrency": self._max_concurrency},
+        )
+        return [summary.strip() for summary in summaries if summary.strip()]
@@ -0,0 +1 @@
+"""Prometheus metrics for pipeline stages, jobs and models."""
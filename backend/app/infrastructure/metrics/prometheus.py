@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.domain.models import JobRecord, StageTiming
+
+_STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+_RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5)
+
+STAGE_SECONDS = Histogram(
+    "voice_summarizer_stage_seconds",
+    "Wall-clock time of a pipeline stage.",
+    ("stage", "cached"),
+    buckets=_STAGE_BUCKETS,
+)
+STAGE_CPU_SECONDS = Histogram(
+    "voice_summarizer_stage_cpu_seconds",
+    "CPU time of the thread that ran a pipeline stage.",
+    ("stage",),
+    buckets=_STAGE_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "voice_summarizer_cache_lookups_total",
+    "Cache lookups made by cacheable pipeline stages.",
+    ("stage", "result"),
+)
+QUEUE_WAIT_SECONDS = Histogram(
+    "voice_summarizer_queue_wait_seconds",
+    "Time jobs spent queued before a worker picked them up.",
+    buckets=_STAGE_BUCKETS,
+)
+JOB_SECONDS = Histogram(
+    "voice_summarizer_job_seconds",
+    "Processing time of finished jobs, from start to completion or failure.",
+    ("status",),
+    buckets=_STAGE_BUCKETS,
+)
+REAL_TIME_FACTOR = Histogram(
+    "voice_summarizer_real_time_factor",
+    "Job processing time divided by the duration of the uploaded audio.",
+    buckets=_RTF_BUCKETS,
+)
+MODEL_LOAD_SECONDS = Histogram(
+    "voice_summarizer_model_load_seconds",
+    "Time to load a model into memory, per process.",
+    ("model",),
+    buckets=_STAGE_BUCKETS,
+)
+PENDING_JOBS = Gauge("voice_summarizer_pending_jobs", "Jobs waiting in the scheduler queue.")
+
+
+def observe_stage(timing: StageTiming, cacheable: bool) -> None:
+    STAGE_SECONDS.labels(stage=timing.stage, cached=str(timing.cached).lower()).observe(
+        timing.wall_seconds
+    )
+    STAGE_CPU_SECONDS.labels(stage=timing.stage).observe(timing.cpu_seconds)
+    if cacheable:
+        CACHE_LOOKUPS.labels(stage=timing.stage, result="hit" if timing.cached else "miss").inc()
+
+
+def observe_finished_job(job: JobRecord) -> None:
+    if job.queue_wait_seconds is not None:
+        QUEUE_WAIT_SECONDS.observe(job.queue_wait_seconds)
+    if job.processing_seconds is not None:
+        JOB_SECONDS.labels(status=job.status.value).observe(job.processing_seconds)
+    if job.real_time_factor is not None:
+        REAL_TIME_FACTOR.observe(job.real_time_factor)
+
+
+@contextmanager
+def model_load_timer(model: str) -> Iterator[None]:
+    started = perf_counter()
+    yield
+    MODEL_LOAD_SECONDS.labels(model=model).observe(perf_counter() - started)
@@ -1,45 +1,155 @@
 from __future__ import annotations
 
+import math
+import struct
+import wave
 from pathlib import Path
-from typing import TYPE_CHECKING
+from tempfile import TemporaryDirectory
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 from app.core.config import Settings
+from app.infrastructure.cache.speaker_cache import SpeakerLatentCache, SpeakerLatents
+from app.infrastructure.metrics.prometheus import model_load_timer
 
 if TYPE_CHECKING:
     from TTS.api import TTS
 
+WARM_UP_TEXT = "Warming up."
+WARM_UP_REFERENCE_SECONDS = 3
+WARM_UP_SAMPLE_RATE = 24_000
+
 
 class CoquiVoiceCloningService:
     """Clone speaker voice using Coqui XTTS and a reference clip."""
 
     def __init__(self, settings: Settings) -> None:
         self._model_name = settings.tts_model_name
+        self._language = settings.transcript_language
         self._use_gpu = settings.tts_use_gpu
         self._model: TTS | None = None
+        self._model_lock = Lock()
+        self._speaker_cache = SpeakerLatentCache(settings)
 
     def synthesize(self, text: str, speaker_wav: Path, language: str, output_path: Path) -> Path:
+        return self._synthesize(text, speaker_wav, language, output_path, cache_speaker=True)
+
+    def _synthesize(
+        self,
+        text: str,
+        speaker_wav: Path,
+        language: str,
+        output_path: Path,
+        cache_speaker: bool,
+    ) -> Path:
         if not text.strip():
             raise ValueError("Summary text cannot be empty")
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         model = self._get_model()
-        model.tts_to_file(
+        xtts = getattr(getattr(model, "synthesizer", None), "tts_model", None)
+        if xtts is None or not hasattr(xtts, "get_conditioning_latents"):
+            model.tts_to_file(
+                text=text,
+                speaker_wav=str(speaker_wav),
+                language=language,
+                file_path=str(output_path),
+            )
+            return output_path
+
+        if cache_speaker:
+            gpt_cond_latent, speaker_embedding = self._speaker_latents(xtts, speaker_wav)
+        else:
+            gpt_cond_latent, speaker_embedding = _conditioning_latents(xtts, speaker_wav)
+        config = xtts.config
+        result = xtts.inference(
             text=text,
-            speaker_wav=str(speaker_wav),
             language=language,
-            file_path=str(output_path),
+            gpt_cond_latent=gpt_cond_latent,
+            speaker_embedding=speaker_embedding,
+            temperature=config.temperature,
+            length_penalty=config.length_penalty,
+            repetition_penalty=config.repetition_penalty,
+            top_k=config.top_k,
+            top_p=config.top_p,
+            enable_text_splitting=True,
         )
+        model.synthesizer.save_wav(wav=result["wav"], path=str(output_path))
         return output_path
 
+    def _speaker_latents(self, xtts: Any, speaker_wav: Path) -> SpeakerLatents:
+        """Return conditioning latents for a reference clip, computing them once per clip."""
+
+        key = self._speaker_cache.key(speaker_wav)
+        cached = self._speaker_cache.get(key, device=xtts.device)
+        if cached is not None:
+            return cached
+
+        latents = _conditioning_latents(xtts, speaker_wav)
+        self._speaker_cache.put(key, latents)
+        return latents
+
+    def warm_up(self) -> None:
+        """Load the XTTS checkpoint and synthesize one short phrase with it.
+
+        The first inference also pays for kernel selection and allocator growth,
+        so a load alone would leave that cost on the first job. The reference clip
+        is a generated tone and its latents stay out of the speaker cache.
+        """
+
+        with TemporaryDirectory(prefix="xtts-warm-up-") as scratch:
+            reference = Path(scratch) / "reference.wav"
+            _write_tone(reference)
+            self._synthesize(
+                WARM_UP_TEXT,
+                reference,
+                self._language,
+                Path(scratch) / "warm_up.wav",
+                cache_speaker=False,
+            )
+
     def _get_model(self) -> TTS:
         if self._model is None:
-            try:
-                from TTS.api import TTS
-            except ModuleNotFoundError as exc:
-                raise RuntimeError(
-                    "Coqui TTS is not installed in this environment. "
-                    "Use the Docker deployment for full voice cloning support."
-                ) from exc
-
-            self._model = TTS(model_name=self._model_name, progress_bar=False, gpu=self._use_gpu)
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load_model()
         return self._model
+
+    def _load_model(self) -> TTS:
+        try:
+            from TTS.api import TTS
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                "Coqui TTS is not installed in this environment. "
+                "Use the Docker deployment for full voice cloning support."
+            ) from exc
+
+        with model_load_timer("xtts"):
+            return TTS(model_name=self._model_name, progress_bar=False, gpu=self._use_gpu)
+
+
+def _conditioning_latents(xtts: Any, speaker_wav: Path) -> SpeakerLatents:
+    config = xtts.config
+    gpt_cond_latent, speaker_embedding = xtts.get_conditioning_latents(
+        audio_path=[str(speaker_wav)],
+        gpt_cond_len=config.gpt_cond_len,
+        gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+        max_ref_length=config.max_ref_len,
+        sound_norm_refs=config.sound_norm_refs,
+    )
+    return gpt_cond_latent, speaker_embedding
+
+
+def _write_tone(path: Path, frequency: float = 220.0) -> None:
+    """Write a quiet mono sine tone usable as a stand-in reference clip."""
+
+    frames = WARM_UP_REFERENCE_SECONDS * WARM_UP_SAMPLE_RATE
+    samples = (
+        int(4000 * math.sin(2 * math.pi * frequency * index / WARM_UP_SAMPLE_RATE))
+        for index in range(frames)
+    )
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(WARM_UP_SAMPLE_RATE)
+        writer.writeframes(struct.pack(f"<{frames}h", *samples))
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import io
+import math
+import wave
+from bisect import bisect_right
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from app.core.config import Settings
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import (
+    PCM_SAMPLE_RATE,
+    is_normalized_pcm,
+    open_pcm,
+    pcm_to_float32,
+)
+from app.infrastructure.metrics.prometheus import model_load_timer
 
 if TYPE_CHECKING:
-    from faster_whisper import WhisperModel
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+# Whisper's window; the batched pipeline joins consecutive clips until they fill it.
+_BATCH_CLIP_SECONDS = 30
 
 
 class WhisperTranscriptionService:
@@ -15,26 +34,148 @@ class WhisperTranscriptionService:
     def __init__(self, settings: Settings) -> None:
         self._model_size = settings.whisper_model_size
         self._compute_type = settings.whisper_compute_type
+        self._num_workers = settings.whisper_num_workers
+        self._cpu_threads = settings.whisper_cpu_threads
+        self._language = settings.transcript_language
+        self._decode_options: dict[str, Any] = {"vad_filter": settings.whisper_vad_filter}
+        if settings.whisper_vad_filter:
+            # faster-whisper drops the non-speech spans before decoding and maps
+            # segment timestamps back onto the original timeline.
+            self._decode_options["vad_parameters"] = {
+                "threshold": settings.whisper_vad_threshold,
+                "min_silence_duration_ms": settings.whisper_vad_min_silence_ms,
+                "speech_pad_ms": settings.whisper_vad_speech_pad_ms,
+            }
+        self._batch_size = settings.whisper_batch_size
         self._model: WhisperModel | None = None
+        self._batched_pipeline: BatchedInferencePipeline | None = None
+        self._model_lock = Lock()
 
-    def transcribe(self, audio_path: Path, language: str) -> str:
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: Callable[[TranscriptSegment, float], None] | None = None,
+    ) -> str:
         model = self._get_model()
-        segments, _ = model.transcribe(str(audio_path), language=language)
+        # Normalized PCM is fed as samples so faster-whisper skips its own decode.
+        audio: object = str(audio_path)
+        if is_normalized_pcm(audio_path):
+            audio = pcm_to_float32(open_pcm(audio_path))
+        segments, info = model.transcribe(audio, language=language, **self._decode_options)
+        duration = float(getattr(info, "duration", 0.0) or 0.0)
 
         text_chunks: list[str] = []
         for segment in segments:
             segment_text = str(getattr(segment, "text", "")).strip()
-            if segment_text:
-                text_chunks.append(segment_text)
+            if not segment_text:
+                continue
+            text_chunks.append(segment_text)
+            if on_segment is not None:
+                end = float(segment.end)
+                progress = min(100.0, end / duration * 100) if duration > 0 else 0.0
+                on_segment(
+                    TranscriptSegment(start=float(segment.start), end=end, text=segment_text),
+                    progress,
+                )
+
+        return " ".join(text_chunks).strip()
+
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]:
+        """Transcribe several normalized PCM files in one batched inference pass.
+
+        Each file is padded with silence to whole 30-second slots and every slot
+        is one clip. The batched pipeline merges consecutive clips shorter than
+        its window, so full-window clips are what keep two files out of the same
+        decode. Each segment is mapped back to its file's own timeline.
+        """
+
+        pieces: list[np.ndarray] = []
+        starts: list[float] = []
+        durations: list[float] = []
+        clips: list[dict[str, float]] = []
+        slot_samples = _BATCH_CLIP_SECONDS * PCM_SAMPLE_RATE
+        offset = 0
+        for audio_path in audio_paths:
+            audio = pcm_to_float32(open_pcm(audio_path))
+            slots = math.ceil(len(audio) / slot_samples)
+            padded = np.zeros(slots * slot_samples, dtype=np.float32)
+            padded[: len(audio)] = audio
+            starts.append(float(offset))
+            durations.append(len(audio) / PCM_SAMPLE_RATE)
+            clips.extend(
+                {"start": float(start), "end": float(start + _BATCH_CLIP_SECONDS)}
+                for start in range(
+                    offset, offset + slots * _BATCH_CLIP_SECONDS, _BATCH_CLIP_SECONDS
+                )
+            )
+            pieces.append(padded)
+            offset += slots * _BATCH_CLIP_SECONDS
 
-        transcript = " ".join(text_chunks).strip()
-        if not transcript:
-            raise ValueError("Transcription result is empty")
-        return transcript
+        results: list[list[TranscriptSegment]] = [[] for _ in audio_paths]
+        if not clips:
+            return results
+        segments, _ = self._get_batched_pipeline().transcribe(
+            np.concatenate(pieces),
+            language=language,
+            clip_timestamps=clips,
+            batch_size=self._batch_size,
+        )
+        for segment in segments:
+            text = str(getattr(segment, "text", "")).strip()
+            if not text:
+                continue
+            start, end = float(segment.start), float(segment.end)
+            index = bisect_right(starts, (start + end) / 2) - 1
+            results[index].append(
+                TranscriptSegment(
+                    start=min(durations[index], max(0.0, start - starts[index])),
+                    end=min(durations[index], max(0.0, end - starts[index])),
+                    text=text,
+                )
+            )
+        return results
+
+    def warm_up(self) -> None:
+        """Load the model (and VAD model) and run one second of silence through them."""
+
+        silence = io.BytesIO()
+        with wave.open(silence, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(16_000)
+            writer.writeframes(b"\x00\x00" * 16_000)
+        silence.seek(0)
+
+        segments, _ = self._get_model().transcribe(
+            silence, language=self._language, **self._decode_options
+        )
+        for _ in segments:
+            pass
 
     def _get_model(self) -> WhisperModel:
         if self._model is None:
-            from faster_whisper import WhisperModel
+            with self._model_lock:
+                if self._model is None:
+                    from faster_whisper import WhisperModel
 
-            self._model = WhisperModel(self._model_size, compute_type=self._compute_type)
+                    with model_load_timer("whisper"):
+                        self._model = WhisperModel(
+                            self._model_size,
+                            compute_type=self._compute_type,
+                            cpu_threads=self._cpu_threads,
+                            num_workers=self._num_workers,
+                        )
         return self._model
+
+    def _get_batched_pipeline(self) -> BatchedInferencePipeline:
+        if self._batched_pipeline is None:
+            model = self._get_model()
+            with self._model_lock:
+                if self._batched_pipeline is None:
+                    from faster_whisper import BatchedInferencePipeline
+
+                    self._batched_pipeline = BatchedInferencePipeline(model=model)
+        return self._batched_pipeline
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+from app.core.config import Settings
+from app.domain.models import TranscriptSegment
+from app.infrastructure.speech.coqui_voice_cloner import CoquiVoiceCloningService
+from app.infrastructure.speech.faster_whisper_transcriber import WhisperTranscriptionService
+from app.infrastructure.workers.model_pool import ModelWorkerPool
+
+
+class ProcessTranscriptionService:
+    """Run faster-whisper transcription inside long-lived worker processes."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.pool = ModelWorkerPool(
+            name="transcribe",
+            factory=WhisperTranscriptionService,
+            settings=settings,
+            processes=settings.transcribe_worker_processes,
+            call_timeout=settings.model_call_timeout_seconds,
+        )
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: Callable[[TranscriptSegment, float], None] | None = None,
+    ) -> str:
+        return cast(
+            str,
+            self.pool.call(
+                "transcribe",
+                on_event=None if on_segment is None else ("on_segment", on_segment),
+                audio_path=audio_path,
+                language=language,
+            ),
+        )
+
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]:
+        return cast(
+            list[list[TranscriptSegment]],
+            self.pool.call("transcribe_many", audio_paths=audio_paths, language=language),
+        )
+
+    def warm_up(self) -> None:
+        self.pool.broadcast("warm_up")
+
+
+class ProcessVoiceCloningService:
+    """Run Coqui XTTS synthesis inside long-lived worker processes."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.pool = ModelWorkerPool(
+            name="synthesize",
+            factory=CoquiVoiceCloningService,
+            settings=settings,
+            processes=settings.synthesize_worker_processes,
+            call_timeout=settings.model_call_timeout_seconds,
+        )
+
+    def synthesize(self, text: str, speaker_wav: Path, language: str, output_path: Path) -> Path:
+        return cast(
+            Path,
+            self.pool.call(
+                "synthesize",
+                text=text,
+                speaker_wav=speaker_wav,
+                language=language,
+                output_path=output_path,
+            ),
+        )
+
+    def warm_up(self) -> None:
+        self.pool.broadcast("warm_up")
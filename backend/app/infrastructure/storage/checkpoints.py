@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from uuid import UUID, uuid4
+
+_PATH_KEY = "$path"
+
+
+class StageCheckpointStore:
+    """Persist the outputs of completed pipeline stages so jobs can resume.
+
+    Each stage is one JSON file under ``{job_id}_checkpoints/`` written atomically,
+    so stages finishing concurrently never contend for the same file. A checkpoint
+    whose referenced files have disappeared counts as missing and the stage runs
+    again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    def get(self, job_id: UUID, stage: str) -> dict[str, object] | None:
+        try:
+            raw = json.loads(self._stage_path(job_id, stage).read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        outputs = {key: _decode(value) for key, value in raw.items()}
+        if any(isinstance(value, Path) and not value.exists() for value in outputs.values()):
+            return None
+        return outputs
+
+    def save(self, job_id: UUID, stage: str, outputs: Mapping[str, object]) -> None:
+        path = self._stage_path(job_id, stage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        staging.write_text(
+            json.dumps({key: _encode(value) for key, value in outputs.items()}),
+            encoding="utf-8",
+        )
+        os.replace(staging, path)
+
+    def completed_stages(self, job_id: UUID) -> set[str]:
+        return {path.stem for path in self._job_dir(job_id).glob("*.json")}
+
+    def discard(self, job_id: UUID, stages: Iterable[str] | None = None) -> None:
+        """Forget the given stages of a job, or all of them when ``stages`` is None."""
+
+        if stages is None:
+            shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+            return
+        for stage in stages:
+            self._stage_path(job_id, stage).unlink(missing_ok=True)
+
+    def _job_dir(self, job_id: UUID) -> Path:
+        return self._directory / f"{job_id}_checkpoints"
+
+    def _stage_path(self, job_id: UUID, stage: str) -> Path:
+        return self._job_dir(job_id) / f"{stage}.json"
+
+
+def _encode(value: object) -> object:
+    return {_PATH_KEY: str(value)} if isinstance(value, Path) else value
+
+
+def _decode(value: object) -> object:
+    if isinstance(value, dict) and set(value) == {_PATH_KEY}:
+        return Path(value[_PATH_KEY])
+    return value
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from uuid import UUID, uuid4
 
@@ -7,6 +10,15 @@ import aiofiles
 from fastapi import UploadFile
 
 from app.core.config import Settings
+from app.domain.enums import AudioFormat
+from app.domain.models import JobRecord
+
+
+@dataclass(frozen=True, slots=True)
+class StoredUpload:
+    path: Path
+    sha256: str
+    size_bytes: int
 
 
 class FileStorageService:
@@ -18,15 +30,21 @@ class FileStorageService:
         self._uploads_dir = settings.uploads_dir
         self._outputs_dir = settings.outputs_dir
 
-    async def save_uploaded_audio(self, upload: UploadFile) -> Path:
+    async def save_uploaded_audio(self, upload: UploadFile) -> StoredUpload:
         filename = upload.filename or "audio.wav"
         suffix = Path(filename).suffix.lower() or ".wav"
         if suffix not in self._ALLOWED_EXTENSIONS:
             raise ValueError(f"Unsupported file extension: {suffix}")
 
         stored_path = self._uploads_dir / f"{uuid4()}{suffix}"
-        await self._write_upload(upload, stored_path)
-        return stored_path
+        digest, size_bytes = await self._write_upload(upload, stored_path)
+        return StoredUpload(path=stored_path, sha256=digest, size_bytes=size_bytes)
+
+    @staticmethod
+    def build_pcm_audio_path(audio_input_path: Path) -> Path:
+        """Location of the decoded 16 kHz mono PCM copy, next to the original upload."""
+
+        return audio_input_path.with_name(f"{audio_input_path.stem}.pcm16k.wav")
 
     def build_reference_clip_path(self, job_id: UUID) -> Path:
         return self._outputs_dir / f"{job_id}_reference.wav"
@@ -37,19 +55,53 @@ class FileStorageService:
     def build_output_audio_path(self, job_id: UUID) -> Path:
         return self._outputs_dir / f"{job_id}.wav"
 
+    def build_encoded_audio_path(self, job_id: UUID, extension: str) -> Path:
+        """Compressed copy of the output WAV, cached next to it."""
+
+        return self._outputs_dir / f"{job_id}.{extension}"
+
+    def build_audio_chunks_dir(self, job_id: UUID) -> Path:
+        return self._outputs_dir / f"{job_id}_chunks"
+
     def save_transcript(self, job_id: UUID, transcript_text: str) -> Path:
         transcript_path = self.build_transcript_path(job_id)
         transcript_path.parent.mkdir(parents=True, exist_ok=True)
         transcript_path.write_text(transcript_text, encoding="utf-8")
         return transcript_path
 
+    def delete_job_files(self, job: JobRecord) -> None:
+        """Remove the job's upload, its PCM copy and every artifact written for it."""
+
+        paths = [
+            job.audio_input_path,
+            self.build_pcm_audio_path(job.audio_input_path),
+            self.build_output_audio_path(job.id),
+            *(
+                self.build_encoded_audio_path(job.id, audio_format)
+                for audio_format in AudioFormat
+                if audio_format != AudioFormat.WAV
+            ),
+            self.build_reference_clip_path(job.id),
+            self.build_transcript_path(job.id),
+        ]
+        for path in paths:
+            path.unlink(missing_ok=True)
+        shutil.rmtree(self.build_audio_chunks_dir(job.id), ignore_errors=True)
+
     @staticmethod
-    async def _write_upload(upload: UploadFile, target: Path) -> None:
+    async def _write_upload(upload: UploadFile, target: Path) -> tuple[str, int]:
+        """Stream the upload to disk, hashing it on the way; returns (sha256, size)."""
+
         target.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size_bytes = 0
         async with aiofiles.open(target, "wb") as output:
             while True:
                 chunk = await upload.read(1024 * 1024)
                 if not chunk:
                     break
+                digest.update(chunk)
+                size_bytes += len(chunk)
                 await output.write(chunk)
         await upload.close()
+        return digest.hexdigest(), size_bytes
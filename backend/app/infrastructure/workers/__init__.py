@@ -0,0 +1 @@
+"""Long-lived worker processes hosting model-heavy services."""
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from queue import Empty
+from threading import Lock, Thread
+from typing import Any
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+ServiceFactory = Callable[[Settings], object]
+
+_POLL_SECONDS = 0.5
+_JOIN_SECONDS = 5.0
+_RESULT, _ERROR, _EVENT = "result", "error", "event"
+
+
+class ModelWorkerError(RuntimeError):
+    """Raised when a model worker process fails a call or exits unexpectedly."""
+
+
+def _serve(
+    index: int,
+    factory: ServiceFactory,
+    settings: Settings,
+    tasks: Queue[Any],
+    results: Queue[Any],
+) -> None:
+    """Worker process entry point: build the service once, then answer calls."""
+
+    service = factory(settings)
+    while True:
+        message = tasks.get()
+        if message is None:
+            return
+        task_id, method, kwargs, event_kwarg = message
+        if event_kwarg is not None:
+            kwargs[event_kwarg] = _event_forwarder(index, task_id, results)
+        try:
+            result = getattr(service, method)(**kwargs)
+        except Exception as exc:
+            results.put((index, task_id, _ERROR, str(exc) or type(exc).__name__))
+        else:
+            results.put((index, task_id, _RESULT, result))
+
+
+def _event_forwarder(index: int, task_id: int, results: Queue[Any]) -> Callable[..., None]:
+    def forward(*args: object) -> None:
+        results.put((index, task_id, _EVENT, args))
+
+    return forward
+
+
+@dataclass(slots=True)
+class _Task:
+    future: Future[object]
+    on_event: Callable[..., None] | None
+
+
+@dataclass(slots=True)
+class _Worker:
+    process: BaseProcess
+    tasks: Queue[Any]
+    in_flight: dict[int, _Task] = field(default_factory=dict)
+
+
+class ModelWorkerPool:
+    """Long-lived worker processes that each keep one model service loaded.
+
+    Calls cross the process boundary as ``(method, kwargs)`` and must carry only
+    small picklable values such as paths and text. A call may name one keyword
+    argument as an event callback; the worker passes in a forwarder and every
+    invocation is relayed to ``on_event`` in the parent process.
+
+    ``call_timeout`` bounds how long ``call`` waits; a worker that overruns it is
+    treated as hung and restarted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: ServiceFactory,
+        settings: Settings,
+        processes: int,
+        call_timeout: float | None = None,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+
+        self._name = name
+        self._call_timeout = call_timeout
+        self._factory = factory
+        self._settings = settings
+        self._size = processes
+        self._context = multiprocessing.get_context("spawn")
+        self._results: Queue[Any] = self._context.Queue()
+        self._workers: list[_Worker] = []
+        self._task_ids = itertools.count()
+        self._dispatcher: Thread | None = None
+        self._stopping = False
+        self._lock = Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._workers or self._stopping:
+                return
+            self._workers = [self._spawn(index) for index in range(self._size)]
+            self._dispatcher = Thread(
+                target=self._dispatch, name=f"{self._name}-dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+
+    def submit(
+        self,
+        method: str,
+        *,
+        on_event: tuple[str, Callable[..., None]] | None = None,
+        **kwargs: object,
+    ) -> Future[object]:
+        """Queue a call on the least busy worker.
+
+        ``on_event`` is ``(keyword, callback)``: the remote method receives a
+        callable under ``keyword`` whose calls are replayed through ``callback``.
+        """
+
+        return self._submit(method, kwargs, on_event)[1]
+
+    def call(
+        self,
+        method: str,
+        *,
+        on_event: tuple[str, Callable[..., None]] | None = None,
+        **kwargs: object,
+    ) -> object:
+        worker, future = self._submit(method, kwargs, on_event)
+        try:
+            return future.result(timeout=self._call_timeout)
+        except TimeoutError:
+            # Kill the stuck worker and swap in a fresh one before returning, so
+            # the next call does not land on it; its other calls fail.
+            logger.error(
+                "%s call %s timed out after %ss, restarting its worker",
+                self._name,
+                method,
+                self._call_timeout,
+            )
+            worker.process.terminate()
+            worker.process.join(timeout=_JOIN_SECONDS)
+            self._replace_dead_workers()
+            raise ModelWorkerError(
+                f"{self._name} call {method} timed out after {self._call_timeout} seconds"
+            ) from None
+
+    def broadcast(self, method: str, **kwargs: object) -> list[object]:
+        """Run the same call once on every worker process and wait for all of them."""
+
+        self.start()
+        with self._lock:
+            self._ensure_running()
+            futures = [self._enqueue(worker, method, kwargs, None) for worker in self._workers]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            workers = list(self._workers)
+        for worker in workers:
+            worker.tasks.put(None)
+        for worker in workers:
+            worker.process.join(timeout=_JOIN_SECONDS)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=_JOIN_SECONDS)
+        self._fail_in_flight(workers, f"{self._name} worker pool is shut down")
+
+    def _submit(
+        self,
+        method: str,
+        kwargs: dict[str, object],
+        on_event: tuple[str, Callable[..., None]] | None,
+    ) -> tuple[_Worker, Future[object]]:
+        self.start()
+        with self._lock:
+            self._ensure_running()
+            worker = min(self._workers, key=lambda candidate: len(candidate.in_flight))
+            return worker, self._enqueue(worker, method, kwargs, on_event)
+
+    def _ensure_running(self) -> None:
+        if self._stopping:
+            raise ModelWorkerError(f"{self._name} worker pool is shut down")
+
+    def _enqueue(
+        self,
+        worker: _Worker,
+        method: str,
+        kwargs: dict[str, object],
+        on_event: tuple[str, Callable[..., None]] | None,
+    ) -> Future[object]:
+        task_id = next(self._task_ids)
+        future: Future[object] = Future()
+        event_kwarg, callback = (None, None) if on_event is None else on_event
+        worker.in_flight[task_id] = _Task(future=future, on_event=callback)
+        worker.tasks.put((task_id, method, kwargs, event_kwarg))
+        return future
+
+    def _spawn(self, index: int) -> _Worker:
+        tasks: Queue[Any] = self._context.Queue()
+        process = self._context.Process(
+            target=_serve,
+            args=(index, self._factory, self._settings, tasks, self._results),
+            name=f"{self._name}-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        return _Worker(process=process, tasks=tasks)
+
+    def _dispatch(self) -> None:
+        next_check = time.monotonic() + _POLL_SECONDS
+        while not self._stopping:
+            try:
+                message = self._results.get(timeout=_POLL_SECONDS)
+            except Empty:
+                message = None
+            # Check on a timer rather than only when idle, so steady event traffic
+            # from healthy workers cannot hide one that died.
+            if time.monotonic() >= next_check:
+                self._replace_dead_workers()
+                next_check = time.monotonic() + _POLL_SECONDS
+            if message is None:
+                continue
+            index, task_id, kind, payload = message
+
+            with self._lock:
+                in_flight = self._workers[index].in_flight
+                task = in_flight.get(task_id) if kind == _EVENT else in_flight.pop(task_id, None)
+            if task is None:
+                continue
+            if kind == _EVENT:
+                self._relay_event(task, payload)
+            elif kind == _RESULT:
+                task.future.set_result(payload)
+            else:
+                task.future.set_exception(ModelWorkerError(payload))
+
+    def _relay_event(self, task: _Task, args: tuple[object, ...]) -> None:
+        if task.on_event is None:
+            return
+        try:
+            task.on_event(*args)
+        except Exception:
+            logger.exception("%s event callback failed", self._name)
+
+    def _replace_dead_workers(self) -> None:
+        with self._lock:
+            if self._stopping:
+                return
+            for index, worker in enumerate(self._workers):
+                if worker.process.is_alive():
+                    continue
+                logger.error(
+                    "%s worker %d exited with code %s, restarting",
+                    self._name,
+                    index,
+                    worker.process.exitcode,
+                )
+                self._fail_in_flight(
+                    [worker],
+                    f"{self._name} worker exited with code {worker.process.exitcode}",
+                )
+                self._workers[index] = self._spawn(index)
+
+    @staticmethod
+    def _fail_in_flight(workers: list[_Worker], message: str) -> None:
+        for worker in workers:
+            for task in worker.in_flight.values():
+                if not task.future.done():
+                    task.future.set_exception(ModelWorkerError(message))
+            worker.in_flight.clear()
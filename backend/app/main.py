@@ -1,26 +1,9 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-from app.api.routes.health import router as health_router
-from app.api.routes.jobs import router as jobs_router
+from app.api.factory import create_app
 from app.core.config import get_settings
 from app.core.container import build_container
 
 settings = get_settings()
 container = build_container(settings)
-
-app = FastAPI(title=settings.app_name)
-app.state.container = container
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=list(settings.cors_origins),
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(health_router)
-app.include_router(jobs_router, prefix=settings.api_prefix)
+app = create_app(container)
@@ -0,0 +1,90 @@
+"""Microbenchmark for JobManager status polling.
+
+Compares reading jobs from the manager (frozen snapshots, no copies) with the
+previous deep-copy-per-read and dump/validate-per-update approach, on jobs that
+carry a realistic transcript. Run from the repository root:
+
+    python backend/benchmarks/job_manager_reads.py --jobs 200 --polls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.domain.enums import Genre
+from app.domain.models import JobPreferences, JobRecord, TranscriptSegment
+from app.infrastructure.jobs.manager import JobManager
+
+
+def _populate(manager: JobManager, jobs: int, segments: int) -> list[JobRecord]:
+    transcript = tuple(
+        TranscriptSegment(start=index * 4.0, end=index * 4.0 + 4.0, text="word " * 12)
+        for index in range(segments)
+    )
+    created = []
+    for index in range(jobs):
+        job = manager.create_job(
+            audio_input_path=Path(f"/tmp/{index}.wav"),
+            preferences=JobPreferences(target_minutes=3, genre=Genre.GENERAL),
+        )
+        manager.mark_running(job.id)
+        created.append(
+            manager.mark_transcribed(job.id, segments=list(transcript)).model_copy(
+                update={"transcript_text": " ".join(segment.text for segment in transcript)}
+            )
+        )
+    return created
+
+
+def _legacy_update(job: JobRecord, **updates: object) -> JobRecord:
+    merged = job.model_dump()
+    merged.update(updates)
+    merged["updated_at"] = datetime.now(UTC)
+    return JobRecord.model_validate(merged)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--segments", type=int, default=400)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    manager = JobManager()
+    jobs = _populate(manager, args.jobs, args.segments)
+    ids = [job.id for job in jobs]
+
+    def snapshot_reads() -> None:
+        for job_id in ids:
+            manager.get_job(job_id)
+
+    def deep_copy_reads() -> None:
+        for job in jobs:
+            job.model_copy(deep=True)
+
+    def snapshot_updates() -> None:
+        for job_id in ids:
+            manager.record_synthesis_progress(job_id, ready=1, total=4)
+
+    def legacy_updates() -> None:
+        for job in jobs:
+            _legacy_update(job, synthesis_chunks_ready=1, synthesis_chunks_total=4)
+
+    cases = (
+        ("get_job (snapshot)", snapshot_reads),
+        ("get_job (deep copy)", deep_copy_reads),
+        ("update (model_copy)", snapshot_updates),
+        ("update (dump/validate)", legacy_updates),
+    )
+    print(f"{args.jobs} jobs x {args.segments} segments, {args.polls} rounds")
+    for label, case in cases:
+        seconds = min(timeit.repeat(case, number=args.polls, repeat=3))
+        per_call_us = seconds / (args.polls * args.jobs) * 1e6
+        print(f"{label:<24} {per_call_us:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""Offline end-to-end throughput benchmark for the job pipeline.
+
+Builds the real service container and FastAPI routes, but replaces Whisper and
+XTTS with deterministic fakes that sleep for a configurable time, and points
+the Llama summarizer at a local fake Ollama server. N uploads of varying
+length are replayed concurrently; the report gives end-to-end latency
+percentiles, jobs/sec, mean per-stage wall time and peak RSS, so scheduler,
+store and batching changes can be compared without GPUs or network access.
+Run from the repository root:
+
+    python backend/benchmarks/pipeline_throughput.py --jobs 40 --concurrency 8 \\
+        --set JOB_WORKERS=4 --set JOB_STORE_BACKEND=sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+
+import httpx
+import numpy as np
+from app.api.factory import create_app
+from app.application.ports import SegmentCallback
+from app.core.config import Settings, ensure_directories
+from app.core.container import build_container
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import PCM_SAMPLE_RATE, write_pcm_wav
+
+SEGMENT_SECONDS = 5.0
+FINISHED = {"completed", "failed"}
+WORDS = (
+    "market growth policy signal model latency budget release customer region "
+    "quarter forecast network storage research decision meeting summary"
+).split()
+
+
+def _words(count: int, seed: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _wav_duration(path: Path) -> float:
+    with wave.open(str(path), "rb") as reader:
+        return reader.getnframes() / reader.getframerate()
+
+
+class FakeTranscriber:
+    """Whisper stand-in: ``rtf`` seconds of work per audio second, one segment per 5 s."""
+
+    def __init__(self, rtf: float) -> None:
+        self._rtf = rtf
+
+    def _segments(self, audio_path: Path) -> list[TranscriptSegment]:
+        duration = _wav_duration(audio_path)
+        seed = int(duration * 1000)
+        segments: list[TranscriptSegment] = []
+        start = 0.0
+        while start < duration:
+            end = min(duration, start + SEGMENT_SECONDS)
+            text = _words(12, seed + len(segments))
+            segments.append(TranscriptSegment(start=start, end=end, text=text))
+            start = end
+        return segments
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str,
+        on_segment: SegmentCallback | None = None,
+    ) -> str:
+        segments = self._segments(audio_path)
+        duration = segments[-1].end if segments else 0.0
+        for segment in segments:
+            time.sleep((segment.end - segment.start) * self._rtf)
+            if on_segment is not None:
+                on_segment(segment, segment.end / duration * 100)
+        return " ".join(segment.text for segment in segments)
+
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]:
+        results = [self._segments(path) for path in audio_paths]
+        time.sleep(
+            max((segments[-1].end for segments in results if segments), default=0) * self._rtf
+        )
+        return results
+
+    def warm_up(self) -> None:
+        pass
+
+
+class FakeVoiceCloner:
+    """XTTS stand-in: sleeps per character and writes ~1 s of silence per 15 characters."""
+
+    def __init__(self, seconds_per_char: float) -> None:
+        self._seconds_per_char = seconds_per_char
+
+    def synthesize(self, text: str, speaker_wav: Path, language: str, output_path: Path) -> Path:
+        time.sleep(len(text) * self._seconds_per_char)
+        frames = max(1, len(text) // 15) * PCM_SAMPLE_RATE
+        return write_pcm_wav(output_path, np.zeros(frames, dtype=np.int16))
+
+    def warm_up(self) -> None:
+        pass
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    latency_seconds = 0.5
+    summary_words = 60
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path != "/api/chat":
+            self.send_error(404)
+            return
+
+        prompt = str(body.get("messages", [{}])[-1].get("content", ""))
+        words = _words(self.summary_words, len(prompt)).split()
+        model = body.get("model", "fake")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        pieces = [" ".join(words[index : index + 8]) + " " for index in range(0, len(words), 8)]
+        for piece in pieces:
+            time.sleep(self.latency_seconds / len(pieces))
+            message = {"role": "assistant", "content": piece}
+            self._write_line({"model": model, "message": message, "done": False})
+        self._write_line(
+            {
+                "model": model,
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+                "done_reason": "stop",
+                "eval_count": len(words),
+            }
+        )
+
+    def _write_line(self, payload: dict[str, object]) -> None:
+        self.wfile.write(json.dumps(payload).encode() + b"\n")
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@contextmanager
+def fake_ollama(latency_seconds: float) -> Iterator[str]:
+    """Serve a minimal streaming ``/api/chat`` on a free local port."""
+
+    handler = type("Handler", (_FakeOllamaHandler,), {"latency_seconds": latency_seconds})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = Thread(target=server.serve_forever, name="fake-ollama", daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _upload(seconds: float, seed: int) -> bytes:
+    """16 kHz mono PCM WAV of tone bursts separated by pauses, so no decode is needed."""
+
+    rng = np.random.default_rng(seed)
+    samples = np.zeros(int(seconds * PCM_SAMPLE_RATE), dtype=np.float32)
+    position = 0
+    while position < len(samples):
+        burst = int(rng.uniform(0.5, 3.0) * PCM_SAMPLE_RATE)
+        t = np.arange(min(burst, len(samples) - position)) / PCM_SAMPLE_RATE
+        samples[position : position + len(t)] = 0.3 * np.sin(2 * np.pi * rng.uniform(120, 300) * t)
+        position += burst + int(rng.uniform(0.2, 1.0) * PCM_SAMPLE_RATE)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(PCM_SAMPLE_RATE)
+        writer.writeframes((samples * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+@dataclass(frozen=True, slots=True)
+class JobResult:
+    status: str
+    latency_seconds: float
+    stages: dict[str, float]
+
+
+async def _run_job(
+    client: httpx.AsyncClient, api_prefix: str, audio: bytes, index: int
+) -> JobResult:
+    started = time.perf_counter()
+    while True:
+        response = await client.post(
+            f"{api_prefix}/jobs",
+            files={"audio_file": (f"upload-{index}.wav", audio, "audio/wav")},
+            data={"genre": "general", "target_minutes": "1"},
+        )
+        if response.status_code != 429:
+            break
+        await asyncio.sleep(0.2)
+    response.raise_for_status()
+    job_id = response.json()["job_id"]
+
+    version = -1
+    while True:
+        response = await client.get(
+            f"{api_prefix}/jobs/{job_id}", params={"wait": 30, "since_version": version}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        version = payload["version"]
+        if payload["status"] in FINISHED:
+            stages = {
+                stage["stage"]: stage["wall_seconds"] for stage in payload["timings"]["stages"]
+            }
+            return JobResult(payload["status"], time.perf_counter() - started, stages)
+
+
+async def _replay(
+    settings: Settings, args: argparse.Namespace, uploads: list[bytes]
+) -> tuple[list[JobResult], float]:
+    container = build_container(
+        settings,
+        stt_backend=FakeTranscriber(args.stt_rtf),
+        tts_backend=FakeVoiceCloner(args.tts_seconds_per_char),
+    )
+    app = create_app(container)
+    transport = httpx.ASGITransport(app=app)
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(audio: bytes, index: int) -> JobResult:
+        async with limit:
+            return await _run_job(client, settings.api_prefix, audio, index)
+
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client,
+    ):
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(bounded(audio, index) for index, audio in enumerate(uploads))
+        )
+        return list(results), time.perf_counter() - started
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / scale
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8, help="uploads in flight at once")
+    parser.add_argument("--min-seconds", type=float, default=20.0, help="shortest upload")
+    parser.add_argument("--max-seconds", type=float, default=180.0, help="longest upload")
+    parser.add_argument("--stt-rtf", type=float, default=0.02, help="fake STT s per audio s")
+    parser.add_argument("--llm-seconds", type=float, default=0.3, help="fake LLM s per call")
+    parser.add_argument(
+        "--tts-seconds-per-char", type=float, default=0.001, help="fake TTS s per character"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="extra setting by environment name, e.g. JOB_WORKERS=4 (repeatable)",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    durations = [rng.uniform(args.min_seconds, args.max_seconds) for _ in range(args.jobs)]
+    uploads = [_upload(seconds, args.seed + index) for index, seconds in enumerate(durations)]
+    overrides = dict(item.split("=", 1) for item in args.set)
+
+    with (
+        tempfile.TemporaryDirectory(prefix="vs-bench-") as tmp,
+        fake_ollama(args.llm_seconds) as ollama_url,
+    ):
+        data = Path(tmp)
+        settings = Settings.model_validate(
+            {
+                "UPLOADS_DIR": data / "uploads",
+                "OUTPUTS_DIR": data / "outputs",
+                "CACHE_DIR": data / "cache",
+                "JOB_STORE_PATH": data / "jobs.sqlite3",
+                "OLLAMA_BASE_URL": ollama_url,
+                "PRELOAD_MODELS": False,
+                "TRANSCRIPT_CACHE_ENABLED": False,
+                "SUMMARY_CACHE_ENABLED": False,
+                **overrides,
+            }
+        )
+        ensure_directories(settings)
+        results, elapsed = asyncio.run(_replay(settings, args, uploads))
+
+    latencies = sorted(result.latency_seconds for result in results)
+    failed = sum(result.status != "completed" for result in results)
+    stage_times: dict[str, list[float]] = defaultdict(list)
+    for result in results:
+        for stage, seconds in result.stages.items():
+            stage_times[stage].append(seconds)
+
+    print(
+        f"{args.jobs} jobs ({args.min_seconds:.0f}-{args.max_seconds:.0f}s audio, "
+        f"{sum(durations) / 60:.1f} min total), concurrency {args.concurrency}"
+        + (f", {' '.join(args.set)}" if args.set else "")
+    )
+    print(f"completed {len(results) - failed}, failed {failed}, wall {elapsed:.2f}s")
+    print(f"throughput   {len(results) / elapsed:8.2f} jobs/s")
+    for percent in (50, 95, 99):
+        print(f"latency p{percent:<3} {_percentile(latencies, percent):8.2f} s")
+    for stage, samples in stage_times.items():
+        print(f"stage {stage:<22} {statistics.fmean(samples):8.3f} s mean")
+    print(f"peak RSS     {_peak_rss_mb():8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
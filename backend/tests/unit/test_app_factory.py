@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+from app.api.factory import run_periodically
+
+
+@pytest.mark.asyncio
+async def test_periodic_task_survives_a_raising_iteration(caplog: pytest.LogCaptureFixture) -> None:
+    calls = 0
+    recovered = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def heartbeat() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("database is locked")
+        loop.call_soon_threadsafe(recovered.set)
+
+    task = asyncio.create_task(run_periodically(heartbeat, 0.01))
+    try:
+        await asyncio.wait_for(recovered.wait(), 5)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert calls >= 2
+    assert "database is locked" in caplog.text
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from email.utils import formatdate
+
+import pytest
+from app.api.audio_formats import is_not_modified, negotiate_audio_format
+from app.domain.enums import AudioFormat
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, AudioFormat.MP3),
+        ("*/*", AudioFormat.MP3),
+        ("audio/wav", AudioFormat.WAV),
+        ("audio/ogg, audio/mpeg;q=0.9", AudioFormat.OPUS),
+        ("audio/*;q=0.5, audio/x-wav", AudioFormat.WAV),
+        ("audio/mpeg;q=0, audio/*", AudioFormat.OPUS),
+        ("audio/flac", None),
+        ("audio/*;q=0", None),
+    ],
+)
+def test_negotiate_audio_format(accept: str | None, expected: AudioFormat | None) -> None:
+    assert negotiate_audio_format(accept, default=AudioFormat.MP3) == expected
+
+
+def test_is_not_modified_prefers_etag_over_date() -> None:
+    etag = '"abc"'
+    modified = 1_700_000_000.5
+
+    assert is_not_modified({"if-none-match": 'W/"abc", "def"'}, etag, modified)
+    assert not is_not_modified(
+        {"if-none-match": '"old"', "if-modified-since": formatdate(modified + 60, usegmt=True)},
+        etag,
+        modified,
+    )
+    assert is_not_modified({"if-modified-since": formatdate(modified, usegmt=True)}, etag, modified)
+    assert not is_not_modified(
+        {"if-modified-since": formatdate(modified - 60, usegmt=True)}, etag, modified
+    )
+    assert not is_not_modified({"if-modified-since": "yesterday"}, etag, modified)
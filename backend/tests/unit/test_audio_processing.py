@@ -1,7 +1,29 @@
 from __future__ import annotations
 
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
 import pytest
-from app.infrastructure.audio.processing import minutes_to_target_words
+from app.infrastructure.audio.processing import (
+    PCM_SAMPLE_RATE,
+    decode_to_pcm,
+    encode_audio,
+    extract_reference_clip,
+    minutes_to_target_words,
+    open_pcm,
+    select_speech_window,
+)
+
+
+def _write_pcm(path: Path, samples: np.ndarray, frame_rate: int = PCM_SAMPLE_RATE) -> Path:
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(frame_rate)
+        writer.writeframes(samples.astype("<i2").tobytes())
+    return path
 
 
 def test_minutes_to_target_words_uses_default_rate() -> None:
@@ -18,3 +40,68 @@ def test_minutes_to_target_words_rejects_invalid_values() -> None:
 
     with pytest.raises(ValueError):
         minutes_to_target_words(minutes=2, words_per_minute=70)
+
+
+def test_normalized_pcm_upload_is_used_without_decoding(tmp_path: Path) -> None:
+    samples = np.arange(3 * PCM_SAMPLE_RATE, dtype=np.int16)
+    upload = _write_pcm(tmp_path / "upload.wav", samples)
+
+    pcm_path = decode_to_pcm(upload, tmp_path / "upload.pcm16k.wav")
+
+    assert pcm_path == upload
+    mapped = open_pcm(pcm_path)
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(mapped, samples)
+
+
+def test_reference_clip_is_sliced_from_pcm_samples(tmp_path: Path) -> None:
+    samples = np.arange(3 * PCM_SAMPLE_RATE, dtype=np.int16)
+    source = _write_pcm(tmp_path / "source.wav", samples)
+
+    clip = extract_reference_clip(source, tmp_path / "clip.wav", seconds=2)
+
+    assert np.array_equal(open_pcm(clip), samples[: 2 * PCM_SAMPLE_RATE])
+
+
+def test_reference_clip_reads_only_the_prefix_of_other_wavs(tmp_path: Path) -> None:
+    source = tmp_path / "stereo.wav"
+    with wave.open(str(source), "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(8_000)
+        writer.writeframes(np.arange(2 * 8_000 * 5, dtype="<i2").tobytes())
+
+    clip = extract_reference_clip(source, tmp_path / "clip.wav", seconds=2)
+
+    with wave.open(str(clip), "rb") as reader:
+        assert (reader.getnchannels(), reader.getframerate()) == (2, 8_000)
+        assert reader.getnframes() == 2 * 8_000
+
+
+def test_select_speech_window_skips_leading_silence() -> None:
+    rng = np.random.default_rng(0)
+    rate = PCM_SAMPLE_RATE
+    samples = np.concatenate(
+        (
+            rng.normal(0, 20, 10 * rate),
+            rng.normal(0, 6000, 4 * rate),
+            rng.normal(0, 20, 6 * rate),
+        )
+    ).astype(np.int16)
+
+    start = select_speech_window(samples, rate, seconds=3)
+
+    assert 9.9 * rate <= start <= 11 * rate
+    assert select_speech_window(samples[: 2 * rate], rate, seconds=3) == 0
+
+
+def test_encode_audio_reuses_encode_newer_than_source(tmp_path: Path) -> None:
+    source = _write_pcm(tmp_path / "summary.wav", np.zeros(PCM_SAMPLE_RATE, dtype=np.int16))
+    encoded = tmp_path / "summary.opus"
+    encoded.write_bytes(b"OggS")
+    os.utime(source, (1_000, 1_000))
+
+    assert encode_audio(source, encoded, codec="opus", bitrate_kbps=32) == encoded
+    assert encoded.read_bytes() == b"OggS"
+    with pytest.raises(ValueError, match="Unsupported codec"):
+        encode_audio(source, tmp_path / "summary.flac", codec="flac", bitrate_kbps=32)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+from app.application.batched_transcription import MicroBatchingTranscriber
+from app.application.ports import SegmentCallback
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import PCM_SAMPLE_RATE, write_pcm_wav
+
+
+class RecordingBatchBackend:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.single_calls: list[str] = []
+        self._lock = Lock()
+
+    def transcribe(
+        self, audio_path: Path, language: str, on_segment: SegmentCallback | None = None
+    ) -> str:
+        with self._lock:
+            self.single_calls.append(audio_path.stem)
+        return audio_path.stem
+
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]:
+        with self._lock:
+            self.batches.append([path.stem for path in audio_paths])
+        return [[TranscriptSegment(start=0, end=1, text=path.stem)] for path in audio_paths]
+
+    def warm_up(self) -> None:
+        pass
+
+
+def _clip(tmp_path: Path, name: str, seconds: int) -> Path:
+    return write_pcm_wav(tmp_path / f"{name}.wav", np.zeros(seconds * PCM_SAMPLE_RATE, np.int16))
+
+
+def test_concurrent_short_requests_share_one_batch(tmp_path: Path) -> None:
+    backend = RecordingBatchBackend()
+    transcriber = MicroBatchingTranscriber(backend, window_seconds=5.0, max_files=3, max_seconds=10)
+    clips = [_clip(tmp_path, f"clip{index}", 2) for index in range(3)]
+    progress: list[float] = []
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        texts = list(
+            executor.map(
+                lambda path: transcriber.transcribe(
+                    path, "en", on_segment=lambda _, percent: progress.append(percent)
+                ),
+                clips,
+            )
+        )
+
+    assert texts == ["clip0", "clip1", "clip2"]
+    assert len(backend.batches) == 1
+    assert sorted(backend.batches[0]) == ["clip0", "clip1", "clip2"]
+    assert progress == [50.0, 50.0, 50.0]
+
+
+def test_long_recordings_bypass_batching(tmp_path: Path) -> None:
+    backend = RecordingBatchBackend()
+    transcriber = MicroBatchingTranscriber(backend, window_seconds=5.0, max_files=3, max_seconds=1)
+
+    assert transcriber.transcribe(_clip(tmp_path, "long", 2), "en") == "long"
+    assert backend.single_calls == ["long"]
+    assert backend.batches == []
+
+
+class ShortBatchBackend(RecordingBatchBackend):
+    def transcribe_many(
+        self, audio_paths: list[Path], language: str
+    ) -> list[list[TranscriptSegment]]:
+        return super().transcribe_many(audio_paths, language)[:1]
+
+
+def test_followers_fail_instead_of_hanging_when_the_batch_breaks(tmp_path: Path) -> None:
+    transcriber = MicroBatchingTranscriber(
+        ShortBatchBackend(), window_seconds=5.0, max_files=2, max_seconds=10
+    )
+    clips = [_clip(tmp_path, f"clip{index}", 2) for index in range(2)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(transcriber.transcribe, path, "en") for path in clips]
+        outcomes = [future.exception(timeout=10) for future in futures]
+
+    assert all(isinstance(outcome, RuntimeError | ValueError) for outcome in outcomes)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+from app.application.chunked_synthesis import ChunkedVoiceSynthesizer, split_sentences
+
+FRAME_RATE = 1000
+
+
+class ToneBackend:
+    """Writes one frame of audio per character so chunk lengths are predictable."""
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def synthesize(self, text: str, speaker_wav: Path, language: str, output_path: Path) -> Path:
+        self.texts.append(text)
+        with wave.open(str(output_path), "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(FRAME_RATE)
+            writer.writeframes(b"\x01\x00" * len(text))
+        return output_path
+
+    def warm_up(self) -> None:
+        return None
+
+
+def test_split_sentences_packs_sentences_up_to_limit() -> None:
+    text = "One two. Three four five! Six? " + "word " * 12
+    chunks = split_sentences(text, max_chars=20)
+
+    assert chunks == ["One two.", "Three four five!", "Six?"] + ["word word word word"] * 3
+
+
+def test_chunked_synthesizer_reports_chunks_in_order_and_joins_them(tmp_path: Path) -> None:
+    backend = ToneBackend()
+    synthesizer = ChunkedVoiceSynthesizer(backend=backend, max_chars=12, parallelism=3, gap_ms=100)
+    reported: list[tuple[int, int]] = []
+
+    output = synthesizer.synthesize(
+        text="First part. Second part. Third part.",
+        speaker_wav=tmp_path / "speaker.wav",
+        language="en",
+        output_path=tmp_path / "summary.wav",
+        chunk_dir=tmp_path / "chunks",
+        on_chunk=lambda index, total, _: reported.append((index, total)),
+    )
+
+    assert reported == [(0, 3), (1, 3), (2, 3)]
+    assert not (tmp_path / "chunks").exists()
+    with wave.open(str(output), "rb") as reader:
+        text_frames = sum(len(text) for text in backend.texts)
+        assert reader.getnframes() == text_frames + 2 * (FRAME_RATE // 10)
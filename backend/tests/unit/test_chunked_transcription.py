@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+import wave
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+from app.application.chunked_transcription import ChunkedTranscriber, plan_chunks
+from app.application.ports import SegmentCallback
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import PCM_SAMPLE_RATE, write_pcm_wav
+
+
+class WordPerSecondTranscriber:
+    """Fake backend that 'hears' one word per second of audio, named by absolute second.
+
+    The first sample of each second holds that second's index in the full recording.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = Lock()
+
+    def transcribe(
+        self, audio_path: Path, language: str, on_segment: SegmentCallback | None = None
+    ) -> str:
+        with self._lock:
+            self.calls += 1
+        with wave.open(str(audio_path), "rb") as reader:
+            seconds = reader.getnframes() // reader.getframerate()
+            first_second = int(np.frombuffer(reader.readframes(1), dtype="<i2")[0])
+        words = []
+        for second in range(seconds):
+            text = f"w{first_second + second}"
+            words.append(text)
+            if on_segment is not None:
+                on_segment(TranscriptSegment(start=second, end=second + 1, text=text), 0.0)
+        return " ".join(words)
+
+    def warm_up(self) -> None:
+        pass
+
+
+def test_plan_chunks_overlaps_neighbours_and_partitions_ownership() -> None:
+    chunks = plan_chunks(duration=30.0, cuts=[10.0, 20.0], overlap_seconds=2.0)
+
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [
+        (0.0, 12.0),
+        (8.0, 22.0),
+        (18.0, 30.0),
+    ]
+    assert [(chunk.keep_from, chunk.keep_until) for chunk in chunks] == [
+        (0.0, 10.0),
+        (10.0, 20.0),
+        (20.0, math.inf),
+    ]
+
+
+def test_chunked_transcriber_stitches_chunks_in_order_without_duplicates(tmp_path: Path) -> None:
+    total_seconds = 30
+    samples = np.zeros(total_seconds * PCM_SAMPLE_RATE, dtype=np.int16)
+    samples[::PCM_SAMPLE_RATE] = np.arange(total_seconds, dtype=np.int16)
+    audio = write_pcm_wav(tmp_path / "audio.wav", samples)
+    backend = WordPerSecondTranscriber()
+    transcriber = ChunkedTranscriber(backend, chunk_seconds=10, overlap_seconds=2, parallelism=3)
+    received: list[tuple[TranscriptSegment, float]] = []
+
+    text = transcriber.transcribe(
+        audio, "en", on_segment=lambda segment, progress: received.append((segment, progress))
+    )
+
+    assert backend.calls == 3
+    assert text == " ".join(f"w{second}" for second in range(total_seconds))
+    assert [segment.start for segment, _ in received] == [float(s) for s in range(total_seconds)]
+    assert received[-1][1] == 100.0
+    assert not list(tmp_path.glob(".audio_*"))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from app.core.config import Settings
+from app.domain.models import TranscriptSegment
+from app.infrastructure.cache.disk_cache import DiskCache
+from app.infrastructure.cache.summary_cache import SummaryCache
+from app.infrastructure.cache.transcript_cache import TranscriptCache
+
+KEY_A, KEY_B, KEY_C = "a" * 64, "b" * 64, "c" * 64
+
+
+def test_disk_cache_counts_hits_and_misses(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=1024)
+
+    assert cache.get(KEY_A) is None
+    cache.put(KEY_A, b"payload")
+
+    assert cache.get(KEY_A) == b"payload"
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=20)
+    cache.put(KEY_A, b"a" * 10)
+    cache.put(KEY_B, b"b" * 10)
+    past = time.time() - 60
+    os.utime(tmp_path / f"{KEY_A}.bin", times=(past, past))
+    os.utime(tmp_path / f"{KEY_B}.bin", times=(past - 60, past))
+
+    cache.put(KEY_C, b"c" * 10)
+
+    assert cache.get(KEY_B) is None
+    assert cache.get(KEY_A) is not None
+    assert cache.stats.evictions == 1
+
+
+def test_disk_cache_expires_entries_after_ttl(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=1024, ttl_seconds=30)
+    cache.put(KEY_A, b"stale")
+    past = time.time() - 60
+    os.utime(tmp_path / f"{KEY_A}.bin", times=(past, past))
+
+    assert cache.get(KEY_A) is None
+
+
+def test_disk_cache_rejects_path_like_keys(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        DiskCache(tmp_path, max_bytes=1).get("../escape")
+
+
+def test_transcript_cache_is_keyed_by_whisper_settings(tmp_path: Path) -> None:
+    small = TranscriptCache(Settings(CACHE_DIR=tmp_path, WHISPER_MODEL_SIZE="small"))
+    medium = TranscriptCache(Settings(CACHE_DIR=tmp_path, WHISPER_MODEL_SIZE="medium"))
+    segments = [TranscriptSegment(start=0, end=1.5, text="hello")]
+
+    small.put("f" * 64, "en", "hello", segments)
+
+    cached = small.get("f" * 64, "en")
+    assert cached is not None
+    assert cached.segments == segments
+    assert small.get("f" * 64, "de") is None
+    assert medium.get("f" * 64, "en") is None
+
+
+def test_transcript_cache_separates_batched_transcripts(tmp_path: Path) -> None:
+    single = TranscriptCache(Settings(CACHE_DIR=tmp_path))
+    batched = TranscriptCache(Settings(CACHE_DIR=tmp_path, TRANSCRIBE_BATCH_WINDOW_MS=50))
+    segments = [TranscriptSegment(start=0, end=1.5, text="hello")]
+
+    batched.put("f" * 64, "en", "hello", segments)
+
+    assert single.get("f" * 64, "en") is None
+    assert batched.get("f" * 64, "en") is not None
+
+
+def test_summary_cache_round_trips_text(tmp_path: Path) -> None:
+    cache = SummaryCache(Settings(CACHE_DIR=tmp_path))
+
+    cache.put(KEY_A, "Résumé of the talk.")
+
+    assert cache.get(KEY_A) == "Résumé of the talk."
+    assert cache.get(KEY_B) is None
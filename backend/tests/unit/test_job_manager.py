@@ -5,8 +5,9 @@ from uuid import UUID
 
 import pytest
 from app.domain.enums import Genre, JobStatus
-from app.domain.models import JobPreferences
+from app.domain.models import JobPreferences, StageTiming, TranscriptSegment
 from app.infrastructure.jobs.manager import JobManager, JobNotFoundError
+from pydantic import ValidationError
 
 
 def test_job_manager_lifecycle(tmp_path: Path) -> None:
@@ -42,3 +43,61 @@ def test_job_manager_raises_for_unknown_id() -> None:
         manager.mark_failed(
             job_id=UUID("00000000-0000-0000-0000-000000000000"), error_message="boom"
         )
+
+
+def test_job_manager_tracks_partial_transcript(tmp_path: Path) -> None:
+    manager = JobManager()
+    preferences = JobPreferences(target_minutes=1, genre=Genre.NEWS)
+    job = manager.create_job(audio_input_path=tmp_path / "source.wav", preferences=preferences)
+    manager.mark_running(job.id)
+
+    manager.append_transcript_segment(job.id, TranscriptSegment(start=0, end=4, text="one"), 40)
+    manager.append_transcript_segment(job.id, TranscriptSegment(start=4, end=9, text="two"), 90)
+
+    partial = manager.get_job(job.id)
+    assert partial is not None
+    assert [segment.text for segment in partial.transcript_segments] == ["one", "two"]
+    assert partial.transcription_progress == 90
+
+    assert manager.mark_transcribed(job.id).transcription_progress == 100
+    resumed = manager.mark_running(job.id, keep_transcript=True)
+    assert (len(resumed.transcript_segments), resumed.transcription_progress) == (2, 100)
+    assert manager.mark_running(job.id).transcript_segments == ()
+
+
+def test_job_manager_returns_immutable_versioned_snapshots(tmp_path: Path) -> None:
+    manager = JobManager()
+    preferences = JobPreferences(target_minutes=1, genre=Genre.NEWS)
+    job = manager.create_job(audio_input_path=tmp_path / "source.wav", preferences=preferences)
+
+    assert manager.get_job(job.id) is job
+    with pytest.raises(ValidationError):
+        job.status = JobStatus.RUNNING
+
+    running = manager.mark_running(job.id)
+    assert (job.status, job.version) == (JobStatus.PENDING, 0)
+    assert (running.status, running.version) == (JobStatus.RUNNING, 1)
+    assert running.preferences is job.preferences
+
+
+def test_job_manager_records_stage_timings(tmp_path: Path) -> None:
+    manager = JobManager()
+    preferences = JobPreferences(target_minutes=1, genre=Genre.NEWS)
+    job = manager.create_job(audio_input_path=tmp_path / "source.wav", preferences=preferences)
+    assert job.queue_wait_seconds is None
+
+    running = manager.mark_running(job.id)
+    assert running.queue_wait_seconds is not None and running.queue_wait_seconds >= 0
+    manager.record_audio_duration(job.id, 120.0)
+    manager.record_stage_timing(
+        job.id, StageTiming(stage="transcribe", wall_seconds=3, cpu_seconds=2)
+    )
+    manager.record_stage_timing(
+        job.id, StageTiming(stage="summarize", wall_seconds=0.1, cpu_seconds=0, cached=True)
+    )
+    failed = manager.mark_failed(job.id, "boom")
+
+    assert [timing.stage for timing in failed.stage_timings] == ["transcribe", "summarize"]
+    assert failed.processing_seconds is not None and failed.real_time_factor is not None
+    assert failed.real_time_factor == pytest.approx(failed.processing_seconds / 120.0)
+    assert manager.mark_running(job.id).stage_timings == ()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from app.api.routes import jobs as job_routes
+from app.domain.enums import Genre
+from app.domain.models import JobPreferences
+from app.infrastructure.jobs.manager import JobManager
+from app.infrastructure.jobs.repository import SqliteJobRepository
+
+
+@pytest.mark.asyncio
+async def test_subscription_wakes_on_updates_from_worker_threads(tmp_path: Path) -> None:
+    manager = JobManager()
+    job = manager.create_job(
+        audio_input_path=tmp_path / "source.wav",
+        preferences=JobPreferences(target_minutes=1, genre=Genre.NEWS),
+    )
+
+    with manager.subscribe(job.id) as subscription:
+        assert not await subscription.wait(0.01)
+
+        await asyncio.to_thread(manager.mark_running, job.id)
+        await asyncio.to_thread(manager.record_synthesis_progress, job.id, 1, 2)
+        assert await subscription.wait(1.0)
+        # Both updates were coalesced into a single wake-up.
+        assert not await subscription.wait(0.01)
+
+        latest = manager.get_job(job.id)
+        assert latest is not None
+        assert latest.version == 2
+
+    manager.mark_failed(job.id, "boom")
+    assert not await subscription.wait(0.01)
+
+
+@pytest.mark.asyncio
+async def test_long_poll_sees_changes_written_by_another_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(job_routes, "JOB_STORE_POLL_SECONDS", 0.02)
+    database = tmp_path / "jobs.sqlite3"
+    api = JobManager(SqliteJobRepository(database, owner="api"))
+    worker = JobManager(SqliteJobRepository(database, owner="worker"))
+    job = api.create_job(
+        audio_input_path=tmp_path / "source.wav",
+        preferences=JobPreferences(target_minutes=1, genre=Genre.NEWS),
+    )
+
+    # The worker's notifier never reaches the API's subscribers, so only the
+    # store poll can end the wait early.
+    waiting = asyncio.create_task(job_routes._wait_for_version(api, job, job.version, 30))
+    await asyncio.sleep(0.05)
+    await asyncio.to_thread(worker.mark_running, job.id)
+
+    latest = await asyncio.wait_for(waiting, 5)
+    assert latest.version > job.version
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from app.domain.enums import Genre, JobStatus
+from app.domain.models import JobCursor, JobPreferences, TranscriptSegment
+from app.infrastructure.jobs.manager import JobManager
+from app.infrastructure.jobs.repository import SqliteJobRepository
+
+
+def _create(manager: JobManager, tmp_path: Path, name: str) -> str:
+    job = manager.create_job(
+        audio_input_path=tmp_path / name,
+        preferences=JobPreferences(target_minutes=2, genre=Genre.SOCIAL),
+    )
+    return str(job.id)
+
+
+def test_sqlite_job_store_survives_reopen_and_filters(tmp_path: Path) -> None:
+    database = tmp_path / "jobs.sqlite3"
+    repository = SqliteJobRepository(database)
+    manager = JobManager(repository)
+    first = manager.create_job(
+        audio_input_path=tmp_path / "a.wav",
+        preferences=JobPreferences(target_minutes=2, genre=Genre.SOCIAL),
+    )
+    second_id = _create(manager, tmp_path, "b.wav")
+    manager.mark_running(first.id)
+    manager.mark_failed(first.id, "boom")
+    repository.close()
+
+    reopened = JobManager(SqliteJobRepository(database))
+    restored = reopened.get_job(first.id)
+    assert restored is not None
+    assert restored.status == JobStatus.FAILED
+    assert restored.error_message == "boom"
+
+    assert [str(job.id) for job in reopened.list_jobs()] == [second_id, str(first.id)]
+    assert [job.id for job in reopened.list_jobs(status=JobStatus.FAILED)] == [first.id]
+    assert [str(job.id) for job in reopened.list_jobs(limit=1, offset=1)] == [str(first.id)]
+
+
+def test_sqlite_store_appends_transcript_segments_as_rows(tmp_path: Path) -> None:
+    database = tmp_path / "jobs.sqlite3"
+    manager = JobManager(SqliteJobRepository(database))
+    job_id = UUID(_create(manager, tmp_path, "a.wav"))
+    manager.mark_running(job_id)
+    for index in range(3):
+        segment = TranscriptSegment(start=index, end=index + 1, text=f"part {index}")
+        manager.append_transcript_segment(job_id, segment, progress=(index + 1) * 30)
+    manager.mark_running(job_id, keep_transcript=True)
+
+    raw = sqlite3.connect(database)
+    assert raw.execute("SELECT COUNT(*) FROM job_segments").fetchone() == (3,)
+    assert "part 0" not in raw.execute("SELECT payload FROM jobs").fetchone()[0]
+    restored = JobManager(SqliteJobRepository(database)).get_job(job_id)
+    assert restored is not None
+    assert [segment.text for segment in restored.transcript_segments] == [
+        "part 0",
+        "part 1",
+        "part 2",
+    ]
+
+    manager.mark_transcribed(job_id, [TranscriptSegment(start=0, end=3, text="stitched")])
+    assert raw.execute("SELECT payload FROM job_segments").fetchall() == [
+        ('{"start":0.0,"end":3.0,"text":"stitched"}',)
+    ]
+
+
+def test_only_jobs_of_stopped_processes_are_claimed(tmp_path: Path) -> None:
+    database = tmp_path / "jobs.sqlite3"
+    lease = timedelta(seconds=60)
+    first = JobManager(SqliteJobRepository(database, owner="first"))
+    running_id = _create(first, tmp_path, "a.wav")
+    pending_id = _create(first, tmp_path, "b.wav")
+    finished_id = _create(first, tmp_path, "c.wav")
+    first.mark_running(UUID(running_id))
+    first.mark_running(UUID(finished_id))
+    first.mark_failed(UUID(finished_id), "boom")
+
+    repository = SqliteJobRepository(database, owner="second")
+    second = JobManager(repository)
+    assert second.claim_orphaned_jobs(lease) == []
+
+    # Once "first" stops heartbeating its unfinished jobs move to "second", once.
+    later = datetime.now(UTC) + timedelta(minutes=5)
+    claimed = repository.claim_orphaned((JobStatus.RUNNING, JobStatus.PENDING), later - lease)
+    assert [str(job.id) for job in claimed] == [running_id, pending_id]
+    assert second.claim_orphaned_jobs(lease) == []
+    assert first.claim_orphaned_jobs(lease) == []
+
+
+def test_prune_finished_removes_only_expired_finished_jobs(tmp_path: Path) -> None:
+    repository = SqliteJobRepository(tmp_path / "jobs.sqlite3")
+    manager = JobManager(repository)
+    finished = manager.create_job(
+        audio_input_path=tmp_path / "old.wav",
+        preferences=JobPreferences(target_minutes=2, genre=Genre.SOCIAL),
+    )
+    manager.mark_failed(finished.id, "boom")
+    pending_id = _create(manager, tmp_path, "pending.wav")
+
+    assert manager.prune_finished(timedelta(hours=1)) == []
+
+    stored = manager.get_job(finished.id)
+    assert stored is not None
+    aged = stored.model_copy(update={"updated_at": datetime.now(UTC) - timedelta(hours=2)})
+    repository.save(aged)
+    assert [job.id for job in manager.prune_finished(timedelta(hours=1))] == [finished.id]
+    assert [str(job.id) for job in manager.list_jobs()] == [pending_id]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_job_summaries_page_with_cursor_and_filters(tmp_path: Path, backend: str) -> None:
+    manager = JobManager(
+        SqliteJobRepository(tmp_path / "jobs.sqlite3") if backend == "sqlite" else None
+    )
+    created = [
+        manager.create_job(
+            audio_input_path=tmp_path / f"{index}.wav",
+            preferences=JobPreferences(
+                target_minutes=2, genre=Genre.NEWS if index % 2 else Genre.SOCIAL
+            ),
+        )
+        for index in range(5)
+    ]
+    manager.mark_completed(
+        created[1].id,
+        transcript_text="long transcript",
+        summary_text="summary",
+        output_audio_path=tmp_path / "out.wav",
+        reference_clip_path=tmp_path / "ref.wav",
+    )
+
+    first, cursor = manager.list_job_summaries(limit=2)
+    assert [job.id for job in first] == [created[4].id, created[3].id]
+    assert cursor is not None
+    second, cursor = manager.list_job_summaries(limit=2, after=JobCursor.decode(cursor.encode()))
+    assert [job.id for job in second] == [created[2].id, created[1].id]
+    assert cursor is not None
+    last, cursor = manager.list_job_summaries(limit=2, after=cursor)
+    assert [job.id for job in last] == [created[0].id]
+    assert cursor is None
+
+    news, _ = manager.list_job_summaries(limit=10, genre=Genre.NEWS)
+    assert [job.id for job in news] == [created[3].id, created[1].id]
+    done, _ = manager.list_job_summaries(limit=10, status=JobStatus.COMPLETED)
+    assert [job.id for job in done] == [created[1].id]
+    assert "summary_text" not in done[0].model_dump()
+
+
+def test_job_cursor_rejects_garbage() -> None:
+    with pytest.raises(ValueError, match="Invalid job cursor"):
+        JobCursor.decode("not-a-cursor")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from threading import Event
+from uuid import UUID, uuid4
+
+import pytest
+from app.infrastructure.jobs.scheduler import JobQueueFullError, JobScheduler
+
+
+def _blocking_handler(started: Event, release: Event, processed: list[UUID]) -> JobScheduler:
+    def handler(job_id: UUID) -> None:
+        started.set()
+        release.wait(timeout=5)
+        processed.append(job_id)
+
+    return JobScheduler(handler=handler, workers=1, max_pending=2)
+
+
+def test_job_scheduler_runs_jobs_and_reports_queue_position() -> None:
+    started, release = Event(), Event()
+    processed: list[UUID] = []
+    scheduler = _blocking_handler(started, release, processed)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    scheduler.submit(first)
+    assert started.wait(timeout=5)
+    assert scheduler.submit(second) == 1
+    assert scheduler.submit(third) == 2
+
+    assert scheduler.position(first) is None
+    position = scheduler.position(third)
+    assert position is not None
+    assert position.position == 2
+    assert position.estimated_start_seconds is None
+
+    release.set()
+    scheduler.shutdown()
+    assert processed[0] == first
+
+
+def test_job_scheduler_rejects_when_queue_is_full() -> None:
+    started, release = Event(), Event()
+    scheduler = _blocking_handler(started, release, [])
+
+    scheduler.submit(uuid4())
+    assert started.wait(timeout=5)
+    scheduler.submit(uuid4())
+    scheduler.submit(uuid4())
+
+    assert scheduler.is_full
+    with pytest.raises(JobQueueFullError):
+        scheduler.submit(uuid4())
+
+    release.set()
+    scheduler.shutdown()
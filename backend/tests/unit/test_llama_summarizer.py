@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from app.core.config import Settings
+from app.domain.enums import Genre
+from app.domain.models import JobPreferences
+from app.infrastructure.llm.llama_summarizer import LlamaSummarizationService, estimate_tokens
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field, PrivateAttr
+
+
+class RecordingChatModel(BaseChatModel):
+    prompts: list[str] = Field(default_factory=list)
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        prompt = str(messages[-1].content)
+        with self._lock:
+            self.prompts.append(prompt)
+        reply = "Final summary." if "Partial summaries:" in prompt else "Part summary."
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+class VerboseChatModel(RecordingChatModel):
+    """Answers every prompt with the same long text, ignoring any word limit."""
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        with self._lock:
+            self.prompts.append(str(messages[-1].content))
+        reply = "This part covers many markets in detail. " * 40
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+def _service(tmp_path: Path, model: RecordingChatModel) -> LlamaSummarizationService:
+    settings = Settings(
+        UPLOADS_DIR=tmp_path,
+        OUTPUTS_DIR=tmp_path,
+        SUMMARY_CHUNK_TOKENS=256,
+        SUMMARY_CHUNK_OVERLAP_TOKENS=0,
+        SUMMARY_MAX_CONCURRENCY=3,
+    )
+    service = LlamaSummarizationService(settings)
+    service._llm = model
+    return service
+
+
+def test_short_transcript_uses_single_prompt(tmp_path: Path) -> None:
+    model = RecordingChatModel()
+    service = _service(tmp_path, model)
+
+    summary = service.summarize("A short talk.", JobPreferences(target_minutes=1, genre=Genre.NEWS))
+
+    assert summary == "Part summary."
+    assert len(model.prompts) == 1
+
+
+def test_long_transcript_is_summarized_map_reduce(tmp_path: Path) -> None:
+    model = RecordingChatModel()
+    service = _service(tmp_path, model)
+    transcript = " ".join(f"Sentence number {index} talks about markets." for index in range(400))
+
+    summary = service.summarize(transcript, JobPreferences(target_minutes=2, genre=Genre.GENERAL))
+
+    map_prompts = [prompt for prompt in model.prompts if "Transcript part:" in prompt]
+    assert summary == "Final summary."
+    assert len(map_prompts) > 1
+    assert model.prompts[-1].count("Part summary.") == len(map_prompts)
+    assert "around 290 words" in model.prompts[-1]
+
+
+def test_map_reduce_stops_collapsing_when_summaries_do_not_shrink(tmp_path: Path) -> None:
+    model = VerboseChatModel()
+    service = _service(tmp_path, model)
+    transcript = " ".join(f"Sentence number {index} talks about markets." for index in range(400))
+
+    summary = service.summarize(transcript, JobPreferences(target_minutes=2, genre=Genre.GENERAL))
+
+    assert summary.startswith("This part covers")
+    assert "Partial summaries:" in model.prompts[-1]
+    assert len(model.prompts) < 100
+
+
+def test_cache_key_tracks_prompt_inputs_and_model(tmp_path: Path) -> None:
+    service = _service(tmp_path, RecordingChatModel())
+    other_model = LlamaSummarizationService(
+        Settings(UPLOADS_DIR=tmp_path, OUTPUTS_DIR=tmp_path, OLLAMA_MODEL="llama3.1")
+    )
+    news = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+
+    key = service.cache_key("Same transcript.", news)
+
+    assert key == service.cache_key("Same transcript.", news)
+    assert key != service.cache_key(
+        "Same transcript.", news.model_copy(update={"genre": Genre.SOCIAL})
+    )
+    assert key != service.cache_key(
+        "Same transcript.", JobPreferences(target_minutes=3, genre=Genre.NEWS)
+    )
+    assert key != other_model.cache_key("Same transcript.", news)
+
+
+def test_ollama_context_fits_a_full_chunk_and_the_longest_summary(tmp_path: Path) -> None:
+    settings = Settings(
+        UPLOADS_DIR=tmp_path,
+        OUTPUTS_DIR=tmp_path,
+        SUMMARY_CHUNK_TOKENS=6000,
+        MAX_TARGET_MINUTES=20,
+    )
+    service = LlamaSummarizationService(settings)
+    longest_summary = " ".join(["word"] * 20 * 145)
+
+    num_ctx = getattr(service._llm, "num_ctx", None)
+
+    assert num_ctx is not None
+    assert num_ctx >= 6000 + estimate_tokens(longest_summary)
+    assert num_ctx % 1024 == 0
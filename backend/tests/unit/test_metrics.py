@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from app.domain.models import StageTiming
+from app.infrastructure.metrics.prometheus import observe_stage
+from prometheus_client import REGISTRY, generate_latest
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_stage_records_duration_and_cache_result() -> None:
+    hits = {"stage": "metrics_test", "result": "hit"}
+    count = {"stage": "metrics_test", "cached": "true"}
+    before_hits = _sample("voice_summarizer_cache_lookups_total", hits)
+    before_count = _sample("voice_summarizer_stage_seconds_count", count)
+
+    observe_stage(
+        StageTiming(stage="metrics_test", wall_seconds=0.2, cpu_seconds=0.1, cached=True),
+        cacheable=True,
+    )
+
+    assert _sample("voice_summarizer_cache_lookups_total", hits) == before_hits + 1
+    assert _sample("voice_summarizer_stage_seconds_count", count) == before_count + 1
+    assert b"voice_summarizer_stage_cpu_seconds_bucket" in generate_latest()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from app.core.config import Settings
+from app.infrastructure.workers.model_pool import ModelWorkerError, ModelWorkerPool
+
+
+class EchoService:
+    def __init__(self, settings: Settings) -> None:
+        self._prefix = settings.app_name
+
+    def echo(self, path: Path) -> str:
+        return f"{self._prefix}:{path.name}:{os.getpid()}"
+
+    def fail(self) -> None:
+        raise ValueError("model exploded")
+
+    def hang(self) -> None:
+        time.sleep(60)
+
+    def crash(self) -> None:
+        os._exit(3)
+
+    def chatter(self, on_tick: Callable[[], None], seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            on_tick()
+            time.sleep(0.01)
+
+
+def _pool(tmp_path: Path, processes: int = 1, call_timeout: float | None = None) -> ModelWorkerPool:
+    return ModelWorkerPool(
+        name="echo",
+        factory=EchoService,
+        settings=Settings(APP_NAME="echo", UPLOADS_DIR=tmp_path, OUTPUTS_DIR=tmp_path),
+        processes=processes,
+        call_timeout=call_timeout,
+    )
+
+
+def test_model_worker_pool_runs_calls_in_a_separate_process(tmp_path: Path) -> None:
+    pool = _pool(tmp_path)
+    try:
+        prefix, name, pid = str(pool.call("echo", path=tmp_path / "clip.wav")).split(":")
+        assert (prefix, name) == ("echo", "clip.wav")
+        assert int(pid) != os.getpid()
+
+        with pytest.raises(ModelWorkerError, match="model exploded"):
+            pool.call("fail")
+    finally:
+        pool.shutdown()
+
+
+def test_hung_call_times_out_and_its_worker_is_replaced(tmp_path: Path) -> None:
+    pool = _pool(tmp_path, call_timeout=2)
+    try:
+        pool.call("echo", path=tmp_path / "warm.wav")
+        with pytest.raises(ModelWorkerError, match="timed out"):
+            pool.call("hang")
+
+        assert str(pool.call("echo", path=tmp_path / "clip.wav")).startswith("echo:clip.wav")
+    finally:
+        pool.shutdown()
+
+
+def test_dead_worker_is_detected_while_others_stream_events(tmp_path: Path) -> None:
+    pool = _pool(tmp_path, processes=2)
+    ticks: list[None] = []
+    try:
+        pool.broadcast("echo", path=tmp_path / "warm.wav")
+        chatter = pool.submit(
+            "chatter", on_event=("on_tick", lambda: ticks.append(None)), seconds=30
+        )
+        started = time.monotonic()
+        while not ticks and time.monotonic() - started < 10:
+            time.sleep(0.05)
+        assert ticks
+
+        with pytest.raises(ModelWorkerError, match="exited with code 3"):
+            pool.call("crash")
+        assert time.monotonic() - started < 15
+        assert not chatter.done()
+    finally:
+        pool.shutdown()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+from typing import cast
+
+import pytest
+from app.application.orchestrator import JobOrchestrator
+from app.application.pipeline.graph import SummarizationPipeline
+from app.application.pipeline.nodes import PipelineNodes
+from app.application.pipeline.state import PipelineState
+from app.core.config import Settings
+from app.domain.enums import Genre, JobStatus
+from app.domain.models import JobPreferences
+from app.infrastructure.jobs.manager import JobManager, JobStateError
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
+from app.infrastructure.storage.file_store import FileStorageService
+
+STAGES = ("ingest_audio", "transcribe", "summarize", "prepare_reference_clip", "synthesize")
+
+
+class FailingPipeline:
+    def run(self, state: PipelineState) -> PipelineState:
+        raise RuntimeError("CUDA out of memory")
+
+
+class CompletingPipeline:
+    def run(self, state: PipelineState) -> PipelineState:
+        output = state["audio_input_path"].with_name("summary.wav")
+        return state | {
+            "transcript_text": "hello",
+            "summary_text": "hi",
+            "output_audio_path": output,
+            "reference_clip_path": output,
+        }
+
+
+def _orchestrator(
+    tmp_path: Path, pipeline: object | None = None
+) -> tuple[JobOrchestrator, JobManager, StageCheckpointStore]:
+    settings = Settings.model_validate(
+        {"UPLOADS_DIR": tmp_path / "uploads", "OUTPUTS_DIR": tmp_path / "outputs"}
+    )
+    jobs = JobManager()
+    checkpoints = StageCheckpointStore(settings.outputs_dir)
+    orchestrator = JobOrchestrator(
+        pipeline=cast(SummarizationPipeline, pipeline or FailingPipeline()),
+        storage=FileStorageService(settings),
+        job_manager=jobs,
+        checkpoints=checkpoints,
+    )
+    return orchestrator, jobs, checkpoints
+
+
+def test_retry_requeues_failed_job_and_keeps_checkpoints(tmp_path: Path) -> None:
+    orchestrator, jobs, checkpoints = _orchestrator(tmp_path)
+    preferences = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+    job = jobs.create_job(audio_input_path=tmp_path / "in.wav", preferences=preferences)
+    for stage in STAGES[:-1]:
+        checkpoints.save(job.id, stage, {})
+
+    with pytest.raises(JobStateError):
+        orchestrator.retry(job.id)
+    orchestrator.process_job(job.id)
+    retried = orchestrator.retry(job.id)
+
+    assert (retried.status, retried.error_message) == (JobStatus.PENDING, None)
+    assert checkpoints.completed_stages(job.id) == set(STAGES[:-1])
+
+
+def test_resynthesize_invalidates_summary_only_when_preferences_change(tmp_path: Path) -> None:
+    orchestrator, jobs, checkpoints = _orchestrator(tmp_path)
+    preferences = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+    job = jobs.create_job(audio_input_path=tmp_path / "in.wav", preferences=preferences)
+    jobs.mark_failed(job.id, "boom")
+    for stage in STAGES:
+        checkpoints.save(job.id, stage, {})
+
+    orchestrator.resynthesize(job.id, preferences)
+    assert checkpoints.completed_stages(job.id) == set(STAGES) - {"synthesize"}
+
+    jobs.mark_failed(job.id, "boom")
+    shorter = JobPreferences(target_minutes=1, genre=Genre.NEWS)
+    requeued = orchestrator.resynthesize(job.id, shorter)
+
+    assert requeued.preferences == shorter
+    assert checkpoints.completed_stages(job.id) == {
+        "ingest_audio",
+        "transcribe",
+        "prepare_reference_clip",
+    }
+
+
+def test_prune_finished_removes_files_and_checkpoints_of_pruned_jobs(tmp_path: Path) -> None:
+    orchestrator, jobs, checkpoints = _orchestrator(tmp_path)
+    preferences = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+    finished = jobs.create_job(audio_input_path=tmp_path / "old.mp3", preferences=preferences)
+    pending = jobs.create_job(audio_input_path=tmp_path / "new.mp3", preferences=preferences)
+    jobs.mark_failed(finished.id, "boom")
+    outputs = tmp_path / "outputs"
+    (outputs / f"{finished.id}_chunks").mkdir(parents=True)
+    leftovers = [
+        tmp_path / "old.mp3",
+        tmp_path / "old.pcm16k.wav",
+        outputs / f"{finished.id}.wav",
+        outputs / f"{finished.id}.mp3",
+        outputs / f"{finished.id}.opus",
+        outputs / f"{finished.id}_reference.wav",
+        outputs / f"{finished.id}.txt",
+        outputs / f"{finished.id}_chunks" / "chunk_0000.wav",
+    ]
+    for path in [*leftovers, tmp_path / "new.mp3"]:
+        path.write_bytes(b"RIFF")
+    for job in (finished, pending):
+        checkpoints.save(job.id, "transcribe", {"transcript_text": "hello"})
+
+    assert orchestrator.prune_finished(timedelta(hours=-1)) == 1
+
+    assert jobs.get_job(finished.id) is None
+    assert not any(path.exists() for path in leftovers)
+    assert not (outputs / f"{finished.id}_chunks").exists()
+    assert not (outputs / f"{finished.id}_checkpoints").exists()
+    assert (tmp_path / "new.mp3").exists()
+    assert checkpoints.completed_stages(pending.id) == {"transcribe"}
+
+
+@pytest.mark.parametrize(
+    ("pipeline", "status"),
+    [(FailingPipeline(), JobStatus.FAILED), (CompletingPipeline(), JobStatus.COMPLETED)],
+)
+def test_pcm_decode_is_kept_only_for_failed_jobs(
+    tmp_path: Path, pipeline: object, status: JobStatus
+) -> None:
+    orchestrator, jobs, _ = _orchestrator(tmp_path, pipeline)
+    preferences = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+    upload, decode = tmp_path / "in.mp3", tmp_path / "in.pcm16k.wav"
+    job = jobs.create_job(audio_input_path=upload, preferences=preferences)
+    upload.write_bytes(b"ID3")
+    decode.write_bytes(b"RIFF")
+
+    orchestrator.process_job(job.id)
+
+    finished = jobs.get_job(job.id)
+    assert finished is not None and finished.status == status
+    assert upload.exists()
+    assert decode.exists() == (status == JobStatus.FAILED)
+
+
+class RecordingNodes:
+    def __init__(self, tmp_path: Path) -> None:
+        self.calls: list[str] = []
+        self._outputs = tmp_path / "outputs"
+
+    def ingest_audio(self, state: PipelineState) -> dict[str, object]:
+        self.calls.append("ingest_audio")
+        pcm = FileStorageService.build_pcm_audio_path(state["audio_input_path"])
+        pcm.write_bytes(b"RIFF")
+        return {"pcm_audio_path": pcm}
+
+    def transcribe(self, state: PipelineState) -> dict[str, object]:
+        self.calls.append("transcribe")
+        assert state["pcm_audio_path"].exists()
+        return {"transcript_text": "hello"}
+
+    def summarize(self, state: PipelineState) -> dict[str, object]:
+        self.calls.append("summarize")
+        return {
+            "summary_text": f"{state['transcript_text']} in {state['preferences'].target_minutes}"
+        }
+
+    def prepare_reference_clip(self, state: PipelineState) -> dict[str, object]:
+        self.calls.append("prepare_reference_clip")
+        assert state["pcm_audio_path"].exists()
+        clip = self._outputs / f"{state['job_id']}_reference.wav"
+        clip.write_bytes(b"RIFF")
+        return {"reference_clip_path": clip}
+
+    def synthesize(self, state: PipelineState) -> dict[str, object]:
+        self.calls.append("synthesize")
+        output = self._outputs / f"{state['job_id']}.wav"
+        output.write_bytes(b"RIFF")
+        return {"output_audio_path": output}
+
+
+def test_resynthesize_reruns_only_invalidated_stages_without_decoding(tmp_path: Path) -> None:
+    nodes = RecordingNodes(tmp_path)
+    _, jobs, checkpoints = _orchestrator(tmp_path)
+    (tmp_path / "outputs").mkdir()
+    orchestrator = JobOrchestrator(
+        pipeline=SummarizationPipeline(cast(PipelineNodes, nodes), checkpoints=checkpoints),
+        storage=FileStorageService(
+            Settings.model_validate(
+                {"UPLOADS_DIR": tmp_path / "uploads", "OUTPUTS_DIR": tmp_path / "outputs"}
+            )
+        ),
+        job_manager=jobs,
+        checkpoints=checkpoints,
+    )
+    preferences = JobPreferences(target_minutes=2, genre=Genre.NEWS)
+    job = jobs.create_job(audio_input_path=tmp_path / "in.mp3", preferences=preferences)
+    orchestrator.process_job(job.id)
+    assert set(nodes.calls) == set(STAGES)
+    assert not (tmp_path / "in.pcm16k.wav").exists()
+
+    nodes.calls.clear()
+    orchestrator.resynthesize(job.id, preferences.model_copy(update={"target_minutes": 1}))
+    orchestrator.process_job(job.id)
+
+    finished = jobs.get_job(job.id)
+    assert finished is not None
+    assert (finished.status, finished.summary_text) == (JobStatus.COMPLETED, "hello in 1")
+    assert nodes.calls == ["summarize", "synthesize"]
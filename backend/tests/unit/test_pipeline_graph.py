@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+from threading import Barrier
+from uuid import uuid4
+
+import pytest
+from app.application.pipeline.graph import PipelineStage, build_graph, checkpointed
+from app.application.pipeline.state import PipelineState
+from app.domain.enums import Genre
+from app.domain.models import JobPreferences
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
+
+
+def _state(tmp_path: Path) -> PipelineState:
+    return {
+        "job_id": uuid4(),
+        "audio_input_path": tmp_path / "audio.wav",
+        "preferences": JobPreferences(target_minutes=1, genre=Genre.GENERAL),
+    }
+
+
+def test_build_graph_runs_independent_stages_in_parallel(tmp_path: Path) -> None:
+    both_started = Barrier(2, timeout=5)
+
+    def transcribe(state: PipelineState) -> dict[str, object]:
+        both_started.wait()
+        return {"transcript_text": "words"}
+
+    def prepare_reference_clip(state: PipelineState) -> dict[str, object]:
+        both_started.wait()
+        return {"reference_clip_path": tmp_path / "clip.wav"}
+
+    def synthesize(state: PipelineState) -> dict[str, object]:
+        assert state["transcript_text"] == "words"
+        return {"output_audio_path": state["reference_clip_path"].with_suffix(".out")}
+
+    graph = build_graph(
+        (
+            PipelineStage("transcribe", transcribe),
+            PipelineStage("prepare_reference_clip", prepare_reference_clip),
+            PipelineStage(
+                "synthesize", synthesize, depends_on=("transcribe", "prepare_reference_clip")
+            ),
+        )
+    )
+
+    result = graph.invoke(_state(tmp_path))
+
+    assert result["output_audio_path"] == tmp_path / "clip.out"
+
+
+def test_build_graph_rejects_cycles_and_unknown_dependencies() -> None:
+    def noop(state: PipelineState) -> dict[str, object]:
+        return {}
+
+    with pytest.raises(ValueError, match="cycle"):
+        build_graph(
+            (
+                PipelineStage("a", noop, depends_on=("b",)),
+                PipelineStage("b", noop, depends_on=("a",)),
+            )
+        )
+    with pytest.raises(ValueError, match="unknown"):
+        build_graph((PipelineStage("a", noop, depends_on=("missing",)),))
+
+
+def test_checkpointed_stages_resume_after_last_completed_stage(tmp_path: Path) -> None:
+    calls: list[str] = []
+    fail_summary = True
+
+    def transcribe(state: PipelineState) -> dict[str, object]:
+        calls.append("transcribe")
+        return {"transcript_text": "words"}
+
+    def summarize(state: PipelineState) -> dict[str, object]:
+        calls.append("summarize")
+        if fail_summary:
+            raise RuntimeError("process died")
+        return {"summary_text": state["transcript_text"].upper()}
+
+    store = StageCheckpointStore(tmp_path)
+    graph = build_graph(
+        tuple(
+            checkpointed(stage, store)
+            for stage in (
+                PipelineStage("transcribe", transcribe),
+                PipelineStage("summarize", summarize, depends_on=("transcribe",)),
+            )
+        )
+    )
+    state = _state(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        graph.invoke(state)
+    fail_summary = False
+    result = graph.invoke(state)
+
+    assert result["summary_text"] == "WORDS"
+    assert calls == ["transcribe", "summarize", "summarize"]
+
+
+def test_stage_is_skipped_when_its_dependents_replay_checkpoints(tmp_path: Path) -> None:
+    decodes: list[Path] = []
+
+    def ingest_audio(state: PipelineState) -> dict[str, object]:
+        decodes.append(state["audio_input_path"])
+        pcm = tmp_path / "audio.pcm16k.wav"
+        pcm.write_bytes(b"RIFF")
+        return {"pcm_audio_path": pcm}
+
+    def transcribe(state: PipelineState) -> dict[str, object]:
+        return {"transcript_text": state["pcm_audio_path"].name}
+
+    store = StageCheckpointStore(tmp_path)
+    graph = build_graph(
+        (
+            checkpointed(PipelineStage("ingest_audio", ingest_audio), store, ["transcribe"]),
+            checkpointed(
+                PipelineStage("transcribe", transcribe, depends_on=("ingest_audio",)), store
+            ),
+        )
+    )
+    state = _state(tmp_path)
+    graph.invoke(state)
+    (tmp_path / "audio.pcm16k.wav").unlink()
+
+    result = graph.invoke(state)
+
+    assert result["transcript_text"] == "audio.pcm16k.wav"
+    assert len(decodes) == 1
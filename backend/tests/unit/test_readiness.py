@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from app.application.readiness import ModelReadiness
+from app.domain.enums import ReadinessStatus
+
+
+class CountingService:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self._fail = fail
+
+    def warm_up(self) -> None:
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("weights missing")
+
+
+def test_readiness_is_ready_immediately_without_preload() -> None:
+    readiness = ModelReadiness(services=(), preload=False)
+    assert readiness.status == ReadinessStatus.READY
+
+
+def test_readiness_warms_each_service_once() -> None:
+    service = CountingService()
+    readiness = ModelReadiness(services=(service,), preload=True)
+    assert readiness.status in {ReadinessStatus.WARMING}
+
+    readiness.warm_up()
+    readiness.warm_up()
+
+    assert readiness.status == ReadinessStatus.READY
+    assert service.calls == 1
+
+
+def test_readiness_reports_warm_up_failure() -> None:
+    readiness = ModelReadiness(services=(CountingService(fail=True),), preload=True)
+    readiness.warm_up()
+
+    assert readiness.status == ReadinessStatus.FAILED
+    assert readiness.error == "weights missing"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.core.config import Settings
+from app.infrastructure.cache.speaker_cache import SpeakerLatentCache
+
+
+def _settings(tmp_path: Path, model_name: str = "tts_models/multilingual/xtts") -> Settings:
+    return Settings(CACHE_DIR=tmp_path, SPEAKER_CACHE_ENTRIES=2, TTS_MODEL_NAME=model_name)
+
+
+def test_speaker_cache_key_depends_on_clip_content_and_model(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.wav", tmp_path / "second.wav"
+    first.write_bytes(b"voice-a")
+    second.write_bytes(b"voice-b")
+    cache = SpeakerLatentCache(_settings(tmp_path))
+    other_model = SpeakerLatentCache(_settings(tmp_path, "tts_models/en/other"))
+
+    assert cache.key(first) == cache.key(first)
+    assert cache.key(first) != cache.key(second)
+    assert cache.key(first) != other_model.key(first)
+
+
+def test_speaker_cache_keeps_most_recent_latents_in_memory(tmp_path: Path) -> None:
+    cache = SpeakerLatentCache(_settings(tmp_path))
+    keys = ["1" * 64, "2" * 64, "3" * 64]
+
+    cache._remember(keys[0], ("gpt-1", "spk-1"))
+    cache._remember(keys[1], ("gpt-2", "spk-2"))
+    assert cache.get(keys[0]) == ("gpt-1", "spk-1")
+    cache._remember(keys[2], ("gpt-3", "spk-3"))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == ("gpt-1", "spk-1")
+    assert cache.get(keys[2]) == ("gpt-3", "spk-3")
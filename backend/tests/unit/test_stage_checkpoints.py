@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import uuid4
+
+from app.infrastructure.storage.checkpoints import StageCheckpointStore
+
+
+def test_checkpoint_store_round_trips_text_and_paths(tmp_path: Path) -> None:
+    store = StageCheckpointStore(tmp_path)
+    job_id = uuid4()
+    clip = tmp_path / "clip.wav"
+    clip.write_bytes(b"RIFF")
+
+    store.save(job_id, "transcribe", {"transcript_text": "hello"})
+    store.save(job_id, "prepare_reference_clip", {"reference_clip_path": clip})
+
+    assert store.get(job_id, "transcribe") == {"transcript_text": "hello"}
+    assert store.get(job_id, "prepare_reference_clip") == {"reference_clip_path": clip}
+    assert store.get(job_id, "summarize") is None
+    assert store.completed_stages(job_id) == {"transcribe", "prepare_reference_clip"}
+
+
+def test_checkpoint_store_ignores_checkpoints_with_missing_files(tmp_path: Path) -> None:
+    store = StageCheckpointStore(tmp_path)
+    job_id = uuid4()
+    store.save(job_id, "synthesize", {"output_audio_path": tmp_path / "gone.wav"})
+
+    assert store.get(job_id, "synthesize") is None
+
+
+def test_checkpoint_store_discards_selected_or_all_stages(tmp_path: Path) -> None:
+    store = StageCheckpointStore(tmp_path)
+    job_id = uuid4()
+    for stage in ("transcribe", "summarize", "synthesize"):
+        store.save(job_id, stage, {f"{stage}_text": stage})
+
+    store.discard(job_id, ["summarize", "synthesize"])
+    assert store.completed_stages(job_id) == {"transcribe"}
+
+    store.discard(job_id)
+    assert store.completed_stages(job_id) == set()
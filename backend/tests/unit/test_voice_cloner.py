@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from app.core.config import Settings
+from app.infrastructure.speech.coqui_voice_cloner import CoquiVoiceCloningService
+
+
+class FakeXtts:
+    device = "cpu"
+    config = SimpleNamespace(
+        gpt_cond_len=30,
+        gpt_cond_chunk_len=4,
+        max_ref_len=30,
+        sound_norm_refs=False,
+        temperature=0.7,
+        length_penalty=1.0,
+        repetition_penalty=2.0,
+        top_k=50,
+        top_p=0.8,
+    )
+
+    def __init__(self) -> None:
+        self.reference_seconds: list[float] = []
+        self.texts: list[str] = []
+
+    def get_conditioning_latents(self, audio_path: list[str], **_: Any) -> tuple[str, str]:
+        with wave.open(audio_path[0], "rb") as reader:
+            self.reference_seconds.append(reader.getnframes() / reader.getframerate())
+        return "gpt", "speaker"
+
+    def inference(self, text: str, language: str, **_: Any) -> dict[str, list[float]]:
+        self.texts.append(text)
+        return {"wav": [0.0]}
+
+
+def test_warm_up_runs_one_short_synthesis(tmp_path: Path) -> None:
+    service = CoquiVoiceCloningService(Settings(CACHE_DIR=tmp_path))
+    xtts = FakeXtts()
+    saved: list[str] = []
+    service._model = SimpleNamespace(
+        synthesizer=SimpleNamespace(tts_model=xtts, save_wav=lambda wav, path: saved.append(path))
+    )
+
+    service.warm_up()
+
+    assert len(xtts.texts) == 1
+    assert xtts.reference_seconds and xtts.reference_seconds[0] > 1
+    assert len(saved) == 1
+    assert not service._speaker_cache._memory
+    assert not list(tmp_path.rglob("*.pt"))
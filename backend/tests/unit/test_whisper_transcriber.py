@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from app.core.config import Settings
+from app.domain.models import TranscriptSegment
+from app.infrastructure.audio.processing import PCM_SAMPLE_RATE, write_pcm_wav
+from app.infrastructure.speech.faster_whisper_transcriber import WhisperTranscriptionService
+
+
+class FakeWhisperModel:
+    def __init__(self) -> None:
+        self.options: dict[str, object] = {}
+
+    def transcribe(self, audio: object, language: str, **options: object) -> tuple[object, object]:
+        self.options = options
+        segments = [
+            SimpleNamespace(start=0.0, end=5.0, text=" Hello there. "),
+            SimpleNamespace(start=5.0, end=6.0, text="  "),
+            SimpleNamespace(start=6.0, end=20.0, text="General Kenobi."),
+        ]
+        return iter(segments), SimpleNamespace(duration=20.0)
+
+
+def test_transcribe_streams_segments_with_progress(tmp_path: Path) -> None:
+    service = WhisperTranscriptionService(Settings(UPLOADS_DIR=tmp_path, OUTPUTS_DIR=tmp_path))
+    service._model = FakeWhisperModel()
+    received: list[tuple[TranscriptSegment, float]] = []
+
+    transcript = service.transcribe(
+        tmp_path / "audio.wav",
+        language="en",
+        on_segment=lambda segment, progress: received.append((segment, progress)),
+    )
+
+    assert transcript == "Hello there. General Kenobi."
+    assert [(segment.start, segment.text, progress) for segment, progress in received] == [
+        (0.0, "Hello there.", 25.0),
+        (6.0, "General Kenobi.", 100.0),
+    ]
+
+
+def test_transcribe_passes_vad_settings(tmp_path: Path) -> None:
+    settings = Settings(
+        UPLOADS_DIR=tmp_path,
+        OUTPUTS_DIR=tmp_path,
+        WHISPER_VAD_THRESHOLD=0.6,
+        WHISPER_VAD_MIN_SILENCE_MS=700,
+    )
+    model = FakeWhisperModel()
+    service = WhisperTranscriptionService(settings)
+    service._model = model
+
+    service.transcribe(tmp_path / "audio.wav", language="en")
+
+    assert model.options == {
+        "vad_filter": True,
+        "vad_parameters": {
+            "threshold": 0.6,
+            "min_silence_duration_ms": 700,
+            "speech_pad_ms": 400,
+        },
+    }
+
+
+class FakeTokenizer:
+    def token_to_id(self, token: str) -> int:
+        return 50_000 + len(token)
+
+    def encode(self, text: str, add_special_tokens: bool = False) -> SimpleNamespace:
+        return SimpleNamespace(ids=[ord(text[-1])])
+
+
+class FakeFeatureExtractor:
+    sampling_rate = PCM_SAMPLE_RATE
+    chunk_length = 30
+
+    def __call__(self, audio: np.ndarray) -> np.ndarray:
+        return np.zeros((80, len(audio) // 160 + 1), dtype=np.float32)
+
+
+def _chunk_spans(
+    features: object, tokenizer: object, chunks: list[dict[str, float]], options: object
+) -> list[list[dict[str, object]]]:
+    """Stand-in for the decoder: one segment spanning each chunk it is handed."""
+
+    return [
+        [
+            {
+                "seek": 0,
+                "text": " speech ",
+                "tokens": [],
+                "start": chunk["offset"],
+                "end": chunk["offset"] + chunk["duration"],
+                "avg_logprob": 0.0,
+                "no_speech_prob": 0.0,
+                "compression_ratio": 1.0,
+            }
+        ]
+        for chunk in chunks
+    ]
+
+
+def test_transcribe_many_decodes_each_file_in_its_own_clips(tmp_path: Path) -> None:
+    faster_whisper = pytest.importorskip("faster_whisper")
+    model = SimpleNamespace(
+        feature_extractor=FakeFeatureExtractor(),
+        hf_tokenizer=FakeTokenizer(),
+        logger=logging.getLogger("faster_whisper"),
+        model=SimpleNamespace(is_multilingual=False, n_mels=80),
+    )
+    # The real pipeline cuts and maps the clips; only the decoder step is replaced.
+    pipeline = faster_whisper.BatchedInferencePipeline(model=model)
+    pipeline.forward = _chunk_spans
+    service = WhisperTranscriptionService(Settings(UPLOADS_DIR=tmp_path, OUTPUTS_DIR=tmp_path))
+    service._batched_pipeline = pipeline
+    lengths = {"long": 40, "short": 5, "shorter": 3}
+    paths = [
+        write_pcm_wav(tmp_path / f"{name}.wav", np.zeros(seconds * PCM_SAMPLE_RATE, np.int16))
+        for name, seconds in lengths.items()
+    ]
+
+    results = service.transcribe_many(paths, language="en")
+
+    assert [[(s.start, s.end) for s in segments] for segments in results] == [
+        [(0.0, 30.0), (30.0, 40.0)],
+        [(0.0, 5.0)],
+        [(0.0, 3.0)],
+    ]
@@ -3,11 +3,13 @@
 
   angular.module("voiceApp").controller("MainController", MainController);
 
-  MainController.$inject = ["ApiService", "$interval", "$scope"];
+  MainController.$inject = ["ApiService", "$scope"];
 
-  function MainController(ApiService, $interval, $scope) {
+  const LONG_POLL_SECONDS = 30;
+
+  function MainController(ApiService, $scope) {
     const vm = this;
-    let pollHandle = null;
+    let pollGeneration = 0;
 
     vm.form = {
       genre: "general",
@@ -23,6 +25,8 @@
 
     vm.onFileSelected = onFileSelected;
     vm.submit = submit;
+    vm.retry = retry;
+    vm.resynthesize = resynthesize;
 
     activate();
 
@@ -80,39 +84,73 @@
         });
     }
 
+    function retry() {
+      rerun(ApiService.retryJob(vm.job.job_id), "Retrying from the last completed step...");
+    }
+
+    function resynthesize() {
+      rerun(
+        ApiService.resynthesizeJob(vm.job.job_id, vm.form.genre, vm.form.targetMinutes),
+        "Regenerating the summary voice..."
+      );
+    }
+
+    function rerun(request, statusText) {
+      const jobId = vm.job.job_id;
+      vm.errorMessage = "";
+      vm.audioUrl = "";
+      vm.isSubmitting = true;
+      vm.statusText = statusText;
+
+      request
+        .then(function () {
+          startPolling(jobId);
+        })
+        .catch(function (error) {
+          vm.isSubmitting = false;
+          vm.errorMessage = extractErrorMessage(error) || "Could not restart the job.";
+        });
+    }
+
     function startPolling(jobId) {
       stopPolling();
-      pollHandle = $interval(function () {
-        ApiService.getJobStatus(jobId)
-          .then(function (response) {
-            vm.job = response.data;
-            vm.statusText = "Current status: " + response.data.status;
-
-            if (response.data.status === "completed") {
-              vm.isSubmitting = false;
-              vm.audioUrl = ApiService.audioUrl(jobId);
-              stopPolling();
-            }
-
-            if (response.data.status === "failed") {
-              vm.isSubmitting = false;
-              vm.errorMessage = response.data.error_message || "The job failed.";
-              stopPolling();
-            }
-          })
-          .catch(function (error) {
+      pollStatus(jobId, -1, pollGeneration);
+    }
+
+    function pollStatus(jobId, sinceVersion, generation) {
+      ApiService.getJobStatus(jobId, sinceVersion, LONG_POLL_SECONDS)
+        .then(function (response) {
+          if (generation !== pollGeneration) {
+            return;
+          }
+          vm.job = response.data;
+          vm.statusText = "Current status: " + response.data.status;
+
+          if (response.data.status === "completed") {
             vm.isSubmitting = false;
-            vm.errorMessage = extractErrorMessage(error) || "Failed to fetch job status.";
-            stopPolling();
-          });
-      }, 3000);
+            vm.audioUrl = ApiService.audioUrl(jobId);
+            return;
+          }
+
+          if (response.data.status === "failed") {
+            vm.isSubmitting = false;
+            vm.errorMessage = response.data.error_message || "The job failed.";
+            return;
+          }
+
+          pollStatus(jobId, response.data.version, generation);
+        })
+        .catch(function (error) {
+          if (generation !== pollGeneration) {
+            return;
+          }
+          vm.isSubmitting = false;
+          vm.errorMessage = extractErrorMessage(error) || "Failed to fetch job status.";
+        });
     }
 
     function stopPolling() {
-      if (pollHandle) {
-        $interval.cancel(pollHandle);
-        pollHandle = null;
-      }
+      pollGeneration += 1;
     }
 
     function extractErrorMessage(error) {
@@ -24,8 +24,21 @@
       });
     };
 
-    this.getJobStatus = function getJobStatus(jobId) {
-      return $http.get(apiBaseUrl + "/jobs/" + jobId);
+    this.getJobStatus = function getJobStatus(jobId, sinceVersion, waitSeconds) {
+      return $http.get(apiBaseUrl + "/jobs/" + jobId, {
+        params: { since_version: sinceVersion, wait: waitSeconds },
+      });
+    };
+
+    this.retryJob = function retryJob(jobId) {
+      return $http.post(apiBaseUrl + "/jobs/" + jobId + "/retry");
+    };
+
+    this.resynthesizeJob = function resynthesizeJob(jobId, genre, targetMinutes) {
+      return $http.post(apiBaseUrl + "/jobs/" + jobId + "/resynthesize", {
+        genre: genre,
+        target_minutes: targetMinutes,
+      });
     };
 
     this.audioUrl = function audioUrl(jobId) {